@@ -22,13 +22,12 @@ with this program; if not, write to the Free Software Foundation, Inc.,
 
 # Standard library
 import datetime
-import json
 import smtplib
 import sys
 
 # DomoTricks libraries
 sys.path.append('..')
-from lib.sqlite import SqliteCmd
+from lib.sqlite import SqliteCmd, load_metadata, timestamp_to_ms
 import settings
 
 # Debug
@@ -56,7 +55,7 @@ Subject: {subject}
 
 {body}
 """
-    server_ssl = smtplib.SMTP_SSL(settings.SMTP_SERVER, 465)
+    server_ssl = smtplib.SMTP_SSL(settings.SMTP_SERVER, 465, timeout=30)
     server_ssl.ehlo()
     server_ssl.login(settings.GMAIL_USER, settings.GMAIL_PASSWORD)
     server_ssl.sendmail(sent_from, sent_to, email_text.encode())
@@ -72,7 +71,7 @@ def humidity_10(nickname, metadata):
     Send mail if humidity is below 10%
     """
     humidity = get_metadata_value(metadata, 'Humidity')
-    if humidity is not None and int(humidity) <= 10:
+    if humidity is not None and humidity <= 10:
         send_mail(
             settings.MAIL_RECIPIENTS,
             f'[DT] {nickname} humidity',
@@ -82,49 +81,36 @@ def report_temperature(nickname, _, hours=12):
     """
     Send mail to report last hours temperatures
     """
-    conn = SqliteCmd(settings.DB_PATH)
+    conn = SqliteCmd(settings.DB_PATH, readonly=True)
     asset_key = conn.get_asset_key(nickname)
     if asset_key is None:
         return
     asset_key = asset_key[0]
-    asset_data = conn.get_asset(asset_key)
-    if asset_data is None:
-        return
-    max_temperature = -256
-    min_temperature = 256
     now = datetime.datetime.now()
     limit_time = now - datetime.timedelta(hours=hours)
-    for i in range(len(asset_data)):
-        timestamp = datetime.datetime.strptime(asset_data[i][0], '%Y-%m-%d %H:%M:%S')
-        if timestamp < limit_time:
-            break
-        temperature = get_metadata_value(
-            json.loads(asset_data[i][3].replace("'", '"')),
-            'Temperature')
-        if temperature is None:
-            continue
-        temperature = float('{:.2f}'.format(float(temperature)))
-        if temperature < min_temperature:
-            min_temperature = temperature
-        if temperature > max_temperature:
-            max_temperature = temperature
+    temperatures = [value for _, value in conn.get_asset_channel(
+        asset_key, 'temperature', timestamp_to_ms(limit_time))]
+    if not temperatures:
+        return
+    min_temperature = min(temperatures)
+    max_temperature = max(temperatures)
     send_mail(
         settings.MAIL_RECIPIENTS,
-        f'[DT] {nickname} {min_temperature}°C to {max_temperature}°C',
+        f'[DT] {nickname} {min_temperature:.1f}°C to {max_temperature:.1f}°C',
         f'''Report of the past {hours}h temperatures in {nickname}.
-Between {limit_time} and {now}, the temperature was between {min_temperature}°C and {max_temperature}°C''')
+Between {limit_time} and {now}, the temperature was between {min_temperature:.1f}°C and {max_temperature:.1f}°C''')
 
 def door_during_holidays(nickname, metadata):
     """
     Send mail if door open during holidays
     """
-    conn = SqliteCmd(settings.DB_PATH)
+    conn = SqliteCmd(settings.DB_PATH, readonly=True)
     is_door_open = get_metadata_value(metadata, 'Command') == 'On'
     # Holidays mode
     holidays_data = conn.get_asset(settings.HOLIDAY_ASSET_ID)
-    if holidays_data is None:
+    if not holidays_data:
         return
-    holidays_metadata = json.loads(holidays_data[0][3].replace("'", '"'))
+    holidays_metadata = load_metadata(holidays_data[0][3])
     is_holidays = get_metadata_value(holidays_metadata, 'Command') == 'On'
     if is_holidays and is_door_open:
         send_mail(
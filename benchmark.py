@@ -0,0 +1,220 @@
+#!/usr/bin/python3
+#-*- coding: utf-8 -*-
+"""
+DomoTricks: benchmark
+
+Copyright 2021-2023 Nicolas Béguier
+
+This program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along
+with this program; if not, write to the Free Software Foundation, Inc.,
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+__author__ = 'Nicolas Béguier'
+__copyright__ = 'Copyright 2021-2023, Nicolas Béguier'
+__license__ = 'GPL'
+__version__ = '1.0.3'
+__maintainer__ = 'Nicolas Béguier'
+__date__ = '$Date: 2021-12-20 15:00:00 +0100 (Tue, 1 Jun 2021) $'
+
+# Standard library
+from argparse import ArgumentParser
+from binascii import hexlify
+from contextlib import redirect_stdout
+import logging
+import os
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+# DomoTricks libraries
+import domotricks
+from lib.rfx_decode import PACKET_DECODERS, decode_battery, decode_power, decode_signal, \
+    decode_temperature, load_family
+from lib.rfx_utils import ByteToHex
+from lib.sqlite import AssetRegistry, LostAssets, SqliteCmd, SqliteWriter
+
+# Debug
+# from pdb import set_trace as st
+
+# One packet of each common sensor family
+PACKETS = [bytes.fromhex(packet) for packet in (
+    '0a520105d50300d72a0269',
+    '0b11000201c5a9da0a010f60',
+    '08500101aabb806469',
+    '0f5c01001234e6006400c8000a5a3269',
+    '115a0101aabb02000003e800000000123469',
+)]
+
+# ----------------------------------------------------------------------------
+# Hex-string helpers as they were before the integer decoders, kept as the
+# baseline of bench_helpers
+
+def legacy_byte_to_hex(byte):
+    """
+    Former ByteToHex, hexlify failing on an int byte
+    """
+    try:
+        return hexlify(byte).decode('utf-8')
+    except:
+        return '{0:#0{1}x}'.format(byte, 4).split('0x')[1]
+
+def legacy_decode_temperature(message_high, message_low):
+    """
+    Former decode_temperature, through hex strings
+    """
+    temp_high = legacy_byte_to_hex(message_high)
+    temp_low = legacy_byte_to_hex(message_low)
+    polarity_sign = '-' if int(temp_high, 16) & 0x80 else ''
+    temp_high = (int(temp_high, 16) & 0x7f) << 8
+    return polarity_sign + str((temp_high + int(temp_low, 16)) * 0.1)
+
+def legacy_decode_signal(message):
+    """
+    Former decode_signal, through a hex string
+    """
+    return int(legacy_byte_to_hex(message), 16) >> 4
+
+def legacy_decode_battery(message):
+    """
+    Former decode_battery, through a hex string
+    """
+    return int(legacy_byte_to_hex(message), 16) & 0xf
+
+def legacy_decode_power(message_1, message_2, message_3):
+    """
+    Former decode_power, through hex strings
+    """
+    power_1 = int(legacy_byte_to_hex(message_1), 16) << 16
+    power_2 = int(legacy_byte_to_hex(message_2), 16) << 8
+    power_3 = int(legacy_byte_to_hex(message_3), 16)
+    return str(power_1 + power_2 + power_3)
+
+def legacy_field(message):
+    """
+    Former read of a one byte field, int(ByteToHex(x), 16)
+    """
+    return int(legacy_byte_to_hex(message), 16)
+
+# ----------------------------------------------------------------------------
+
+def setup_domotricks(db_path, verbose):
+    """
+    Initialize the domotricks globals the way its main does
+    """
+    domotricks.CONFIG = domotricks.ConfigData()
+    domotricks.CMDARG = domotricks.CmdArgData(printout_complete=verbose, printout_debug=verbose)
+    domotricks.LOGGER = logging.getLogger('RFXPROTO-benchmark')
+    domotricks.LOGGER.handlers = [logging.StreamHandler(open(os.devnull, 'w'))]
+    domotricks.LOGGER.setLevel(logging.DEBUG if verbose else logging.ERROR)
+    domotricks.OUTPUT = None
+    domotricks.DB = SqliteCmd(db_path)
+    domotricks.DB.create_device_alerting_table()
+    domotricks.DB.create_lost_table()
+    domotricks.DB.create_myassets_table()
+    domotricks.DB.create_readings_table()
+    domotricks.DB.create_asset_latest_table()
+    domotricks.DB.create_registry_version_table()
+    domotricks.REGISTRY = AssetRegistry(domotricks.DB)
+    domotricks.WRITER = SqliteWriter(db_path, queue_size=0)
+    domotricks.WRITER.start()
+    domotricks.LOST = LostAssets(domotricks.WRITER)
+
+def teardown_domotricks():
+    """
+    Stop the writer and close the database
+    """
+    domotricks.LOST.flush()
+    domotricks.WRITER.stop()
+    domotricks.DB.SQLiteClose()
+
+def bench_logging(number):
+    """
+    Time decode_packet per packet, with logging off then fully on
+    """
+    print('> bench_logging')
+    for verbose in (False, True):
+        with TemporaryDirectory() as tmp_dir:
+            setup_domotricks(os.path.join(tmp_dir, 'benchmark.db'), verbose)
+            with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+                start = perf_counter()
+                for _ in range(number):
+                    for packet in PACKETS:
+                        domotricks.decode_packet(packet)
+                elapsed = perf_counter() - start
+            teardown_domotricks()
+        per_packet = elapsed / (number * len(PACKETS)) * 1e6
+        print(f'Logging {"on" if verbose else "off"}: {per_packet:.1f} µs/packet')
+
+def bench_helpers(number):
+    """
+    Time the former hex-string decode helpers against the integer ones
+    """
+    print('> bench_helpers')
+    message = bytes.fromhex('0f5c01001234e6006400c8000a5a3269')
+    helpers = (
+        ('field byte', legacy_field, lambda byte: byte, (message[6],)),
+        ('decode_temperature', legacy_decode_temperature, decode_temperature, \
+            (message[6], message[7])),
+        ('decode_signal', legacy_decode_signal, decode_signal, (message[15],)),
+        ('decode_battery', legacy_decode_battery, decode_battery, (message[15],)),
+        ('decode_power', legacy_decode_power, decode_power, (message[8], message[9], message[10])),
+    )
+    for name, legacy, current, values in helpers:
+        timings = list()
+        for function in (legacy, current):
+            start = perf_counter()
+            for _ in range(number):
+                function(*values)
+            timings.append((perf_counter() - start) / number * 1e6)
+        print(f'{name}: {timings[0]:.2f} µs -> {timings[1]:.2f} µs ' \
+            f'(x{timings[0] / timings[1]:.1f})')
+
+def bench_decoders(number):
+    """
+    Time every 0x5X decoder on a message of its registered length
+    """
+    print('> bench_decoders')
+    barometric = domotricks.ConfigData().barometric
+    load_family(0x5)
+    total = 0
+    for packettype, (lengths, decoder, args) in sorted(PACKET_DECODERS.items()):
+        if packettype >> 4 != 0x5 or decoder is None:
+            continue
+        length = lengths[0] if lengths else 10
+        message = bytes([length - 1, packettype, 1, 1] + [(7 * i) & 0xff for i in range(4, length)])
+        fields = {
+            'message': message,
+            'subtype': ByteToHex(message[2]),
+            'seqnbr': ByteToHex(message[3]),
+            'id1': ByteToHex(message[4]),
+            'id2': ByteToHex(message[5]),
+            'barometric': barometric,
+        }
+        values = [fields[arg] for arg in args]
+        start = perf_counter()
+        for _ in range(number):
+            decoder(*values)
+        elapsed = perf_counter() - start
+        total += elapsed
+        print(f'{decoder.__name__}: {elapsed / number * 1e6:.2f} µs')
+    print(f'Total: {total / number * 1e6:.2f} µs')
+
+if __name__ == '__main__':
+    PARSER = ArgumentParser()
+    PARSER.add_argument('-n', '--number', action='store', dest='number', type=int, \
+        default=2000, help='Number of rounds over the sample packets')
+    ARGS = PARSER.parse_args()
+
+    bench_logging(ARGS.number)
+    bench_helpers(ARGS.number * 100)
+    bench_decoders(ARGS.number * 10)
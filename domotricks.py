@@ -34,34 +34,28 @@ __date__ = '$Date: 2021-12-20 15:00:00 +0100 (Tue, 1 Jun 2021) $'
 
 # Standard library
 from codecs import decode as codecs_decode
-from inspect import currentframe, getframeinfo
 from json import dumps
 import logging
 from argparse import ArgumentParser
 import os
-from time import strftime, sleep
+from select import select
+from time import process_time, strftime, sleep
 from traceback import format_exc
 from signal import signal, SIGINT, SIGTERM
 import sys
-import xml.dom.minidom as minidom
-
-# Third party library imports
-from serial import Serial, VERSION, SerialException
 
 # DomoTricks libraries
-import alerting
-from lib.rfx_socket import MESSAGEQUEUE, RFXcmdSocketAdapter
-from lib.rfx_utils import stripped, ByteToHex
-from lib.sqlite import SqliteCmd
-import lib.rfx_sensors
-import lib.rfx_decode_0x0 as rfxdecode0x0
-import lib.rfx_decode_0x1 as rfxdecode0x1
-import lib.rfx_decode_0x2 as rfxdecode0x2
-import lib.rfx_decode_0x3 as rfxdecode0x3
-import lib.rfx_decode_0x4 as rfxdecode0x4
-import lib.rfx_decode_0x5 as rfxdecode0x5
-import lib.rfx_decode_0x7 as rfxdecode0x7
-import lib.rfx_protocols as protocol
+from lib.alert_dispatcher import AlertDispatcher
+from lib.output_sink import OutputSink
+from lib.rfx_socket import MESSAGEQUEUE, WAKEUP_READ, RFXcmdSocketAdapter
+from lib.rfx_utils import ByteToHex
+from lib.sqlite import DB_PRAGMAS, AssetRegistry, LostAssets, SqliteCmd, SqliteWriter, metadata_channels, now_ms, ms_to_timestamp
+from lib.rfx_sensors import RFX
+from lib.lazy_import import IMPORT_TIMES, lazy_import
+# Decoder families, the protocol parser, serial and alerting are imported on first use
+from lib.rfx_decode import Reading, lookup
+from lib.rfx_filter import RfxFilter, read_keys
+from lib.rfx_framer import RfxFramer
 import settings
 
 # Debug
@@ -77,14 +71,31 @@ class ConfigData:
     """
     def __init__(
             self,
+            alerting_max_hung=4,
+            alerting_queue_size=100,
+            alerting_timeout=30,
+            alerting_workers=2,
             barometric=0,
             daemon_active=False,
             daemon_pidfile='rfxcmd.pid',
+            db_batch_interval=500,
+            db_batch_size=100,
+            db_queue_size=10000,
             device=None,
+            ignore_file='',
+            listen_timeout=1,
             log_msg=False,
             log_msgfile='',
             logfile='rfxcmd.log',
             loglevel='info',
+            lost_flush_interval=5000,
+            output_backup_count=5,
+            output_buffer_size=65536,
+            output_compress=False,
+            output_file='/var/log/output.log',
+            output_flush_interval=1000,
+            output_max_age=0,
+            output_max_bytes=10485760,
             process_rfxmsg=True,
             program_path='',
             protocol_file='protocol.xml',
@@ -100,14 +111,31 @@ class ConfigData:
             whitelist_file='',
         ):
 
+        self.alerting_max_hung = alerting_max_hung
+        self.alerting_queue_size = alerting_queue_size
+        self.alerting_timeout = alerting_timeout
+        self.alerting_workers = alerting_workers
         self.barometric = barometric
         self.daemon_active = daemon_active
         self.daemon_pidfile = daemon_pidfile
+        self.db_batch_interval = db_batch_interval
+        self.db_batch_size = db_batch_size
+        self.db_queue_size = db_queue_size
         self.device = device
+        self.ignore_file = ignore_file
+        self.listen_timeout = listen_timeout
         self.log_msg = log_msg
         self.log_msgfile = log_msgfile
         self.logfile = logfile
         self.loglevel = loglevel
+        self.lost_flush_interval = lost_flush_interval
+        self.output_backup_count = output_backup_count
+        self.output_buffer_size = output_buffer_size
+        self.output_compress = output_compress
+        self.output_file = output_file
+        self.output_flush_interval = output_flush_interval
+        self.output_max_age = output_max_age
+        self.output_max_bytes = output_max_bytes
         self.process_rfxmsg = process_rfxmsg
         self.program_path = program_path
         self.protocol_file = protocol_file
@@ -137,6 +165,7 @@ class CmdArgData:
             printout_csv=False,
             printout_debug=False,
             rawcmd='',
+            startup_profile=False,
         ):
         self.action = action
         self.configfile = configfile
@@ -147,6 +176,7 @@ class CmdArgData:
         self.printout_csv = printout_csv
         self.printout_debug = printout_debug
         self.rawcmd = rawcmd
+        self.startup_profile = startup_profile
 
 class RfxCmdData:
     """
@@ -207,6 +237,32 @@ def shutdown():
         SERIAL_PARAM.port.close()
         SERIAL_PARAM.port = None
 
+    if FRAMER is not None:
+        log_me('debug', 'Framer counters: ' + str(FRAMER.stats()))
+
+    if FILTER is not None:
+        log_me('debug', 'Filter counters: ' + str(FILTER.stats()))
+
+    if OUTPUT is not None:
+        log_me('debug', 'Close output file')
+        OUTPUT.close()
+
+    if ALERTS is not None:
+        log_me('debug', 'Drain alerting queue')
+        ALERTS.stop(CONFIG.alerting_timeout)
+        log_me('debug', 'Alerting counters: ' + str(ALERTS.stats()))
+
+    if LOST is not None and not LOST.flush():
+        log_me('error', 'database writer queue is full, lost assets dropped')
+
+    if WRITER is not None:
+        log_me('debug', 'Flush database writer')
+        WRITER.stop()
+
+    if DB is not None:
+        log_me('debug', 'Close database')
+        DB.SQLiteClose()
+
     log_me('debug', 'Exit 0')
     sys.stdout.flush()
     # pylint: disable=protected-access
@@ -256,26 +312,10 @@ def daemonize():
 # http://www.elfsternberg.com/2008/09/23/c-__line__-equivalent-in-python/
 # ----------------------------------------------------------------------------
 
-def _line():
-    info = getframeinfo(currentframe().f_back)[0:3]
-    return '[%s:%d]' % (info[2], info[1])
-
-# ----------------------------------------------------------------------------
-
-def readbytes(number):
-    """
-    Read x amount of bytes from serial port.
-    Credit: Boris Smus http://smus.com
-    """
-    buf = bytes()
-    for _ in range(number):
-        try:
-            byte = SERIAL_PARAM.port.read()
-        except (IOError, OSError) as err:
-            log_me('error', err)
-        buf += byte
-
-    return buf
+def _line(depth=1):
+    # sys._getframe does not load inspect nor read the source file
+    frame = sys._getframe(depth + 1) # pylint: disable=protected-access
+    return '[%s:%d]' % (frame.f_code.co_name, frame.f_lineno)
 
 # ----------------------------------------------------------------------------
 
@@ -284,250 +324,57 @@ def decode_packet(message):
     Decode incoming RFXtrx message.
     """
 
-    timestamp = strftime('%Y-%m-%d %H:%M:%S')
+    timestamp = now_ms()
     decoded = False
 
     # Verify incoming message
     log_me('debug', 'Verify incoming packet')
-    if not test_rfx(ByteToHex(message)):
-        log_me('error', 'The incoming message is invalid (' +
-               ByteToHex(message) + ') Line: ' + _line())
+    if validate_rfx(message) is None:
+        log_me('error', lambda: 'The incoming message is invalid (' + ByteToHex(message) + ')', \
+            line=True)
         return
     log_me('debug', 'Verified OK')
 
-    raw_message = ByteToHex(message)
-    raw_message = raw_message.replace(' ', '')
-
     packettype = ByteToHex(message[1])
-    log_me('debug', 'PacketType: %s' % str(packettype))
+    log_me('debug', 'PacketType: %s', packettype)
 
     subtype = None
     if len(message) > 2:
         subtype = ByteToHex(message[2])
-        log_me('debug', 'SubType: %s' % str(subtype))
+        log_me('debug', 'SubType: %s', subtype)
 
     seqnbr = None
     if len(message) > 3:
         seqnbr = ByteToHex(message[3])
-        log_me('debug', 'SeqNbr: %s' % str(seqnbr))
+        log_me('debug', 'SeqNbr: %s', seqnbr)
 
     id1 = None
     if len(message) > 4:
         id1 = ByteToHex(message[4])
-        log_me('debug', 'Id1: %s' % str(id1))
+        log_me('debug', 'Id1: %s', id1)
 
     id2 = None
     if len(message) > 5:
         id2 = ByteToHex(message[5])
-        log_me('debug', 'Id2: %s' % str(id2))
+        log_me('debug', 'Id2: %s', id2)
 
-    log_me('info', 'Packettype\t\t\t= ' + RFX.rfx_packettype[packettype])
+    log_me('info', lambda: 'Packettype\t\t\t= ' + RFX.rfx_packettype[message[1]])
 
     # ---------------------------------------
     # Verify correct length on packets
     # ---------------------------------------
+    lengths, decoder, args = lookup(message[1]) or (None, None, ())
     log_me('debug', 'Verify correct packet length')
-    if packettype == '00' and len(message) != 14:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '01' and len(message) != 14 and len(message) != 21:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '02' and len(message) != 5:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '10' and len(message) != 8:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '11' and len(message) != 12:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '12' and len(message) != 9:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '13' and len(message) != 10:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '14' and len(message) != 11:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '15' and len(message) != 12:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '16' and len(message) != 8:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '17' and len(message) != 8:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '18' and len(message) != 8:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '19' and len(message) != 10:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '1A' and len(message) != 13:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '20' and len(message) != 9:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '28' and len(message) != 7:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '30' and len(message) != 8:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '40' and len(message) != 10:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '41' and len(message) != 7:
+    if lengths is not None and len(message) not in lengths:
         log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '42' and len(message) != 9:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '4E' and len(message) != 11:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '4F' and len(message) != 11:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '50' and len(message) != 9:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '51' and len(message) != 9:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '52' and len(message) != 11:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '53' and len(message) != 10:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '54' and len(message) != 14:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '55' and len(message) != 12:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '56' and len(message) != 17:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '57' and len(message) != 10:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '58' and len(message) != 14:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '59' and len(message) != 14:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '5A' and len(message) != 18:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '5B' and len(message) != 20:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '5C' and len(message) != 16:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '5D' and len(message) != 9:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '70' and len(message) != 8:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '71' and len(message) != 11:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
-
-    if packettype == '72' and len(message) != 10:
-        log_me('error', 'Packet has wrong length, discarding')
-        decoded = True
-        packettype = None
+        return
 
     # ---------------------------------------
     # If packet is OK and the log_msg is active
     # then save the packet to log_msgfile designated
     # file on disk
     # ---------------------------------------
-    if not decoded and CONFIG.log_msg:
+    if CONFIG.log_msg:
         log_me('debug', 'Save packet to log_msgfile')
         try:
             data = str(ByteToHex(message))
@@ -540,222 +387,42 @@ def decode_packet(message):
             log_me('error', err)
 
     metadata = list()
-    output_extra = list()
-
-    # 0x0 - Interface Control
-    if packettype == '00':
-        log_me('debug', 'Decode packetType 0x' + str(packettype) + ' - Start')
-        decoded = True
-
-    # 0x01 - Interface Message
-    if packettype == '01':
-        decoded = True
-        metadata, output_extra = rfxdecode0x0.decode_0x01(message)
-
-    # 0x02 - Receiver/Transmitter Message
-    if packettype == '02':
-        decoded = True
-        metadata, output_extra = rfxdecode0x0.decode_0x02(subtype, seqnbr, id1)
-
-    # 0x03 - Undecoded Message
-    if packettype == '03':
-        decoded = True
-        metadata, output_extra = rfxdecode0x0.decode_0x03(message, subtype, seqnbr)
-
-    # 0x10 Lighting1
-    if packettype == '10':
-        decoded = True
-        metadata, output_extra = rfxdecode0x1.decode_0x10(message, subtype, seqnbr)
 
-    # 0x11 Lighting2
-    if packettype == '11':
+    if decoder is not None:
+        log_me('debug', 'Decode packetType 0x%s - Start', packettype)
         decoded = True
-        metadata, output_extra = rfxdecode0x1.decode_0x11(message, subtype, seqnbr)
-
-    # 0x12 Lighting3
-    if packettype == '12':
-        decoded = True
-        metadata, output_extra = rfxdecode0x1.decode_0x12(message, subtype, seqnbr)
-
-    # 0x13 Lighting4
-    if packettype == '13':
-        decoded = True
-        metadata, output_extra = rfxdecode0x1.decode_0x13(message, subtype, seqnbr)
-
-    # 0x14 Lighting5
-    if packettype == '14':
-        decoded = True
-        metadata, output_extra = rfxdecode0x1.decode_0x14(message, subtype, seqnbr, id1, id2)
-
-    # 0x15 Lighting6
-    if packettype == '15':
-        decoded = True
-        metadata, output_extra = rfxdecode0x1.decode_0x15(message, subtype, seqnbr, id1, id2)
-
-    # 0x16 Chime
-    if packettype == '16':
-        decoded = True
-        metadata, output_extra = rfxdecode0x1.decode_0x16(message, subtype, seqnbr, id1, id2)
-
-    # 0x17 Fan (Transmitter only)
-    if packettype == '17':
-        decoded = True
-        metadata, output_extra = rfxdecode0x1.decode_0x17(subtype, seqnbr)
-
-    # 0x18 Curtain1 (Transmitter only)
-    if packettype == '18':
-        decoded = True
-        metadata, output_extra = rfxdecode0x1.decode_0x18(subtype, seqnbr)
-
-    # 0x19 Blinds1
-    if packettype == '19':
-        decoded = True
-        metadata, output_extra = rfxdecode0x1.decode_0x19(subtype, seqnbr)
-
-    # 0x1A RTS
-    if packettype == '1A':
-        decoded = True
-        metadata, output_extra = rfxdecode0x1.decode_0x1a(message, subtype, seqnbr, id1, id2)
-
-    # 0x20 Security1
-    if packettype == '20':
-        decoded = True
-        metadata, output_extra = rfxdecode0x2.decode_0x20(message, subtype, seqnbr, id1, id2)
-
-    # 0x28 Camera1
-    if packettype == '28':
-        decoded = True
-        metadata, output_extra = rfxdecode0x2.decode_0x28(subtype, seqnbr)
-
-    # 0x30 Remote control and IR
-    if packettype == '30':
-        decoded = True
-        metadata, output_extra = rfxdecode0x3.decode_0x30(message, subtype, seqnbr, id1)
-
-    # 0x40 Thermostat1
-    if packettype == '40':
-        decoded = True
-        metadata, output_extra = rfxdecode0x4.decode_0x40(message, subtype, seqnbr, id1, id2)
-
-    # 0x41 Thermostat2
-    if packettype == '41':
-        decoded = True
-        metadata, output_extra = rfxdecode0x4.decode_0x41(subtype, seqnbr)
-
-    # 0x42 Thermostat3
-    if packettype == '42':
-        decoded = True
-        metadata, output_extra = rfxdecode0x4.decode_0x42(message, subtype, seqnbr, id1, id2)
-
-    # 0x50 Temperature sensors
-    if packettype == '50':
-        decoded = True
-        metadata, output_extra = rfxdecode0x5.decode_0x50(message, subtype, seqnbr, id1, id2)
-
-    # 0x51 Humidity sensors
-    if packettype == '51':
-        decoded = True
-        metadata, output_extra = rfxdecode0x5.decode_0x51(message, subtype, seqnbr, id1, id2)
-
-    # 0x52 Temperature and humidity sensors
-    if packettype == '52':
-        decoded = True
-        metadata, output_extra = rfxdecode0x5.decode_0x52(message, subtype, seqnbr, id1, id2)
-
-    # 0x53 Barometric
-    if packettype == '53':
-        decoded = True
-        metadata, output_extra = rfxdecode0x5.decode_0x53(subtype, seqnbr)
-
-    # 0x54 Temperature, humidity and barometric sensors
-    if packettype == '54':
-        decoded = True
-        metadata, output_extra = rfxdecode0x5.decode_0x54(message, subtype, seqnbr, id1, id2, \
-            CONFIG.barometric)
-
-    # 0x55 Rain sensors
-    if packettype == '55':
-        decoded = True
-        metadata, output_extra = rfxdecode0x5.decode_0x55(message, subtype, seqnbr, id1, id2)
-
-    # 0x56 Wind sensors
-    if packettype == '56':
-        decoded = True
-        metadata, output_extra = rfxdecode0x5.decode_0x56(message, subtype, seqnbr, id1, id2)
-
-    # 0x57 UV Sensor
-    if packettype == '57':
-        decoded = True
-        metadata, output_extra = rfxdecode0x5.decode_0x57(message, subtype, seqnbr, id1, id2)
-
-    # 0x58 Date/Time sensor
-    if packettype == '58':
-        decoded = True
-        metadata, output_extra = rfxdecode0x5.decode_0x58(message, subtype, seqnbr, id1, id2)
-
-    # 0x59 Current Sensor
-    if packettype == '59':
-        decoded = True
-        metadata, output_extra = rfxdecode0x5.decode_0x59(message, subtype, seqnbr, id1, id2)
-
-    # 0x5A Energy sensor
-    if packettype == '5A':
-        decoded = True
-        metadata, output_extra = rfxdecode0x5.decode_0x5a(message, subtype, seqnbr, id1, id2)
-
-    # 0x5B Current Sensor
-    if packettype == '5B':
-        decoded = True
-        metadata, output_extra = rfxdecode0x5.decode_0x5b(message, subtype, seqnbr, id1, id2)
-
-    # 0x5C Power Sensors
-    if packettype == '5C':
-        decoded = True
-        metadata, output_extra = rfxdecode0x5.decode_0x5c(message, subtype, seqnbr, id1, id2)
-
-    # 0x5D
-    if packettype == '5D':
-        decoded = True
-        metadata, output_extra = rfxdecode0x5.decode_0x5d(subtype, seqnbr)
-
-    # 0x5E Gas Usage Sensor
-    if packettype == '5E':
-        decoded = True
-        metadata, output_extra = rfxdecode0x5.decode_0x5e(subtype, seqnbr)
-
-    # 0x5F Water Usage Sensor
-    if packettype == '5F':
-        decoded = True
-        metadata, output_extra = rfxdecode0x5.decode_0x5f(subtype, seqnbr)
-
-    # 0x70 RFXsensor
-    if packettype == '70':
-        decoded = True
-        metadata, output_extra = rfxdecode0x7.decode_0x70(message, subtype, seqnbr, id1)
-
-    # 0x71 RFXmeter
-    if packettype == '71':
-        decoded = True
-        metadata, output_extra = rfxdecode0x7.decode_0x71(message, subtype, seqnbr, id1, id2)
-
-    # 0x72 FS20
-    if packettype == '72':
-        decoded = True
-        metadata, output_extra = rfxdecode0x7.decode_0x72(subtype, seqnbr)
+        fields = {
+            'message': message,
+            'subtype': subtype,
+            'seqnbr': seqnbr,
+            'id1': id1,
+            'id2': id2,
+            'barometric': CONFIG.barometric,
+        }
+        metadata = decoder(*[fields[arg] for arg in args])
 
     # Not decoded message
 
     # The packet is not decoded, then log_me('info', it on the screen)
     if not decoded:
-        log_me('error', 'Message not decoded. Line: ' + _line())
-        log_me('error', 'Message: ' + ByteToHex(message))
-        log_me('info', timestamp + ' ' + ByteToHex(message))
+        log_me('error', 'Message not decoded.', line=True)
+        log_me('error', 'Message: %s', ByteToHex(message))
+        log_me('info', lambda: ms_to_timestamp(timestamp) + ' ' + ByteToHex(message))
         log_me('info', 'RFXCMD cannot decode message, see http://code.google.com/p/rfxcmd/wiki/')
 
     # Print result
-    print_decoded(metadata)
-    output_me(timestamp, message, packettype, subtype, seqnbr, output_extra)
-    domotricks_me(timestamp, message, packettype, subtype, seqnbr, metadata)
+    if log_enabled('info'):
+        print_decoded(metadata)
+    reading = Reading(
+        timestamp,
+        ByteToHex(message),
+        RFX.rfx_packettype[message[1]],
+        packettype,
+        subtype,
+        seqnbr,
+        metadata)
+    output_me(reading)
+    domotricks_me(reading)
 
     # decodePackage END
     return
@@ -771,9 +438,9 @@ def read_socket():
 
     if not MESSAGEQUEUE.empty():
         log_me('debug', 'Message received in socket MESSAGEQUEUE')
-        message = MESSAGEQUEUE.get().decode('UTF-8')
+        message = validate_rfx(MESSAGEQUEUE.get(), hexa=True)
 
-        if test_rfx(message):
+        if message is not None:
 
             if CONFIG.serial_active:
                 # Flush buffer
@@ -782,73 +449,58 @@ def read_socket():
                 SERIAL_PARAM.port.flushInput()
                 log_me('debug', 'SerialPort flush input')
 
-            timestamp = strftime('%Y-%m-%d %H:%M:%S')
-
-            log_me('info', '------------------------------------------------')
-            log_me('info', 'Incoming message from socket')
-            log_me('info', 'Send\t\t\t= ' + ByteToHex(codecs_decode(message, 'hex')))
-            log_me('info', 'Date/Time\t\t\t= ' + timestamp)
-            log_me('info', 'Packet Length\t\t= ' + ByteToHex(codecs_decode(message, 'hex')[0]))
+            if log_enabled('info'):
+                log_me('info', '------------------------------------------------')
+                log_me('info', 'Incoming message from socket')
+                log_me('info', 'Send\t\t\t= %s', ByteToHex(message))
+                log_me('info', 'Date/Time\t\t\t= %s', strftime('%Y-%m-%d %H:%M:%S'))
+                log_me('info', 'Packet Length\t\t= %s', ByteToHex(message[0]))
 
             try:
                 log_me('debug', 'Decode message')
-                decode_packet(codecs_decode(message, 'hex'))
+                decode_packet(message)
             except KeyError:
-                log_me('error', 'Unrecognizable packet. Line: ' + _line())
+                log_me('error', 'Unrecognizable packet.', line=True)
 
             if CONFIG.serial_active:
                 log_me('debug', 'Write message to serial port')
-                SERIAL_PARAM.port.write(codecs_decode(message, 'hex'))
+                SERIAL_PARAM.port.write(message)
 
         else:
-            log_me('error', 'Invalid message from socket. Line: ' + _line())
+            log_me('error', 'Invalid message from socket.', line=True)
 
 # ----------------------------------------------------------------------------
 
-def test_rfx(message):
+# Characters stripped from hex messages: controls, spaces and non ASCII
+HEX_IGNORED = bytes(range(0, 33)) + bytes(range(127, 256))
+
+def validate_rfx(message, hexa=False):
     """
-    Test, filter and verify that the incoming message is valid
-    Return true if valid, False if not
+    Verify that the incoming message is valid, in a single pass
+    message is a binary message (bytes or memoryview), or its hex
+    representation if hexa is set, which is decoded once
+    Return the binary message, None if not valid
     """
+    if hexa:
+        if isinstance(message, str):
+            message = message.encode('ascii', 'ignore')
+        try:
+            message = bytes.fromhex(message.translate(None, HEX_IGNORED).decode('ascii'))
+        except ValueError:
+            log_me('error', 'Packet is not in hex format')
+            return None
 
-    log_me('debug', 'Test message: ' + message)
-
-    # Remove all invalid characters
-    message = stripped(message)
-
-    return_statement = True
-
-    # Remove any whitespaces
-    try:
-        message = message.replace(' ', '')
-    except Exception:
-        log_me('error', 'Removing white spaces')
-        return False
-
-    # Test the string if it is hex format
-    if message == '':
+    if not message:
         log_me('error', 'Packet empty')
-        return_statement = False
-    # Check that length is even
-    elif len(message) % 2:
-        log_me('error', 'Packet length not even')
-        return_statement = False
-    # Check that first byte is not 00
-    elif ByteToHex(codecs_decode(message, 'hex')[0]) == '00':
+    elif message[0] == 0:
         log_me('error', 'Packet first byte is 00')
-        return_statement = False
-    # Length more than one byte
-    elif not len(codecs_decode(message, 'hex')) > 1:
+    elif len(message) < 2:
         log_me('error', 'Packet is not longer than one byte')
-        return_statement = False
-    # Check if string is the length that it reports to be
-    elif not len(codecs_decode(message, 'hex')) == (codecs_decode(message, 'hex')[0] + 1):
+    elif len(message) != message[0] + 1:
         log_me('error', 'Packet length is not valid')
-        return_statement = False
     else:
-        log_me('debug', 'Message OK')
-
-    return return_statement
+        return message
+    return None
 
 # ----------------------------------------------------------------------------
 
@@ -875,64 +527,50 @@ def send_rfx(message):
 
 def read_rfx():
     """
-    Read message from RFXtrx and decode the decode the message
+    Read the bytes waiting on the RFXtrx and decode every complete message
+    Return the number of messages processed
     """
-    message = None
-    byte = None
-
     try:
-        try:
-            if SERIAL_PARAM.port.inWaiting() != 0:
-                timestamp = strftime('%Y-%m-%d %H:%M:%S')
-                log_me('debug', 'Timestamp: ' + timestamp)
-                log_me('debug', 'SerWaiting: ' + str(SERIAL_PARAM.port.inWaiting()))
-                byte = SERIAL_PARAM.port.read()
-                log_me('debug', 'Byte: ' + str(ByteToHex(byte)))
-        except IOError as err:
-            log_me('error', err)
-            log_me('error', 'Serial read %s, Line: %s' % (str(err), _line()))
-
-        if byte:
-            message = byte + readbytes(ord(byte))
-            log_me('debug', 'Message: ' + str(ByteToHex(message)))
-
-            # First byte indicate length of message, must be other than 00
-            if ByteToHex(message[0]) != '00':
-
-                # Verify length
-                log_me('debug', 'Verify length')
-                if (len(message) - 1) == message[0]:
-                    log_me('debug', 'Length OK')
-
-                    log_me('info', '------------------------------------------------')
-                    log_me('info', 'Received\t\t\t= ' + ByteToHex(message))
-                    log_me('info', 'Date/Time\t\t\t= ' + timestamp)
-                    log_me('info', 'Packet Length\t\t= ' + ByteToHex(message[0]))
-
-                    log_me('debug', 'Decode packet')
-                    try:
-                        decode_packet(message)
-                    except KeyError as err:
-                        log_me('error', 'unrecognizable packet (' + ByteToHex(message) + \
-                               ') Line: ' + _line())
-                        log_me('error', err)
-                    rawcmd = ByteToHex(message)
-                    rawcmd = rawcmd.replace(' ', '')
-
-                    return rawcmd
-
-                log_me('error', 'Incoming packet not valid length. Line: '  + _line())
-                log_me('error', '------------------------------------------------')
-                log_me('error', 'Received\t\t\t= ' + ByteToHex(message))
-                log_me('error', 'Incoming packet not valid, waiting for next...')
+        size = max(1, min(SERIAL_PARAM.port.inWaiting(), FRAMER.free()))
+        data = SERIAL_PARAM.port.read(size)
+    except (IOError, OSError) as err:
+        log_me('error', err)
+        log_me('error', 'Serial read %s', err, line=True)
+        return 0
+
+    log_me('debug', lambda: 'Read: ' + ByteToHex(data))
+    FRAMER.feed(data)
+    processed = 0
+    for message in FRAMER.frames_available():
+        process_rfx(message)
+        processed += 1
+    return processed
+
+def process_rfx(message):
+    """
+    Decode a message framed out of the RFXtrx stream
+    """
+    if log_enabled('info'):
+        log_me('info', '------------------------------------------------')
+        log_me('info', 'Received\t\t\t= %s', ByteToHex(message))
+        log_me('info', 'Date/Time\t\t\t= %s', strftime('%Y-%m-%d %H:%M:%S'))
+        log_me('info', 'Packet Length\t\t= %s', ByteToHex(message[0]))
+
+    if FILTER is not None and not FILTER.accept(message):
+        log_me('debug', lambda: 'Filtered out: ' + ByteToHex(message))
+        return
 
+    log_me('debug', 'Decode packet')
+    try:
+        decode_packet(message)
+    except KeyError as err:
+        log_me('error', 'unrecognizable packet (%s)', ByteToHex(message), line=True)
+        log_me('error', err)
     except OSError:
-        log_me('error', 'Error in message: ' + str(ByteToHex(message)) + ' Line: ' + _line())
-        log_me('error', 'Traceback: ' + format_exc())
-        log_me('error', '------------------------------------------------')
-        log_me('error', 'Received\t\t\t= ' + ByteToHex(message))
-        format_exc()
-    return None
+        log_me('error', 'Error in message: %s', ByteToHex(message), line=True)
+        log_me('error', 'Traceback: %s', format_exc())
+
+    log_me('debug', lambda: 'Processed: ' + ByteToHex(message))
 
 # ----------------------------------------------------------------------------
 
@@ -953,7 +591,7 @@ def read_config(configfile, configitem):
         # xml parse file data
         log_me('debug', 'Parse config XML data')
         try:
-            dom = minidom.parseString(data)
+            dom = lazy_import('xml.dom.minidom').parseString(data)
         except Exception as err:
             log_me('error', 'problem in the config.xml file, cannot process it')
             log_me('error', err)
@@ -975,7 +613,7 @@ def read_config(configfile, configitem):
         log_me('debug', 'Return')
 
     else:
-        log_me('error', 'Config file does not exists. Line: ' + _line())
+        log_me('error', 'Config file does not exists.', line=True)
 
     return xml_data
 
@@ -993,6 +631,20 @@ def print_version():
 
 # ----------------------------------------------------------------------------
 
+def print_startup_profile():
+    """
+    Print the time spent starting up, with the detail of the lazy imports
+    """
+    if not CMDARG.startup_profile:
+        return
+    print('Startup profile:')
+    print(f'  interpreter and top-level imports: {STARTUP_CPU * 1000:.1f} ms (cpu)')
+    for name, seconds in IMPORT_TIMES.items():
+        print(f'  import {name}: {seconds * 1000:.1f} ms')
+    print(f'  ready: {process_time() * 1000:.1f} ms (cpu)')
+
+# ----------------------------------------------------------------------------
+
 def check_pythonversion():
     """
     Check python version
@@ -1003,6 +655,46 @@ def check_pythonversion():
 
 # ----------------------------------------------------------------------------
 
+def wait_input(read_serial, read_socket_queue, timeout):
+    """
+    Block until the serial port or the socket server has data, at most timeout seconds.
+    Return the list of ready file descriptors
+    """
+    fds = list()
+    if read_serial:
+        fds.append(SERIAL_PARAM.port.fileno())
+    if read_socket_queue:
+        fds.append(WAKEUP_READ)
+    if not fds:
+        sleep(timeout)
+        return fds
+    ready, _, _ = select(fds, [], [], timeout)
+    return ready
+
+# ----------------------------------------------------------------------------
+
+def option_replay(filename):
+    """
+    Decode a recorded RFXtrx byte stream, as read on the serial port
+    """
+    log_me('debug', 'Replay ' + filename)
+    print_startup_profile()
+    with open(filename, 'rb') as stream:
+        data = stream.read(FRAMER.free())
+        while data:
+            FRAMER.feed(data)
+            for message in FRAMER.frames_available():
+                process_rfx(message)
+            data = stream.read(FRAMER.free())
+    print('Frames: {frames}, resyncs: {resyncs}, discarded bytes: {discarded_bytes}'.format(
+        **FRAMER.stats()))
+    if FILTER is not None:
+        print('Filtered: {dropped}, accepted: {accepted}'.format(**FILTER.stats()))
+        for key, count in FILTER.dropped.most_common():
+            print(f'  {key}: {count}')
+
+# ----------------------------------------------------------------------------
+
 def option_listen():
     """
     Listen to RFXtrx device and process data, exit with CTRL+C
@@ -1017,7 +709,7 @@ def option_listen():
         try:
             serversocket = RFXcmdSocketAdapter(CONFIG.sockethost, int(CONFIG.socketport))
         except Exception as err:
-            log_me('error', 'Error starting socket server. Line: ' + _line())
+            log_me('error', 'Error starting socket server.', line=True)
             log_me('error', 'can not start server socket, another instance already running?')
             log_me('error', err)
             sys.exit(1)
@@ -1055,7 +747,7 @@ def option_listen():
         if CONFIG.protocol_startup:
             log_me('debug', 'Protocol AutoStart activated')
             try:
-                p_message = protocol.set_protocolfile(CONFIG.protocol_file)
+                p_message = lazy_import('lib.rfx_protocols').set_protocolfile(CONFIG.protocol_file)
                 log_me('debug', 'Send set protocol message (' + p_message + ')')
                 SERIAL_PARAM.port.write(codecs_decode(p_message, 'hex'))
                 log_me('debug', 'Sleep 1 sec')
@@ -1063,22 +755,26 @@ def option_listen():
             except Exception as err:
                 log_me('error', 'Could not create protocol message')
 
+    read_serial = CONFIG.serial_active and CONFIG.process_rfxmsg
+    print_startup_profile()
+
     try:
         while 1:
-            # Let it breath
-            # Without this sleep it will cause 100% CPU in windows
-            sleep(0.01)
+            ready = wait_input(read_serial, CONFIG.socketserver, CONFIG.listen_timeout)
+            if OUTPUT is not None:
+                OUTPUT.flush_if_due()
+            if not LOST.flush_if_due():
+                log_me('error', 'database writer queue is full, lost assets dropped')
 
-            if CONFIG.serial_active:
-                # Read serial port
-                if CONFIG.process_rfxmsg:
-                    rawcmd = read_rfx()
-                    if rawcmd:
-                        log_me('debug', 'Processed: ' + str(rawcmd))
+            # Read serial port
+            if read_serial and SERIAL_PARAM.port.fileno() in ready:
+                read_rfx()
 
             # Read socket
-            if CONFIG.socketserver:
-                read_socket()
+            if WAKEUP_READ in ready:
+                os.read(WAKEUP_READ, 512)
+                while not MESSAGEQUEUE.empty():
+                    read_socket()
 
     except KeyboardInterrupt:
         log_me('debug', 'Received keyboard interrupt')
@@ -1124,7 +820,8 @@ def open_serialport():
 
     # Check that serial module is loaded
     try:
-        log_me('debug', 'Serial extension version: ' + VERSION)
+        serial = lazy_import('serial')
+        log_me('debug', 'Serial extension version: ' + serial.VERSION)
     except Exception as err:
         log_me('error', 'You need to install Serial extension for Python')
         log_me('error', err)
@@ -1134,17 +831,17 @@ def open_serialport():
     if CONFIG.device:
         log_me('debug', 'Device: ' + CONFIG.device)
     else:
-        log_me('error', 'Device name missing. Line: ' + _line())
+        log_me('error', 'Device name missing.', line=True)
         sys.exit(1)
 
     # Open serial port
     log_me('debug', 'Open Serialport')
     try:
-        SERIAL_PARAM.port = Serial(CONFIG.device,
-                                   SERIAL_PARAM.rate,
-                                   timeout=SERIAL_PARAM.timeout)
-    except SerialException as err:
-        log_me('error', 'Failed to connect on device ' + CONFIG.device + ' Line: ' + _line())
+        SERIAL_PARAM.port = serial.Serial(CONFIG.device,
+                                          SERIAL_PARAM.rate,
+                                          timeout=SERIAL_PARAM.timeout)
+    except serial.SerialException as err:
+        log_me('error', 'Failed to connect on device ' + CONFIG.device, line=True)
         log_me('error', err)
         sys.exit(1)
 
@@ -1162,144 +859,140 @@ def close_serialport():
     try:
         SERIAL_PARAM.port.close()
         log_me('debug', 'Serial port closed')
-    except SerialException as err:
-        log_me('error', 'Failed to close the serial port (' + CONFIG.device + ') Line: ' + _line())
+    except lazy_import('serial').SerialException as err:
+        log_me('error', 'Failed to close the serial port (' + CONFIG.device + ')', line=True)
         log_me('error', err)
         sys.exit(1)
 
 # ----------------------------------------------------------------------------
 
-def dict_asset(timestamp, message, packettype, subtype, seqnbr, metadata_obj):
-    """
-    Return a dict formed by asset data
-    """
-    rawcmd = ByteToHex(message)
-    rawcmd = rawcmd.replace(' ', '')
-
-    result = dict()
-    result['timestamp'] = timestamp
-    result['key'] = f'{packettype}_{subtype}'
-    result['rawcmd'] = rawcmd
-    result['packettype'] = RFX.rfx_packettype[packettype]
-    result['packettype_id'] = packettype
-    result['subtype'] = subtype
-    result['seqnbr'] = seqnbr
-
-    if not metadata_obj:
-        result['metadata'] = dict()
-    elif isinstance(metadata_obj[0], dict):
-        result['metadata'] = metadata_obj
-        for metadata in metadata_obj:
-            if metadata['key'] == 'Id':
-                result['key'] += f'_{metadata["value"]}'
-        for metadata in metadata_obj:
-            if metadata['key'] == 'Unitcode':
-                result['key'] += f'_{metadata["value"]}'
-    else:
-        result['metadata'] = dict()
-        for metadata in metadata_obj:
-            result['metadata'][metadata[0]] = metadata[1]
-        if 'id' in result['metadata']:
-            result['key'] += f'_{result["metadata"]["id"]}'
-        if 'unitcode' in result['metadata']:
-            result['key'] += f'_{result["metadata"]["unitcode"]}'
-
-    return result
-
-def domotricks_me(timestamp, message, packettype, subtype, seqnbr, metadata_dict):
+def domotricks_me(reading):
     """
     This function writes in the sqlite database and trigger alerting
     """
-    conn = SqliteCmd(settings.DB_PATH)
-
-    asset = dict_asset(timestamp, message, packettype, subtype, seqnbr, metadata_dict)
-
     # Log in specific table if the asset is registred
-    if conn.is_registered_asset(asset['key']):
-        nickname = conn.get_asset_nickname(asset['key'])
-        log_me('debug', f'registred asset: {asset["key"]} as {nickname}')
-        conn.create_asset_table(asset['key'])
-        conn.insert_asset(
-            f'asset_{asset["key"]}',
-            asset['timestamp'],
-            asset['packettype'],
-            asset['packettype_id'],
-            asset['subtype'],
-            asset['seqnbr'],
-            str(asset['metadata']))
-        functions = conn.get_device_alerting(asset['key'])
-        if functions is not None:
-            for function in functions[0].split('|'):
+    asset = REGISTRY.get(reading.key)
+    if asset is not None:
+        nickname, functions = asset
+        log_me('debug', 'registred asset: %s as %s', reading.key, nickname)
+        queue_write(
+            'insert_asset',
+            reading.key,
+            reading.timestamp,
+            reading.packettype,
+            reading.seqnbr,
+            reading.payload(),
+            metadata_channels(reading.measurements))
+        if functions:
+            alerting = lazy_import('alerting')
+            for function in functions:
                 if not hasattr(alerting, function):
                     log_me('error', f'alerting function "{function}" does not exist...')
                     continue
-                log_me('debug', f'trigger alerting function "{function}" for {nickname}')
-                getattr(alerting, function)(nickname, metadata_dict)
-    elif asset['key'] not in ['01_00']:
-        log_me('debug', f'lost asset: {asset["key"]}')
-        conn.insert_lost_asset(
-            asset['key'],
-            asset['timestamp'],
-            asset['packettype'],
-            asset['packettype_id'],
-            asset['subtype'],
-            asset['seqnbr'],
-            str(asset['metadata']))
-
-def output_me(timestamp, message, packettype, subtype, seqnbr, metadata_list):
+                log_me('debug', 'trigger alerting function "%s" for %s', function, nickname)
+                if not ALERTS.put(function, getattr(alerting, function), nickname, \
+                    reading.measurements):
+                    log_me('error', f'alerting queue is full, "{function}" dropped ' \
+                        f'({ALERTS.dropped} so far)')
+    elif reading.key not in ['01_00']:
+        log_me('debug', 'lost asset: %s', reading.key)
+        LOST.put(
+            reading.key,
+            reading.timestamp,
+            reading.packettype,
+            reading.packettype_id,
+            reading.subtype,
+            reading.seqnbr,
+            reading.payload())
+
+def queue_write(method, *args):
     """
-    This function writes json or csv output in a different file
+    Hand over a database write to the writer thread
     """
-    try:
-        output_file = open('/var/log/output.log', 'a+')
-    except Exception as err:
-        log_me('error', err)
-        return
+    if not WRITER.put(method, *args):
+        log_me('error', f'database writer queue is full, {method} dropped ({WRITER.dropped} so far)')
 
-    asset = dict_asset(timestamp, message, packettype, subtype, seqnbr, metadata_list)
+def output_me(reading):
+    """
+    This function writes json or csv output in the output file and on stdout
+    """
+    timestamp = ms_to_timestamp(reading.timestamp)
+    metadata = reading.fields()
 
     if CMDARG.printout_csv:
-        result = f'{asset["timestamp"]};{asset["key"]};{asset["rawcmd"]};{asset["packettype"]};{asset["subtype"]};{asset["seqnbr"]};{str(asset["metadata"])}'
+        result = f'{timestamp};{reading.key};{reading.rawcmd};{reading.packettype};{reading.subtype};{reading.seqnbr};{str(metadata)}'
     else:
-        result = dumps(asset)
-    output_file.write(str(result) + '\n')
-    output_file.close()
-    sys.stdout.write(str(result) + '\n')
-    sys.stdout.flush()
-
-def log_me(verbosity, message):
+        result = dumps({
+            'timestamp': timestamp,
+            'key': reading.key,
+            'rawcmd': reading.rawcmd,
+            'packettype': reading.packettype,
+            'packettype_id': reading.packettype_id,
+            'subtype': reading.subtype,
+            'seqnbr': reading.seqnbr,
+            'metadata': metadata,
+        })
+    if OUTPUT is not None:
+        OUTPUT.write(result)
+    sys.stdout.write(result + '\n')
+
+LOG_LEVELS = {
+    'error': logging.ERROR,
+    'warning': logging.WARNING,
+    'info': logging.INFO,
+    'debug': logging.DEBUG,
+}
+
+def log_enabled(verbosity):
+    """
+    Return True if log_me would write a message of this verbosity
+    """
+    if verbosity == 'info':
+        if not CMDARG.printout_complete:
+            return False
+    elif verbosity not in ('error', 'warning'):
+        if not CMDARG.printout_debug:
+            return False
+    return LOGGER.isEnabledFor(LOG_LEVELS.get(verbosity, logging.DEBUG))
+
+def log_me(verbosity, message, *args, line=False):
     """
     This function write logs
+    Nothing is formatted unless the verbosity is enabled: message may be
+    a callable returning the message, args are %-formatted into it and
+    line appends the caller line.
     """
-    if verbosity == 'error':
-        LOGGER.error(message)
-    elif verbosity == 'warning':
-        LOGGER.warning(message)
-    elif verbosity == 'info':
-        if CMDARG.printout_complete:
-            LOGGER.info(message)
-    else:
-        if CMDARG.printout_debug:
-            LOGGER.debug(message)
+    if not log_enabled(verbosity):
+        return
+    if callable(message):
+        message = message()
+    if args:
+        message = str(message) % args
+    if line:
+        message = f'{message} Line: {_line(depth=1)}'
+    LOGGER.log(LOG_LEVELS.get(verbosity, logging.DEBUG), message)
 
 def print_decoded(metadata, prefix=''):
     """
-    Display metadata of a list of dict which may contains metadata as value
+    Display a list of measurements, which may contain measurements as value
     """
     for i in metadata:
-        if isinstance(i['value'], list):
-            log_me('info', '%s%s:' % (prefix, i['key']))
-            print_decoded(i['value'], prefix='    ')
-        elif 'unit' in i:
-            log_me('info', '%s%s: %s %s' % (prefix, i['key'], i['value'], i['unit']))
+        if isinstance(i.value, list):
+            log_me('info', '%s%s:', prefix, i.key)
+            print_decoded(i.value, prefix='    ')
+        elif i.unit is not None:
+            log_me('info', '%s%s: %s %s', prefix, i.key, i.value, i.unit)
         else:
-            log_me('info', '%s%s: %s' % (prefix, i['key'], i['value']))
+            log_me('info', '%s%s: %s', prefix, i.key, i.value)
 
 # ----------------------------------------------------------------------------
 
 
 if __name__ == '__main__':
 
+    # CPU time of the interpreter startup and the top-level imports
+    STARTUP_CPU = process_time()
+
     # Init shutdown handler
     signal(SIGINT, handler)
     signal(SIGTERM, handler)
@@ -1307,9 +1000,16 @@ if __name__ == '__main__':
     # Init objects
     CONFIG = ConfigData()
     CMDARG = CmdArgData()
-    RFX = lib.rfx_sensors.rfx_data()
     RFXCMD = RfxCmdData()
     SERIAL_PARAM = SerialData()
+    FRAMER = RfxFramer(lookup)
+    FILTER = None
+    ALERTS = None
+    OUTPUT = None
+    DB = None
+    REGISTRY = None
+    WRITER = None
+    LOST = None
 
     # Check python version
     check_pythonversion()
@@ -1322,6 +1022,8 @@ if __name__ == '__main__':
         help='The serial device of the RFXCOM, example /dev/ttyUSB0')
     PARSER.add_argument('-l', '--listen', action='store_true', dest='listen', \
         help='Listen for messages from RFX device')
+    PARSER.add_argument('-r', '--replay', action='store', dest='replay', \
+        help='Decode a recorded RFX byte stream file instead of the device')
     PARSER.add_argument('-v', '--verbose', action='store_true', dest='verbose', default=False, \
         help='Output all messages to stdout')
     PARSER.add_argument('-c', '--csv', action='store_true', dest='csv', default=False, \
@@ -1330,6 +1032,12 @@ if __name__ == '__main__':
         help='Print rfxcmd version information')
     PARSER.add_argument('-D', '--debug', action='store_true', dest='debug', default=False, \
         help='Debug printout on stdout')
+    PARSER.add_argument('--startup-profile', action='store_true', dest='startup_profile', \
+        default=False, help='Print the startup time and lazy imports detail')
+    PARSER.add_argument('-w', '--whitelist', action='store', dest='whitelist', \
+        help='Only decode the asset keys listed in this file')
+    PARSER.add_argument('-i', '--ignore', action='store', dest='ignore', \
+        help='Drop the asset keys listed in this file before decoding')
     ARGS = PARSER.parse_args()
 
     # ----------------------------------------------------------
@@ -1350,21 +1058,27 @@ if __name__ == '__main__':
     LOGGER = logging.getLogger('RFXPROTO')
     LOGGER.setLevel(LOGLEVEL)
     LOGGER.addHandler(HANDLER)
+    # The lib modules log to their own logger, warnings included
+    LIB_LOGGER = logging.getLogger('domotricks-rfxcmd')
+    LIB_LOGGER.setLevel(min(LOGLEVEL, logging.WARNING))
+    LIB_LOGGER.addHandler(HANDLER)
 
     if ARGS.debug:
         CMDARG.printout_debug = True
         CMDARG.printout_complete = True
-        log_me('debug', 'Debug printout ' + _line())
+        log_me('debug', 'Debug printout', line=True)
 
     if ARGS.verbose:
         CMDARG.printout_complete = True
-        log_me('info', 'Verbose printout ' + _line())
+        log_me('info', 'Verbose printout', line=True)
         log_me('info', 'RFXCMD Version ' + __version__)
 
-    log_me('debug', 'Python version: %s.%s.%s' % sys.version_info[:3])
+    log_me('debug', 'Python version: %s.%s.%s', *sys.version_info[:3])
     log_me('debug', 'RFXCMD Version: ' + __version__)
     log_me('debug', __date__.replace('$', ''))
 
+    CMDARG.startup_profile = ARGS.startup_profile
+
     # ----------------------------------------------------------
     # OUTPUT
     if ARGS.csv:
@@ -1380,6 +1094,24 @@ if __name__ == '__main__':
     elif CONFIG.serial_device:
         CONFIG.device = CONFIG.serial_device
 
+    # ----------------------------------------------------------
+    # FILTER
+    if ARGS.whitelist:
+        CONFIG.whitelist_active = True
+        CONFIG.whitelist_file = ARGS.whitelist
+    if ARGS.ignore:
+        CONFIG.ignore_file = ARGS.ignore
+    if CONFIG.whitelist_active or CONFIG.ignore_file:
+        try:
+            FILTER = RfxFilter(
+                allowed=read_keys(CONFIG.whitelist_file) if CONFIG.whitelist_active else None,
+                ignored=read_keys(CONFIG.ignore_file) if CONFIG.ignore_file else ())
+        except OSError as err:
+            log_me('error', 'Cannot read the filter file: %s', err)
+            sys.exit(1)
+        log_me('debug', 'Filter: %s allowed, %d ignored', \
+            'all' if FILTER.allowed is None else len(FILTER.allowed), len(FILTER.ignored))
+
     # ----------------------------------------------------------
     # DAEMON
     if CONFIG.daemon_active and ARGS.listen:
@@ -1399,12 +1131,12 @@ if __name__ == '__main__':
                 log_me('debug', 'PID file does not exists')
 
         else:
-            log_me('error', 'Command argument --pidfile missing. Line: ' + _line())
+            log_me('error', 'Command argument --pidfile missing.', line=True)
             sys.exit(1)
 
         log_me('debug', 'Check platform')
         if sys.platform == 'win32':
-            log_me('error', 'Daemonize not supported under Windows. Line: ' + _line())
+            log_me('error', 'Daemonize not supported under Windows.', line=True)
             sys.exit(1)
         else:
             log_me('debug', 'Platform: ' + sys.platform)
@@ -1415,7 +1147,7 @@ if __name__ == '__main__':
                 PID_FILE.write('pid')
                 PID_FILE.close()
             except IOError as err:
-                log_me('error', 'Line: ' + _line())
+                log_me('error', 'Unable to write PID file', line=True)
                 log_me('error', 'Unable to write PID file: %s [%d]' % (err.strerror, err.errno))
                 raise SystemExit('Unable to write PID file: %s [%d]' % (err.strerror, err.errno)) \
                     from err
@@ -1428,18 +1160,59 @@ if __name__ == '__main__':
 
     # ----------------------------------------------------------
     # SQLite
-    SqliteCmd(settings.DB_PATH).create_device_alerting_table()
-    SqliteCmd(settings.DB_PATH).create_lost_table()
-    SqliteCmd(settings.DB_PATH).create_myassets_table()
-    SqliteCmd(settings.DB_PATH).create_time_alerting_table()
+    # One session is kept for the life of the process
+    DB_PRAGMAS.update(getattr(settings, 'DB_PRAGMAS', dict()))
+    DB = SqliteCmd(settings.DB_PATH)
+    DB.create_device_alerting_table()
+    DB.create_lost_table()
+    DB.create_myassets_table()
+    DB.create_readings_table()
+    DB.create_asset_latest_table()
+    DB.create_time_alerting_table()
+    DB.create_registry_version_table()
+    REGISTRY = AssetRegistry(DB)
+    WRITER = SqliteWriter(
+        settings.DB_PATH,
+        batch_size=CONFIG.db_batch_size,
+        batch_interval=CONFIG.db_batch_interval,
+        queue_size=CONFIG.db_queue_size)
+    WRITER.start()
+    LOST = LostAssets(WRITER, flush_interval=CONFIG.lost_flush_interval)
+
+    # ----------------------------------------------------------
+    # Alerting
+    ALERTS = AlertDispatcher(
+        workers=CONFIG.alerting_workers,
+        queue_size=CONFIG.alerting_queue_size,
+        timeout=CONFIG.alerting_timeout,
+        timeouts=getattr(settings, 'ALERTING_TIMEOUTS', None),
+        max_hung=CONFIG.alerting_max_hung)
 
     # ----------------------------------------------------------
+    # Output
+    try:
+        OUTPUT = OutputSink(
+            CONFIG.output_file,
+            backup_count=CONFIG.output_backup_count,
+            buffer_size=CONFIG.output_buffer_size,
+            compress=CONFIG.output_compress,
+            flush_interval=CONFIG.output_flush_interval,
+            max_age=CONFIG.output_max_age,
+            max_bytes=CONFIG.output_max_bytes)
+    except OSError as err:
+        log_me('error', 'Cannot open output file, output only on stdout')
+        log_me('error', err)
+
+    # ----------------------------------------------------------
+    # REPLAY
+    if ARGS.replay:
+        option_replay(ARGS.replay)
+
     # LISTEN
-    if ARGS.listen:
+    elif ARGS.listen:
         option_listen()
 
-    log_me('debug', 'Exit 0')
-    sys.exit(0)
+    shutdown()
 
 # ------------------------------------------------------------------------------
 # END
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DomoTricks: Alert dispatcher
+
+Copyright 2021-2023 Nicolas Béguier
+
+This program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along
+with this program; if not, write to the Free Software Foundation, Inc.,
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+
+# Standard library
+from logging import getLogger
+from queue import Empty, Queue, Full
+from threading import Lock, Thread
+from time import monotonic
+
+# Debug
+# from pdb import set_trace as st
+
+LOGGER = getLogger('domotricks-rfxcmd')
+
+class AlertDispatcher:
+    """
+    Run alerting functions off the ingest thread
+    Calls are queued in a bounded queue consumed by a pool of worker threads.
+    A Python thread cannot be interrupted, so each call runs in its own
+    daemon thread which is abandoned, not killed, once its timeout is
+    reached: a hung SMTP server cannot stall a worker.
+    Once max_hung abandoned calls are still running, new calls are refused,
+    so that a hung endpoint cannot pile up threads (at most max_hung plus
+    one per worker).
+    """
+    _STOP = object()
+
+    def __init__(self, workers=2, queue_size=100, timeout=30, timeouts=None, max_hung=4):
+        self.queue = Queue(maxsize=queue_size)
+        self.timeout = timeout
+        # Function name -> timeout in seconds, overriding the default one
+        self.timeouts = timeouts or dict()
+        self.max_hung = max_hung
+        # Timed out calls still running
+        self.hung = list()
+        # Monotonic time after which queued calls are dropped, set by stop
+        self.deadline = None
+        self.lock = Lock()
+        # Counters
+        self.queued = 0
+        self.done = 0
+        self.dropped = 0
+        self.failed = 0
+        self.refused = 0
+        self.timed_out = 0
+        self.workers = list()
+        for number in range(workers):
+            worker = Thread(target=self._work, name=f'AlertDispatcher-{number}', daemon=True)
+            worker.start()
+            self.workers.append(worker)
+
+    def put(self, name, function, *args):
+        """
+        Queue an alerting function call, never blocks
+        Return False if the queue is full and the call is dropped
+        """
+        try:
+            self.queue.put_nowait((name, function, args))
+        except Full:
+            with self.lock:
+                self.dropped += 1
+            return False
+        self._count('queued')
+        return True
+
+    def _remaining(self):
+        """
+        Return the seconds left before the stop deadline, None if unset
+        """
+        if self.deadline is None:
+            return None
+        return max(self.deadline - monotonic(), 0)
+
+    def _drain(self):
+        """
+        Drop the queued calls, return the number of stop markers removed
+        """
+        stops = 0
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except Empty:
+                return stops
+            if item is self._STOP:
+                stops += 1
+            else:
+                self._count('dropped')
+
+    def _count(self, counter):
+        with self.lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _call(self, name, function, args):
+        try:
+            function(*args)
+        except Exception as err:
+            LOGGER.error('alerting function "%s" failed: %s', name, err)
+            self._count('failed')
+            return
+        self._count('done')
+
+    def _work(self):
+        while True:
+            item = self.queue.get()
+            if item is self._STOP:
+                break
+            name = item[0]
+            remaining = self._remaining()
+            if remaining == 0:
+                self._count('dropped')
+                continue
+            with self.lock:
+                self.hung = [call for call in self.hung if call.is_alive()]
+                hung = len(self.hung)
+            if hung >= self.max_hung:
+                LOGGER.error('alerting function "%s" refused, %d timed out calls still running', \
+                    name, hung)
+                self._count('refused')
+                continue
+            timeout = self.timeouts.get(name, self.timeout)
+            if remaining is not None:
+                timeout = min(timeout, remaining)
+            call = Thread(target=self._call, args=item, name=f'alerting-{name}', daemon=True)
+            call.start()
+            call.join(timeout)
+            if call.is_alive():
+                LOGGER.error('alerting function "%s" timed out after %.1fs', name, timeout)
+                with self.lock:
+                    self.hung.append(call)
+                    self.timed_out += 1
+
+    def stats(self):
+        """
+        Return the dispatcher counters
+        """
+        with self.lock:
+            return {
+                'pending': self.queue.qsize(),
+                'queued': self.queued,
+                'done': self.done,
+                'dropped': self.dropped,
+                'failed': self.failed,
+                'refused': self.refused,
+                'timed_out': self.timed_out,
+                'hung': len(self.hung),
+            }
+
+    def stop(self, timeout=None):
+        """
+        Run the queued calls and stop the workers
+        Calls still queued after timeout seconds are dropped.
+        """
+        if timeout is not None:
+            self.deadline = monotonic() + timeout
+        for _ in self.workers:
+            try:
+                self.queue.put(self._STOP, timeout=self._remaining())
+            except Full:
+                # The deadline is reached, the workers are only dropping calls
+                for _ in range(self._drain() + 1):
+                    self.queue.put_nowait(self._STOP)
+        for worker in self.workers:
+            worker.join(self._remaining())
+        self._drain()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DomoTricks: Lazy imports
+
+Copyright 2021-2023 Nicolas Béguier
+
+This program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along
+with this program; if not, write to the Free Software Foundation, Inc.,
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+# Standard library
+from importlib import import_module
+import sys
+from time import perf_counter
+
+# Debug
+# from pdb import set_trace as st
+
+# Module name -> seconds spent importing it, in import order
+IMPORT_TIMES = dict()
+
+def lazy_import(name):
+    """
+    Return a module, importing it on first use and recording its import time
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    start = perf_counter()
+    module = import_module(name)
+    IMPORT_TIMES[name] = perf_counter() - start
+    return module
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DomoTricks: Output sink
+
+Copyright 2021-2023 Nicolas Béguier
+
+This program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along
+with this program; if not, write to the Free Software Foundation, Inc.,
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+
+# Standard library
+import gzip
+from logging import getLogger
+import os
+import shutil
+from threading import Thread
+from time import monotonic
+
+# Debug
+# from pdb import set_trace as st
+
+LOGGER = getLogger('domotricks-rfxcmd')
+
+class OutputSink:
+    """
+    Long-lived, buffered line output file with size and age based rotation
+    Lines are flushed when the write buffer is full or every flush_interval
+    milliseconds. Rotated files are named <filename>.1 to .<backup_count>,
+    and gzipped in the background if compress is set.
+    """
+    def __init__(
+            self,
+            filename,
+            backup_count=5,
+            buffer_size=65536,
+            compress=False,
+            flush_interval=1000,
+            max_age=0,
+            max_bytes=10485760,
+        ):
+        self.filename = filename
+        self.backup_count = backup_count
+        self.buffer_size = buffer_size
+        self.compress = compress
+        self.flush_interval = flush_interval / 1000
+        # Rotation is disabled when set to 0
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.file = None
+        # Background compression of the last rotated file
+        self.compressor = None
+        self.size = 0
+        self.opened_at = 0
+        self.flushed_at = 0
+        self._open()
+
+    def _open(self):
+        self.file = open(self.filename, 'a', buffering=self.buffer_size)
+        self.size = self.file.tell()
+        self.opened_at = monotonic()
+        self.flushed_at = self.opened_at
+
+    def _backup_name(self, number):
+        name = f'{self.filename}.{number}'
+        if self.compress:
+            name += '.gz'
+        return name
+
+    def write(self, line):
+        """
+        Append a line to the buffer, rotating the file first if needed
+        """
+        if self.max_bytes and self.size >= self.max_bytes:
+            self.rotate()
+        elif self.max_age and monotonic() - self.opened_at >= self.max_age:
+            self.rotate()
+        self.file.write(line + '\n')
+        self.size += len(line) + 1
+        self.flush_if_due()
+
+    def flush_if_due(self):
+        """
+        Flush the buffer if flush_interval is elapsed
+        """
+        now = monotonic()
+        if now - self.flushed_at >= self.flush_interval:
+            self.file.flush()
+            self.flushed_at = now
+
+    def rotate(self):
+        """
+        Close the current file, shift the backups and reopen
+        """
+        self.file.close()
+        if self.compressor is not None:
+            self.compressor.join()
+            self.compressor = None
+        if self.backup_count:
+            for number in range(self.backup_count - 1, 0, -1):
+                if os.path.exists(self._backup_name(number)):
+                    os.replace(self._backup_name(number), self._backup_name(number + 1))
+            rotated = f'{self.filename}.1'
+            os.replace(self.filename, rotated)
+            if self.compress:
+                self.compressor = Thread(target=compress_file, args=(rotated,), daemon=True)
+                self.compressor.start()
+        else:
+            os.remove(self.filename)
+        self._open()
+
+    def close(self):
+        """
+        Flush and close the file
+        """
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        if self.compressor is not None:
+            self.compressor.join()
+            self.compressor = None
+
+def compress_file(filename):
+    """
+    Gzip filename into filename.gz and remove it
+    """
+    try:
+        with open(filename, 'rb') as source, gzip.open(filename + '.gz', 'wb') as target:
+            shutil.copyfileobj(source, target)
+        os.remove(filename)
+    except OSError as err:
+        LOGGER.error('Cannot compress %s: %s', filename, err)
@@ -25,30 +25,200 @@ with this program; if not, write to the Free Software Foundation, Inc.,
 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 """
 
+# Standard library
+from json import dumps
+from struct import Struct
+
 # DomoTricks libraries
-from lib.rfx_utils import ByteToHex, clearBit, testBit
+from lib.lazy_import import lazy_import
+
+# Big-endian integer fields of the RFXtrx packets
+UINT16 = Struct('>H')
+UINT32 = Struct('>I')
+
+# Packet type byte -> (valid lengths, decoder, decoder arguments)
+# Filled by the rfx_decode_0x* modules when their family is loaded
+PACKET_DECODERS = dict()
+
+# Packet type byte -> number of bytes, from message[4], making the Id of its
+# asset key, 0 when the key has no Id. Unknown layouts are not registered.
+ID_BYTES = dict()
+
+# Packet family (high nibble of the packet type) -> decoder module
+# A family is removed once its module is imported
+DECODER_MODULES = {
+    0x0: 'lib.rfx_decode_0x0',
+    0x1: 'lib.rfx_decode_0x1',
+    0x2: 'lib.rfx_decode_0x2',
+    0x3: 'lib.rfx_decode_0x3',
+    0x4: 'lib.rfx_decode_0x4',
+    0x5: 'lib.rfx_decode_0x5',
+    0x7: 'lib.rfx_decode_0x7',
+}
 
 # ----------------------------------------------------------------------------
 
-def decode_temperature(message_high, message_low):
+def register_packet(packettype, lengths, decoder=None, args=(), id_bytes=None):
     """
-    Decode temperature bytes.
+    Register a packet type.
+    lengths: tuple of valid message lengths, None to skip the check
+    decoder: decode function, None if the packet is only length checked
+    args: names of the packet fields given to the decoder, in order
+    id_bytes: number of bytes, from message[4], making the asset key Id
     """
-    temp_high = ByteToHex(message_high)
-    temp_low = ByteToHex(message_low)
-    polarity = testBit(int(temp_high, 16), 7)
+    PACKET_DECODERS[packettype] = (lengths, decoder, args)
+    if id_bytes is not None:
+        ID_BYTES[packettype] = id_bytes
 
-    if polarity == 128:
-        polarity_sign = '-'
-    else:
-        polarity_sign = ''
+def register(packettype, lengths, args, id_bytes=None):
+    """
+    Decorator registering a decode function for a packet type.
+    """
+    def wrapper(decoder):
+        register_packet(packettype, lengths, decoder=decoder, args=args, id_bytes=id_bytes)
+        return decoder
+    return wrapper
 
-    temp_high = clearBit(int(temp_high, 16), 7)
-    temp_high = temp_high << 8
-    temperature = (temp_high + int(temp_low, 16)) * 0.1
-    temperature_str = polarity_sign + str(temperature)
+def load_family(family):
+    """
+    Import the decoders of a packet family, once
+    """
+    module = DECODER_MODULES.pop(family, None)
+    if module is not None:
+        lazy_import(module)
 
-    return temperature_str
+def load_all():
+    """
+    Import the decoders of every packet family
+    """
+    for family in list(DECODER_MODULES):
+        load_family(family)
+
+def id_bytes(packettype):
+    """
+    Return the number of bytes making the asset key Id of a packet type,
+    None if its layout is unknown
+    The decoders of its family are imported on first use
+    """
+    lookup(packettype)
+    return ID_BYTES.get(packettype)
+
+def lookup(packettype):
+    """
+    Return (lengths, decoder, args) of a packet type, None if it is unknown
+    The decoders of its family are imported on first use
+    """
+    entry = PACKET_DECODERS.get(packettype)
+    if entry is None and packettype >> 4 in DECODER_MODULES:
+        load_family(packettype >> 4)
+        entry = PACKET_DECODERS.get(packettype)
+    return entry
+
+# ----------------------------------------------------------------------------
+
+class Measurement:
+    """
+    One decoded value of a packet.
+    field is the name of the value in the json/csv output, None to leave it out.
+    Item access mimics the {'key', 'value', 'unit'} dict stored in database.
+    """
+    __slots__ = ('key', 'value', 'unit', 'field')
+
+    def __init__(self, key, value, unit=None, field=None):
+        self.key = key
+        self.value = value
+        self.unit = unit
+        self.field = field
+
+    def __getitem__(self, name):
+        if name == 'key':
+            return self.key
+        if name == 'value':
+            return self.value
+        if name == 'unit' and self.unit is not None:
+            return self.unit
+        raise KeyError(name)
+
+    def __contains__(self, name):
+        return name in ('key', 'value') or (name == 'unit' and self.unit is not None)
+
+    def __repr__(self):
+        return f'Measurement({self.key!r}, {self.value!r}, {self.unit!r}, {self.field!r})'
+
+    def get(self, name, default=None):
+        """
+        Return the item name, or default
+        """
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def as_dict(self):
+        """
+        Return the measurement as stored in database
+        """
+        if self.unit is None:
+            return {'key': self.key, 'value': self.value}
+        return {'key': self.key, 'value': self.value, 'unit': self.unit}
+
+
+class Reading:
+    """
+    A decoded packet, built once and shared by printing, output,
+    database and alerting.
+    """
+    __slots__ = ('key', 'timestamp', 'rawcmd', 'packettype', 'packettype_id',
+                 'subtype', 'seqnbr', 'measurements', '_payload')
+
+    def __init__(self, timestamp, rawcmd, packettype, packettype_id, subtype, seqnbr,
+                 measurements):
+        self.timestamp = timestamp
+        self.rawcmd = rawcmd
+        self.packettype = packettype
+        self.packettype_id = packettype_id
+        self.subtype = subtype
+        self.seqnbr = seqnbr
+        self.measurements = measurements
+        self._payload = None
+
+        # Asset key is packettype_subtype[_id][_unitcode]
+        sensor_id = unitcode = None
+        for measurement in measurements:
+            if measurement.key == 'Id':
+                sensor_id = measurement.value
+            elif measurement.key == 'Unitcode':
+                unitcode = measurement.value
+        self.key = f'{packettype_id}_{subtype}'
+        if sensor_id is not None:
+            self.key += f'_{sensor_id}'
+        if unitcode is not None:
+            self.key += f'_{unitcode}'
+
+    def fields(self):
+        """
+        Return the output fields of the measurements
+        """
+        return {m.field: m.value for m in self.measurements if m.field is not None}
+
+    def payload(self):
+        """
+        Return the measurements serialized as stored in database, computed once
+        """
+        if self._payload is None:
+            self._payload = dumps(self.measurements, default=Measurement.as_dict)
+        return self._payload
+
+# ----------------------------------------------------------------------------
+
+def decode_temperature(message_high, message_low):
+    """
+    Decode temperature bytes, in °C with 0.1 precision.
+    """
+    temperature = round(((message_high & 0x7f) << 8 | message_low) * 0.1, 1)
+    if message_high & 0x80:
+        return -temperature
+    return temperature
 
 # ----------------------------------------------------------------------------
 
@@ -56,8 +226,7 @@ def decode_signal(message):
     """
     Decode signal byte.
     """
-    signal = int(ByteToHex(message), 16) >> 4
-    return signal
+    return message >> 4
 
 # ----------------------------------------------------------------------------
 
@@ -65,8 +234,7 @@ def decode_battery(message):
     """
     Decode battery byte.
     """
-    battery = int(ByteToHex(message), 16) & 0xf
-    return battery
+    return message & 0xf
 
 # ----------------------------------------------------------------------------
 
@@ -74,17 +242,6 @@ def decode_power(message_1, message_2, message_3):
     """
     Decode power bytes.
     """
-    power_1 = ByteToHex(message_1)
-    power_2 = ByteToHex(message_2)
-    power_3 = ByteToHex(message_3)
-
-    power_1 = int(power_1, 16)
-    power_1 = power_1 << 16
-    power_2 = int(power_2, 16) << 8
-    power_3 = int(power_3, 16)
-    power = (power_1 + power_2 + power_3)
-    power_str = str(power)
-
-    return power_str
+    return message_1 << 16 | message_2 << 8 | message_3
 
 # ----------------------------------------------------------------------------
@@ -27,12 +27,22 @@ with this program; if not, write to the Free Software Foundation, Inc.,
 from string import whitespace
 
 # DomoTricks libraries
-import lib.rfx_sensors
 from lib.rfx_utils import ByteToHex, testBit
+import lib.rfx_decode as rfxdecode
+from lib.rfx_decode import Measurement
+from lib.rfx_sensors import RFX
 
-RFX = lib.rfx_sensors.rfx_data()
 
+@rfxdecode.register(0x00, (14,), ())
+def decode_0x00():
+    """
+    0x00 - Interface Control, nothing to decode
+    """
+    return list()
+
+# ----------------------------------------------------------------------------
 
+@rfxdecode.register(0x01, (14, 21), ('message',))
 def decode_0x01(message):
     """
     0x01 - Interface Message
@@ -59,141 +69,141 @@ def decode_0x01(message):
 
     # Subtype
     if data['subtype'] == '00':
-        result.append({'key': 'Subtype', 'value': 'Interface response'})
+        result.append(Measurement('Subtype', 'Interface response'))
     else:
-        result.append({'key': 'Subtype', 'value': 'Unknown type (' + data['packettype'] + ')'})
+        result.append(Measurement('Subtype', 'Unknown type (' + data['packettype'] + ')'))
 
     # Seq
-    result.append({'key': 'Sequence number', 'value': data['seqnbr']})
+    result.append(Measurement('Sequence number', data['seqnbr']))
 
     # Command
     try:
-        result.append({'key': 'Response on command', 'value': RFX.rfx_cmnd[data['cmnd']]})
+        result.append(Measurement('Response on command', RFX.rfx_cmnd[message[4]]))
     except KeyError:
-        result.append({'key': 'Response on command', 'value': 'Invalid'})
+        result.append(Measurement('Response on command', 'Invalid'))
 
     # MSG 1
     try:
-        result.append({'key': 'Transceiver type', 'value': RFX.rfx_subtype_01_msg1[data['msg1']]})
+        result.append(Measurement('Transceiver type', RFX.rfx_subtype_01_msg1[message[5]]))
     except KeyError:
-        result.append({'key': 'Transceiver type', 'value': 'Invalid'})
+        result.append(Measurement('Transceiver type', 'Invalid'))
 
     # MSG 2
-    result.append({'key': 'Firmware version', 'value': int(data['msg2'], 16)})
+    result.append(Measurement('Firmware version', int(data['msg2'], 16)))
 
     protocols = list()
 
     # ------------------------------------------------------
     # MSG 3
 
-    protocols.append({
-        'key': RFX.rfx_subtype_01_msg3['128'],
-        'value': bool(testBit(int(data['msg3'], 16), 7) == 128)})
-    protocols.append({
-        'key': RFX.rfx_subtype_01_msg3['64'],
-        'value': bool(testBit(int(data['msg3'], 16), 6) == 128)})
-    protocols.append({
-        'key': RFX.rfx_subtype_01_msg3['32'],
-        'value': bool(testBit(int(data['msg3'], 16), 5) == 128)})
-    protocols.append({
-        'key': RFX.rfx_subtype_01_msg3['16'],
-        'value': bool(testBit(int(data['msg3'], 16), 4) == 128)})
-    protocols.append({
-        'key': RFX.rfx_subtype_01_msg3['8'],
-        'value': bool(testBit(int(data['msg3'], 16), 3) == 128)})
-    protocols.append({
-        'key': RFX.rfx_subtype_01_msg3['4'],
-        'value': bool(testBit(int(data['msg3'], 16), 2) == 128)})
-    protocols.append({
-        'key': RFX.rfx_subtype_01_msg3['2'],
-        'value': bool(testBit(int(data['msg3'], 16), 1) == 128)})
-    protocols.append({
-        'key': RFX.rfx_subtype_01_msg3['1'],
-        'value': bool(testBit(int(data['msg3'], 16), 0) == 128)})
+    protocols.append(Measurement(
+        RFX.rfx_subtype_01_msg3[128],
+        bool(testBit(int(data['msg3'], 16), 7) == 128)))
+    protocols.append(Measurement(
+        RFX.rfx_subtype_01_msg3[64],
+        bool(testBit(int(data['msg3'], 16), 6) == 128)))
+    protocols.append(Measurement(
+        RFX.rfx_subtype_01_msg3[32],
+        bool(testBit(int(data['msg3'], 16), 5) == 128)))
+    protocols.append(Measurement(
+        RFX.rfx_subtype_01_msg3[16],
+        bool(testBit(int(data['msg3'], 16), 4) == 128)))
+    protocols.append(Measurement(
+        RFX.rfx_subtype_01_msg3[8],
+        bool(testBit(int(data['msg3'], 16), 3) == 128)))
+    protocols.append(Measurement(
+        RFX.rfx_subtype_01_msg3[4],
+        bool(testBit(int(data['msg3'], 16), 2) == 128)))
+    protocols.append(Measurement(
+        RFX.rfx_subtype_01_msg3[2],
+        bool(testBit(int(data['msg3'], 16), 1) == 128)))
+    protocols.append(Measurement(
+        RFX.rfx_subtype_01_msg3[1],
+        bool(testBit(int(data['msg3'], 16), 0) == 128)))
 
     # # ------------------------------------------------------
     # # MSG 4
 
-    protocols.append({
-        'key': RFX.rfx_subtype_01_msg4['128'],
-        'value': bool(testBit(int(data['msg4'], 16), 7) == 128)})
-    protocols.append({
-        'key': RFX.rfx_subtype_01_msg4['64'],
-        'value': bool(testBit(int(data['msg4'], 16), 6) == 128)})
-    protocols.append({
-        'key': RFX.rfx_subtype_01_msg4['32'],
-        'value': bool(testBit(int(data['msg4'], 16), 5) == 128)})
-    protocols.append({
-        'key': RFX.rfx_subtype_01_msg4['16'],
-        'value': bool(testBit(int(data['msg4'], 16), 4) == 128)})
-    protocols.append({
-        'key': RFX.rfx_subtype_01_msg4['8'],
-        'value': bool(testBit(int(data['msg4'], 16), 3) == 128)})
-    protocols.append({
-        'key': RFX.rfx_subtype_01_msg4['4'],
-        'value': bool(testBit(int(data['msg4'], 16), 2) == 128)})
-    protocols.append({
-        'key': RFX.rfx_subtype_01_msg4['2'],
-        'value': bool(testBit(int(data['msg4'], 16), 1) == 128)})
-    protocols.append({
-        'key': RFX.rfx_subtype_01_msg4['1'],
-        'value': bool(testBit(int(data['msg4'], 16), 0) == 128)})
+    protocols.append(Measurement(
+        RFX.rfx_subtype_01_msg4[128],
+        bool(testBit(int(data['msg4'], 16), 7) == 128)))
+    protocols.append(Measurement(
+        RFX.rfx_subtype_01_msg4[64],
+        bool(testBit(int(data['msg4'], 16), 6) == 128)))
+    protocols.append(Measurement(
+        RFX.rfx_subtype_01_msg4[32],
+        bool(testBit(int(data['msg4'], 16), 5) == 128)))
+    protocols.append(Measurement(
+        RFX.rfx_subtype_01_msg4[16],
+        bool(testBit(int(data['msg4'], 16), 4) == 128)))
+    protocols.append(Measurement(
+        RFX.rfx_subtype_01_msg4[8],
+        bool(testBit(int(data['msg4'], 16), 3) == 128)))
+    protocols.append(Measurement(
+        RFX.rfx_subtype_01_msg4[4],
+        bool(testBit(int(data['msg4'], 16), 2) == 128)))
+    protocols.append(Measurement(
+        RFX.rfx_subtype_01_msg4[2],
+        bool(testBit(int(data['msg4'], 16), 1) == 128)))
+    protocols.append(Measurement(
+        RFX.rfx_subtype_01_msg4[1],
+        bool(testBit(int(data['msg4'], 16), 0) == 128)))
 
     # # ------------------------------------------------------
     # # MSG 5
 
-    protocols.append({
-        'key': RFX.rfx_subtype_01_msg5['128'],
-        'value': bool(testBit(int(data['msg5'], 16), 7) == 128)})
-    protocols.append({
-        'key': RFX.rfx_subtype_01_msg5['64'],
-        'value': bool(testBit(int(data['msg5'], 16), 6) == 128)})
-    protocols.append({
-        'key': RFX.rfx_subtype_01_msg5['32'],
-        'value': bool(testBit(int(data['msg5'], 16), 5) == 128)})
-    protocols.append({
-        'key': RFX.rfx_subtype_01_msg5['16'],
-        'value': bool(testBit(int(data['msg5'], 16), 4) == 128)})
-    protocols.append({
-        'key': RFX.rfx_subtype_01_msg5['8'],
-        'value': bool(testBit(int(data['msg5'], 16), 3) == 128)})
-    protocols.append({
-        'key': RFX.rfx_subtype_01_msg5['4'],
-        'value': bool(testBit(int(data['msg5'], 16), 2) == 128)})
-    protocols.append({
-        'key': RFX.rfx_subtype_01_msg5['2'],
-        'value': bool(testBit(int(data['msg5'], 16), 1) == 128)})
-    protocols.append({
-        'key': RFX.rfx_subtype_01_msg5['1'],
-        'value': bool(testBit(int(data['msg5'], 16), 0) == 128)})
-
-    result.append({'key': 'Protocols', 'value': protocols})
-
-    return result, dict()
+    protocols.append(Measurement(
+        RFX.rfx_subtype_01_msg5[128],
+        bool(testBit(int(data['msg5'], 16), 7) == 128)))
+    protocols.append(Measurement(
+        RFX.rfx_subtype_01_msg5[64],
+        bool(testBit(int(data['msg5'], 16), 6) == 128)))
+    protocols.append(Measurement(
+        RFX.rfx_subtype_01_msg5[32],
+        bool(testBit(int(data['msg5'], 16), 5) == 128)))
+    protocols.append(Measurement(
+        RFX.rfx_subtype_01_msg5[16],
+        bool(testBit(int(data['msg5'], 16), 4) == 128)))
+    protocols.append(Measurement(
+        RFX.rfx_subtype_01_msg5[8],
+        bool(testBit(int(data['msg5'], 16), 3) == 128)))
+    protocols.append(Measurement(
+        RFX.rfx_subtype_01_msg5[4],
+        bool(testBit(int(data['msg5'], 16), 2) == 128)))
+    protocols.append(Measurement(
+        RFX.rfx_subtype_01_msg5[2],
+        bool(testBit(int(data['msg5'], 16), 1) == 128)))
+    protocols.append(Measurement(
+        RFX.rfx_subtype_01_msg5[1],
+        bool(testBit(int(data['msg5'], 16), 0) == 128)))
+
+    result.append(Measurement('Protocols', protocols))
+
+    return result
 
 # ----------------------------------------------------------------------------
 
-def decode_0x02(subtype, seqnbr, id1):
+@rfxdecode.register(0x02, (5,), ('message', 'subtype', 'seqnbr', 'id1'))
+def decode_0x02(message, subtype, seqnbr, id1):
     """
     0x02 - Receiver/Transmitter Message
     """
 
     result = list()
 
-    result.append({'key': 'Subtype', 'value': RFX.rfx_subtype_02[subtype]})
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Subtype', RFX.rfx_subtype_02[message[2]]))
+    result.append(Measurement('Sequence number', seqnbr))
 
-    if subtype == '01':
-        result.append({'key': 'Message', 'value': RFX.rfx_subtype_02_msg1[id1]})
+    if subtype != '00':
+        result.append(Measurement('Id1', id1, None, 'id1'))
 
-    if subtype == '00':
-        output_extra = []
-    else:
-        output_extra = [('id1', id1)]
+    if subtype == '01':
+        result.append(Measurement('Message', RFX.rfx_subtype_02_msg1[message[4]]))
 
-    return result, output_extra
+    return result
 
 
+@rfxdecode.register(0x03, None, ('message', 'subtype', 'seqnbr'))
 def decode_0x03(message, subtype, seqnbr):
     """
     0x03 - Undecoded Message
@@ -201,14 +211,14 @@ def decode_0x03(message, subtype, seqnbr):
 
     result = list()
 
-    result.append({'key': 'Subtype', 'value': RFX.rfx_subtype_03[subtype]})
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Subtype', RFX.rfx_subtype_03[message[2]]))
+    result.append(Measurement('Sequence number', seqnbr))
 
     indata = ByteToHex(message)
     # remove all spaces
     for i in whitespace:
         indata = indata.replace(i, "")
     indata = indata[4:]
-    result.append({'key': 'Message', 'value': indata})
+    result.append(Measurement('Message', indata, None, 'message'))
 
-    return result, [('message', indata)]
+    return result
@@ -24,12 +24,12 @@ with this program; if not, write to the Free Software Foundation, Inc.,
 """
 
 # DomoTricks libraries
-import lib.rfx_sensors
 from lib.rfx_utils import ByteToHex, dec2bin, testBit
 import lib.rfx_decode as rfxdecode
+from lib.rfx_decode import Measurement
+from lib.rfx_sensors import RFX
 
-RFX = lib.rfx_sensors.rfx_data()
-
+@rfxdecode.register(0x10, (8,), ('message', 'subtype', 'seqnbr'), id_bytes=4)
 def decode_0x10(message, subtype, seqnbr):
     """
     0x10 Lighting1
@@ -38,43 +38,38 @@ def decode_0x10(message, subtype, seqnbr):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_10[subtype]
+        display_subtype = RFX.rfx_subtype_10[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
     sensor_id = ByteToHex(message[4]) + ByteToHex(message[5]) + \
         ByteToHex(message[6]) + ByteToHex(message[7])
-    result.append({'key': 'Id', 'value': sensor_id})
+    result.append(Measurement('Id', sensor_id))
 
     try:
-        housecode = RFX.rfx_subtype_10_housecode[ByteToHex(message[4])]
+        housecode = RFX.rfx_subtype_10_housecode[message[4]]
     except KeyError:
         housecode = '0x' + ByteToHex(message[4])
-    result.append({'key': 'Housecode', 'value': housecode})
+    result.append(Measurement('Housecode', housecode, None, 'housecode'))
 
-    unitcode = int(ByteToHex(message[5]), 16)
-    result.append({'key': 'Unitcode', 'value': unitcode})
+    unitcode = message[5]
+    result.append(Measurement('Unitcode', unitcode, None, 'unitcode'))
 
     try:
-        command = RFX.rfx_subtype_10_cmnd[ByteToHex(message[6])]
+        command = RFX.rfx_subtype_10_cmnd[message[6]]
     except KeyError:
         command = '0x' + ByteToHex(message[6])
-    result.append({'key': 'Command', 'value': command})
+    result.append(Measurement('Command', command, None, 'command'))
 
     signal = rfxdecode.decode_signal(message[7])
-    result.append({'key': 'Signal level', 'value': signal})
-
-    output_extra = [
-        ('signal_level', signal),
-        ('housecode', housecode),
-        ('command', command),
-        ('unitcode', unitcode)]
+    result.append(Measurement('Signal level', signal, None, 'signal_level'))
 
-    return result, output_extra
+    return result
 
+@rfxdecode.register(0x11, (12,), ('message', 'subtype', 'seqnbr'), id_bytes=4)
 def decode_0x11(message, subtype, seqnbr):
     """
     0x11 Lighting2
@@ -83,45 +78,39 @@ def decode_0x11(message, subtype, seqnbr):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_11[subtype]
+        display_subtype = RFX.rfx_subtype_11[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
     sensor_id = ByteToHex(message[4]) + ByteToHex(message[5]) + \
         ByteToHex(message[6]) + ByteToHex(message[7])
-    result.append({'key': 'Id', 'value': sensor_id})
+    result.append(Measurement('Id', sensor_id, None, 'id'))
 
-    unitcode = int(ByteToHex(message[8]), 16)
-    result.append({'key': 'Unitcode', 'value': unitcode})
+    unitcode = message[8]
+    result.append(Measurement('Unitcode', unitcode, None, 'unitcode'))
 
     try:
-        command = RFX.rfx_subtype_11_cmnd[ByteToHex(message[9])]
+        command = RFX.rfx_subtype_11_cmnd[message[9]]
     except KeyError:
         command = '0x' + ByteToHex(message[9])
-    result.append({'key': 'Command', 'value': command})
+    result.append(Measurement('Command', command, None, 'command'))
 
     try:
-        dimlevel = RFX.rfx_subtype_11_dimlevel[ByteToHex(message[10])]
+        dimlevel = RFX.rfx_subtype_11_dimlevel[message[10]]
     except KeyError:
         dimlevel = '0x' + ByteToHex(message[10])
-    result.append({'key': 'Dim level', 'value': dimlevel, 'unit': '%'})
+    result.append(Measurement('Dim level', dimlevel, '%', 'dim_level'))
 
     signal = rfxdecode.decode_signal(message[11])
-    result.append({'key': 'Signal level', 'value': signal})
-
-    output_extra = [
-        ('signal_level', signal),
-        ('id', sensor_id),
-        ('command', command),
-        ('unitcode', unitcode),
-        ('dim_level', dimlevel)]
+    result.append(Measurement('Signal level', signal, None, 'signal_level'))
 
-    return result, output_extra
+    return result
 
 
+@rfxdecode.register(0x12, (9,), ('message', 'subtype', 'seqnbr'), id_bytes=0)
 def decode_0x12(message, subtype, seqnbr):
     """
     0x12 Lighting3
@@ -130,62 +119,56 @@ def decode_0x12(message, subtype, seqnbr):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_12[subtype]
+        display_subtype = RFX.rfx_subtype_12[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
     system = ByteToHex(message[4])
-    result.append({'System': 'Command', 'value': system})
+    result.append(Measurement('System', system, None, 'system'))
 
-    if testBit(int(ByteToHex(message[5]), 16), 0) == 1:
+    if testBit(message[5], 0) == 1:
         channel = 1
-    elif testBit(int(ByteToHex(message[5]), 16), 1) == 2:
+    elif testBit(message[5], 1) == 2:
         channel = 2
-    elif testBit(int(ByteToHex(message[5]), 16), 2) == 4:
+    elif testBit(message[5], 2) == 4:
         channel = 3
-    elif testBit(int(ByteToHex(message[5]), 16), 3) == 8:
+    elif testBit(message[5], 3) == 8:
         channel = 4
-    elif testBit(int(ByteToHex(message[5]), 16), 4) == 16:
+    elif testBit(message[5], 4) == 16:
         channel = 5
-    elif testBit(int(ByteToHex(message[5]), 16), 5) == 32:
+    elif testBit(message[5], 5) == 32:
         channel = 6
-    elif testBit(int(ByteToHex(message[5]), 16), 6) == 64:
+    elif testBit(message[5], 6) == 64:
         channel = 7
-    elif testBit(int(ByteToHex(message[5]), 16), 7) == 128:
+    elif testBit(message[5], 7) == 128:
         channel = 8
-    elif testBit(int(ByteToHex(message[6]), 16), 0) == 1:
+    elif testBit(message[6], 0) == 1:
         channel = 9
-    elif testBit(int(ByteToHex(message[6]), 16), 1) == 2:
+    elif testBit(message[6], 1) == 2:
         channel = 10
     else:
         channel = 255
-    result.append({'key': 'Channel', 'value': channel})
+    result.append(Measurement('Channel', channel, None, 'channel'))
 
     try:
-        command = RFX.rfx_subtype_12_cmnd[ByteToHex(message[7])]
+        command = RFX.rfx_subtype_12_cmnd[message[7]]
     except KeyError:
         command = '0x' + ByteToHex(message[7])
-    result.append({'key': 'Command', 'value': command})
+    result.append(Measurement('Command', command, None, 'command'))
 
     battery = rfxdecode.decode_battery(message[8])
-    result.append({'key': 'Battery', 'value': battery})
+    result.append(Measurement('Battery', battery, None, 'battery'))
 
     signal = rfxdecode.decode_signal(message[8])
-    result.append({'key': 'Signal level', 'value': signal})
+    result.append(Measurement('Signal level', signal, None, 'signal'))
 
-    output_extra = [
-        ('battery', battery),
-        ('signal', signal),
-        ('system', system),
-        ('command', command),
-        ('channel', channel)]
-
-    return result, output_extra
+    return result
 
 
+@rfxdecode.register(0x13, (10,), ('message', 'subtype', 'seqnbr'), id_bytes=0)
 def decode_0x13(message, subtype, seqnbr):
     """
     0x13 Lighting4
@@ -194,36 +177,31 @@ def decode_0x13(message, subtype, seqnbr):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_13[subtype]
+        display_subtype = RFX.rfx_subtype_13[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
     code = ByteToHex(message[4]) + ByteToHex(message[5]) + ByteToHex(message[6])
-    result.append({'key': 'Code', 'value': code})
+    result.append(Measurement('Code', code, None, 'code'))
 
-    code1 = dec2bin(int(ByteToHex(message[4]), 16))
-    code2 = dec2bin(int(ByteToHex(message[5]), 16))
-    code3 = dec2bin(int(ByteToHex(message[6]), 16))
+    code1 = dec2bin(message[4])
+    code2 = dec2bin(message[5])
+    code3 = dec2bin(message[6])
     code_bin = code1 + " " + code2 + " " + code3
-    result.append({'key': 'S1-S24', 'value': code_bin})
+    result.append(Measurement('S1-S24', code_bin, None, 's1_s24'))
 
-    pulse = ((int(ByteToHex(message[7]), 16) * 256) + int(ByteToHex(message[8]), 16))
-    result.append({'key': 'Code', 'value': pulse, 'unit': 'usec'})
+    pulse = ((message[7] * 256) + message[8])
+    result.append(Measurement('Code', pulse, 'usec', 'pulse'))
 
     signal = rfxdecode.decode_signal(message[9])
-    result.append({'key': 'Signal level', 'value': signal})
-
-    output_extra = [
-        ('code', code),
-        ('s1_s24', code_bin),
-        ('pulse', pulse),
-        ('signal', signal)]
+    result.append(Measurement('Signal level', signal, None, 'signal'))
 
-    return result, output_extra
+    return result
 
+@rfxdecode.register(0x14, (11,), ('message', 'subtype', 'seqnbr', 'id1', 'id2'), id_bytes=3)
 def decode_0x14(message, subtype, seqnbr, id1, id2):
     """
     0x14 Lighting5
@@ -232,68 +210,62 @@ def decode_0x14(message, subtype, seqnbr, id1, id2):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_14[subtype]
+        display_subtype = RFX.rfx_subtype_14[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
     sensor_id = id1 + id2 + ByteToHex(message[6])
-    result.append({'key': 'Id', 'value': sensor_id})
+    result.append(Measurement('Id', sensor_id, None, 'id'))
 
     command_hex = ByteToHex(message[8])
     level = 0
     unitcode = 'Not used'
     try:
         if subtype == '00':
-            command = RFX.rfx_subtype_14_cmnd0[command_hex]
-            unitcode = int(ByteToHex(message[7]), 16)
+            command = RFX.rfx_subtype_14_cmnd0[message[8]]
+            unitcode = message[7]
             level = ByteToHex(message[9])
         elif subtype == '01':
-            command = RFX.rfx_subtype_14_cmnd1[command_hex]
-            unitcode = int(ByteToHex(message[7]), 16)
+            command = RFX.rfx_subtype_14_cmnd1[message[8]]
+            unitcode = message[7]
         elif subtype == '02':
-            command = RFX.rfx_subtype_14_cmnd2[command_hex]
-            unitcode = int(ByteToHex(message[7]), 16)
+            command = RFX.rfx_subtype_14_cmnd2[message[8]]
+            unitcode = message[7]
         elif subtype == '03':
-            command = RFX.rfx_subtype_14_cmnd3[command_hex]
+            command = RFX.rfx_subtype_14_cmnd3[message[8]]
         elif subtype == '04':
-            command = RFX.rfx_subtype_14_cmnd4[command_hex]
-            unitcode = int(ByteToHex(message[7]), 16)
+            command = RFX.rfx_subtype_14_cmnd4[message[8]]
+            unitcode = message[7]
         elif subtype == '05':
-            command = RFX.rfx_subtype_14_cmnd5[command_hex]
+            command = RFX.rfx_subtype_14_cmnd5[message[8]]
         elif subtype == '06':
-            unitcode = int(ByteToHex(message[7]), 16)
+            unitcode = message[7]
             try:
-                command = RFX.rfx_subtype_14_cmnd5[command_hex]
+                command = RFX.rfx_subtype_14_cmnd5[message[8]]
             except KeyError:
                 # if the value is between x06 and x84 it is 'select color'
                 # This should be improved, as it will not catch unknown values
                 command = 'Select Color'
         elif subtype == '11':
-            unitcode = int(ByteToHex(message[7]), 16)
-            command = RFX.rfx_subtype_14_cmnd11[command_hex]
+            unitcode = message[7]
+            command = RFX.rfx_subtype_14_cmnd11[message[8]]
         else:
             command = '0x' + command_hex
     except KeyError:
         command = '0x' + command_hex
-    result.append({'key': 'Command', 'value': command})
-    result.append({'key': 'Level', 'value': level})
-    result.append({'key': 'Unitcode', 'value': unitcode})
+    result.append(Measurement('Command', command, None, 'command'))
+    result.append(Measurement('Level', level, None, 'level'))
+    result.append(Measurement('Unitcode', unitcode, None, 'unitcode'))
 
     signal = rfxdecode.decode_signal(message[10])
-    result.append({'key': 'Signal level', 'value': signal})
+    result.append(Measurement('Signal level', signal, None, 'signal_level'))
 
-    output_extra = [
-        ('id', sensor_id),
-        ('unitcode', unitcode),
-        ('command', command),
-        ('level', level),
-        ('signal_level', signal)]
-
-    return result, output_extra
+    return result
 
+@rfxdecode.register(0x15, (12,), ('message', 'subtype', 'seqnbr', 'id1', 'id2'), id_bytes=2)
 def decode_0x15(message, subtype, seqnbr, id1, id2):
     """
     0x15 Lighting6
@@ -303,52 +275,44 @@ def decode_0x15(message, subtype, seqnbr, id1, id2):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_15[subtype]
+        display_subtype = RFX.rfx_subtype_15[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
     sensor_id = id1 + id2
-    result.append({'key': 'Id', 'value': sensor_id})
+    result.append(Measurement('Id', sensor_id, None, 'id'))
 
     try:
-        groupcode = RFX.rfx_subtype_15_groupcode[ByteToHex(message[6])]
+        groupcode = RFX.rfx_subtype_15_groupcode[message[6]]
     except KeyError:
         groupcode = '0x' + ByteToHex(message[6])
-    result.append({'key': 'Groupcode', 'value': groupcode})
+    result.append(Measurement('Groupcode', groupcode, None, 'groupcode'))
 
-    unitcode = int(ByteToHex(message[7]), 16)
-    result.append({'key': 'Unitcode', 'value': unitcode})
+    unitcode = message[7]
+    result.append(Measurement('Unitcode', unitcode, None, 'unitcode'))
 
     try:
-        command = RFX.rfx_subtype_15_cmnd[ByteToHex(message[8])]
+        command = RFX.rfx_subtype_15_cmnd[message[8]]
     except KeyError:
         command = '0x' + ByteToHex(message[8])
-    result.append({'key': 'Command', 'value': command})
+    result.append(Measurement('Command', command, None, 'command'))
 
     command_seqnbr = ByteToHex(message[9])
-    result.append({'key': 'Command seqnbr', 'value': command_seqnbr})
+    result.append(Measurement('Command seqnbr', command_seqnbr, None, 'command_seqnbr'))
 
     seqnbr2 = ByteToHex(message[10])
-    result.append({'key': 'Seqnbr2', 'value': seqnbr2})
+    result.append(Measurement('Seqnbr2', seqnbr2, None, 'seqnbr'))
 
     signal = rfxdecode.decode_signal(message[11])
-    result.append({'key': 'Signal level', 'value': signal})
-
-    output_extra = [
-        ('id', sensor_id),
-        ('signal_level', signal),
-        ('groupcode', groupcode),
-        ('command', command),
-        ('unitcode', unitcode),
-        ('seqnbr', seqnbr2),
-        ('command_seqnbr', command_seqnbr)]
+    result.append(Measurement('Signal level', signal, None, 'signal_level'))
 
-    return result, output_extra
+    return result
 
 
+@rfxdecode.register(0x16, (8,), ('message', 'subtype', 'seqnbr', 'id1', 'id2'), id_bytes=2)
 def decode_0x16(message, subtype, seqnbr, id1, id2):
     """
     0x16 Chime
@@ -357,39 +321,35 @@ def decode_0x16(message, subtype, seqnbr, id1, id2):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_16[subtype]
+        display_subtype = RFX.rfx_subtype_16[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
     sensor_id = id1 + id2
-    result.append({'key': 'Id', 'value': sensor_id})
+    result.append(Measurement('Id', sensor_id, None, 'id'))
 
     if subtype == '00':
         try:
-            sound = RFX.rfx_subtype_16_sound[ByteToHex(message[6])]
+            sound = RFX.rfx_subtype_16_sound[message[6]]
         except KeyError:
             sound = '0x' + ByteToHex(message[6])
     elif subtype == '02' or subtype == '03' or subtype == '04':
         sound = None
     else:
         sound = '0x' + ByteToHex(message[6])
-    result.append({'key': 'Sound', 'value': sound})
+    result.append(Measurement('Sound', sound, None, 'sound'))
 
     signal = rfxdecode.decode_signal(message[7])
-    result.append({'key': 'Signal level', 'value': signal})
+    result.append(Measurement('Signal level', signal, None, 'signal_level'))
 
-    output_extra = [
-        ('id', sensor_id),
-        ('sound', sound),
-        ('signal_level', signal)]
+    return result
 
-    return result, output_extra
 
-
-def decode_0x17(subtype, seqnbr):
+@rfxdecode.register(0x17, (8,), ('message', 'subtype', 'seqnbr'), id_bytes=0)
+def decode_0x17(message, subtype, seqnbr):
     """
     0x17 Fan (Transmitter only)
     """
@@ -397,17 +357,18 @@ def decode_0x17(subtype, seqnbr):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_17[subtype]
+        display_subtype = RFX.rfx_subtype_17[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
-    return result, []
+    return result
 
 
-def decode_0x18(subtype, seqnbr):
+@rfxdecode.register(0x18, (8,), ('message', 'subtype', 'seqnbr'), id_bytes=0)
+def decode_0x18(message, subtype, seqnbr):
     """
     0x18 Curtain1 (Transmitter only)
     """
@@ -415,17 +376,18 @@ def decode_0x18(subtype, seqnbr):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_18[subtype]
+        display_subtype = RFX.rfx_subtype_18[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
-    return result, []
+    return result
 
 
-def decode_0x19(subtype, seqnbr):
+@rfxdecode.register(0x19, (10,), ('message', 'subtype', 'seqnbr'), id_bytes=0)
+def decode_0x19(message, subtype, seqnbr):
     """
     0x19 Blinds1
     """
@@ -433,16 +395,17 @@ def decode_0x19(subtype, seqnbr):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_19[subtype]
+        display_subtype = RFX.rfx_subtype_19[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
-    return result, []
+    return result
 
 
+@rfxdecode.register(0x1A, (13,), ('message', 'subtype', 'seqnbr', 'id1', 'id2'), id_bytes=0)
 def decode_0x1a(message, subtype, seqnbr, id1, id2):
     """
     0x11 RTS
@@ -451,35 +414,29 @@ def decode_0x1a(message, subtype, seqnbr, id1, id2):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_1A[subtype]
+        display_subtype = RFX.rfx_subtype_1A[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
     sensor_id = id1 + id2 + ByteToHex(message[6])
-    result.append({'key': 'Id1-3', 'value': sensor_id})
+    result.append(Measurement('Id1-3', sensor_id, None, 'id'))
 
     if subtype == '00' and ByteToHex(message[6]) == '00':
         unitcode = 'All'
     else:
         unitcode = '0x' + ByteToHex(message[6])
-    result.append({'key': 'Unitcode', 'value': unitcode})
+    result.append(Measurement('Unitcode', unitcode, None, 'unicode'))
 
     try:
-        command = RFX.rfx_subtype_1A_cmnd[ByteToHex(message[7])]
+        command = RFX.rfx_subtype_1A_cmnd[message[7]]
     except KeyError:
         command = '0x' + ByteToHex(message[7])
-    result.append({'key': 'Command', 'value': command})
+    result.append(Measurement('Command', command, None, 'command'))
 
     signal = rfxdecode.decode_signal(message[8])
-    result.append({'key': 'Signal level', 'value': signal})
-
-    output_extra = [
-        ('signal_level', signal),
-        ('id', sensor_id),
-        ('unicode', unitcode),
-        ('command', command)]
+    result.append(Measurement('Signal level', signal, None, 'signal_level'))
 
-    return result, output_extra
+    return result
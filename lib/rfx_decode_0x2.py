@@ -24,12 +24,12 @@ with this program; if not, write to the Free Software Foundation, Inc.,
 """
 
 # DomoTricks libraries
-import lib.rfx_sensors
 from lib.rfx_utils import ByteToHex
 import lib.rfx_decode as rfxdecode
+from lib.rfx_decode import Measurement
+from lib.rfx_sensors import RFX
 
-RFX = lib.rfx_sensors.rfx_data()
-
+@rfxdecode.register(0x20, (9,), ('message', 'subtype', 'seqnbr', 'id1', 'id2'), id_bytes=3)
 def decode_0x20(message, subtype, seqnbr, id1, id2):
     """
     0x20 Security1
@@ -39,38 +39,33 @@ def decode_0x20(message, subtype, seqnbr, id1, id2):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_20[subtype]
+        display_subtype = RFX.rfx_subtype_20[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
     sensor_id = id1 + id2 + ByteToHex(message[6])
-    result.append({'key': 'Id', 'value': sensor_id})
+    result.append(Measurement('Id', sensor_id, None, 'id'))
 
     try:
-        status = RFX.rfx_subtype_20_status[ByteToHex(message[7])]
+        status = RFX.rfx_subtype_20_status[message[7]]
     except KeyError:
         status = '0x' + ByteToHex(message[7])
-    result.append({'key': 'Status', 'value': status})
+    result.append(Measurement('Status', status, None, 'status'))
 
     battery = rfxdecode.decode_battery(message[8])
-    result.append({'key': 'Battery', 'value': battery})
+    result.append(Measurement('Battery', battery, None, 'battery'))
 
     signal = rfxdecode.decode_signal(message[8])
-    result.append({'key': 'Signal level', 'value': signal})
-
-    output_extra = [
-        ('battery', battery),
-        ('signal_level', signal),
-        ('id', sensor_id),
-        ('status', status)]
+    result.append(Measurement('Signal level', signal, None, 'signal_level'))
 
-    return result, output_extra
+    return result
 
 
-def decode_0x28(subtype, seqnbr):
+@rfxdecode.register(0x28, (7,), ('message', 'subtype', 'seqnbr'), id_bytes=0)
+def decode_0x28(message, subtype, seqnbr):
     """
     0x28 Camera1
     """
@@ -78,11 +73,11 @@ def decode_0x28(subtype, seqnbr):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_28[subtype]
+        display_subtype = RFX.rfx_subtype_28[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
-    return result, []
+    return result
@@ -24,12 +24,12 @@ with this program; if not, write to the Free Software Foundation, Inc.,
 """
 
 # DomoTricks libraries
-import lib.rfx_sensors
 from lib.rfx_utils import ByteToHex
 import lib.rfx_decode as rfxdecode
+from lib.rfx_decode import Measurement
+from lib.rfx_sensors import RFX
 
-RFX = lib.rfx_sensors.rfx_data()
-
+@rfxdecode.register(0x30, (8,), ('message', 'subtype', 'seqnbr', 'id1'), id_bytes=1)
 def decode_0x30(message, subtype, seqnbr, id1):
     """
     0x30 Remote control and IR
@@ -38,25 +38,23 @@ def decode_0x30(message, subtype, seqnbr, id1):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_30[subtype]
+        display_subtype = RFX.rfx_subtype_30[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
     command_hex = ByteToHex(message[5])
     cmndtype_hex = ByteToHex(message[7])
     command = None
-    cmndtype = None
-    toggle = None
     if subtype == '00':
         try:
-            command = RFX.rfx_subtype_30_atiremotewonder[command_hex]
+            command = RFX.rfx_subtype_30_atiremotewonder[message[5]]
         except KeyError:
             command = '0x' + command_hex
     elif subtype == '02':
-        command = RFX.rfx_subtype_30_medion[command_hex]
+        command = RFX.rfx_subtype_30_medion[message[5]]
     elif subtype == '04':
         if cmndtype_hex == '00':
             cmndtype = "PC"
@@ -70,22 +68,15 @@ def decode_0x30(message, subtype, seqnbr, id1):
             cmndtype = "AUX4"
         else:
             cmndtype = "Unknown"
-        result.append({'key': 'Command type', 'value': cmndtype})
+        result.append(Measurement('Command type', cmndtype, None, 'cmndtype'))
         toggle = ByteToHex(message[6])
-        result.append({'key': 'Toggle', 'value': toggle})
+        result.append(Measurement('Toggle', toggle, None, 'toggle'))
 
-    result.append({'key': 'Command', 'value': command})
+    result.append(Measurement('Command', command, None, 'command'))
 
-    result.append({'key': 'Id', 'value': id1})
+    result.append(Measurement('Id', id1, None, 'id'))
 
     signal = rfxdecode.decode_signal(message[6])
-    result.append({'key': 'Signal level', 'value': signal})
-
-    output_extra = [
-        ('signal_level', signal),
-        ('id', id1),
-        ('toggle', toggle),
-        ('cmndtype', cmndtype),
-        ('command', command)]
+    result.append(Measurement('Signal level', signal, None, 'signal_level'))
 
-    return result, output_extra
+    return result
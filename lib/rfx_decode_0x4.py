@@ -24,12 +24,12 @@ with this program; if not, write to the Free Software Foundation, Inc.,
 """
 
 # DomoTricks libraries
-import lib.rfx_sensors
 from lib.rfx_utils import ByteToHex, testBit
 import lib.rfx_decode as rfxdecode
+from lib.rfx_decode import Measurement
+from lib.rfx_sensors import RFX
 
-RFX = lib.rfx_sensors.rfx_data()
-
+@rfxdecode.register(0x40, (10,), ('message', 'subtype', 'seqnbr', 'id1', 'id2'), id_bytes=2)
 def decode_0x40(message, subtype, seqnbr, id1, id2):
     """
     0x40 - Thermostat1
@@ -39,51 +39,39 @@ def decode_0x40(message, subtype, seqnbr, id1, id2):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_40[subtype]
+        display_subtype = RFX.rfx_subtype_40[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
     sensor_id = id1 + id2
-    result.append({'key': 'Id', 'value': sensor_id})
+    result.append(Measurement('Id', sensor_id, None, 'id'))
 
-    temperature = int(ByteToHex(message[6]), 16)
-    result.append({'key': 'Temperature', 'value': temperature, 'unit': 'C'})
+    temperature = message[6]
+    result.append(Measurement('Temperature', temperature, 'C', 'temperature'))
 
-    temperature_set = int(ByteToHex(message[7]), 16)
-    result.append({'key': 'Temperature set', 'value': temperature_set, 'unit': 'C'})
+    temperature_set = message[7]
+    result.append(Measurement('Temperature set', temperature_set, 'C', 'temperature_set'))
 
-    status_hex = str(testBit(int(ByteToHex(message[8]), 16), 0) + \
-                     testBit(int(ByteToHex(message[8]), 16), 1))
-    try:
-        status = RFX.rfx_subtype_40_status[status_hex]
-    except KeyError:
-        status = '0x' + status_hex
-    result.append({'key': 'Status', 'value': status})
+    status = RFX.rfx_subtype_40_status[message[8] & 0x03]
+    result.append(Measurement('Status', status, None, 'status'))
 
-    if testBit(int(ByteToHex(message[8]), 16), 7) == 128:
-        mode = RFX.rfx_subtype_40_mode['1']
+    if testBit(message[8], 7) == 128:
+        mode = RFX.rfx_subtype_40_mode[1]
     else:
-        mode = RFX.rfx_subtype_40_mode['0']
-    result.append({'key': 'Mode', 'value': mode})
+        mode = RFX.rfx_subtype_40_mode[0]
+    result.append(Measurement('Mode', mode, None, 'mode'))
 
     signal = rfxdecode.decode_signal(message[9])
-    result.append({'key': 'Signal level', 'value': signal})
+    result.append(Measurement('Signal level', signal, None, 'signal_level'))
 
-    output_extra = [
-        ('signal_level', signal),
-        ('mode', mode),
-        ('id', sensor_id),
-        ('status', status),
-        ('temperature_set', temperature_set),
-        ('temperature', temperature)]
+    return result
 
-    return result, output_extra
 
-
-def decode_0x41(subtype, seqnbr):
+@rfxdecode.register(0x41, (7,), ('message', 'subtype', 'seqnbr'), id_bytes=0)
+def decode_0x41(message, subtype, seqnbr):
     """
     0x41 Thermostat2
     """
@@ -91,16 +79,17 @@ def decode_0x41(subtype, seqnbr):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_41[subtype]
+        display_subtype = RFX.rfx_subtype_41[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
-    return result, []
+    return result
 
 
+@rfxdecode.register(0x42, (9,), ('message', 'subtype', 'seqnbr', 'id1', 'id2'), id_bytes=2)
 def decode_0x42(message, subtype, seqnbr, id1, id2):
     """
     0x40 - Thermostat1
@@ -110,40 +99,40 @@ def decode_0x42(message, subtype, seqnbr, id1, id2):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_42[subtype]
+        display_subtype = RFX.rfx_subtype_42[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
     sensor_id = id1 + id2
-    result.append({'key': 'Id', 'value': sensor_id})
+    result.append(Measurement('Id', sensor_id, None, 'id'))
 
     command_hex = ByteToHex(message[7])
     try:
         if subtype == '00':
             unitcode = ByteToHex(message[4])
-            command = RFX.rfx_subtype_42_cmd00[command_hex]
+            command = RFX.rfx_subtype_42_cmd00[message[7]]
         elif subtype == '01':
             unitcode = ByteToHex(message[4]) + ByteToHex(message[5]) + ByteToHex(message[6])
-            command = RFX.rfx_subtype_42_cmd01[command_hex]
+            command = RFX.rfx_subtype_42_cmd01[message[7]]
         else:
             unitcode = '00'
             command = '0x' + command_hex
     except KeyError:
         command = '0x' + command_hex
 
-    result.append({'key': 'Unitcode', 'value': unitcode})
-    result.append({'key': 'Command', 'value': command})
+    result.append(Measurement('Unitcode', unitcode, None, 'unitcode'))
+    result.append(Measurement('Command', command, None, 'command'))
 
     signal = rfxdecode.decode_signal(message[8])
-    result.append({'key': 'Signal level', 'value': signal})
+    result.append(Measurement('Signal level', signal, None, 'signal_level'))
+
+    return result
 
-    output_extra = [
-        ('signal_level', signal),
-        ('id', sensor_id),
-        ('unitcode', unitcode),
-        ('command', command)]
+# ----------------------------------------------------------------------------
 
-    return result, output_extra
+# 0x4E - Bike computer and 0x4F - Weight scale: length checked, not decoded
+rfxdecode.register_packet(0x4E, (11,))
+rfxdecode.register_packet(0x4F, (11,))
@@ -23,13 +23,22 @@ with this program; if not, write to the Free Software Foundation, Inc.,
 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 """
 
+# Standard library
+from struct import Struct
+
 # DomoTricks libraries
-import lib.rfx_sensors
-from lib.rfx_utils import ByteToHex, clearBit
+from lib.rfx_utils import ByteToHex
 import lib.rfx_decode as rfxdecode
+from lib.rfx_decode import Measurement, UINT16
+from lib.rfx_sensors import RFX
 
-RFX = lib.rfx_sensors.rfx_data()
+# Sensor fields, unpacked from the byte following the id
+FIELDS_0x56 = Struct('>HHH') # direction, average speed, gust
+FIELDS_0x59 = Struct('>BHHH') # counter, channel 1 to 3, also 0x5B
+FIELDS_0x5A = Struct('>BI') # count, instant usage
+FIELDS_0x5C = Struct('>BHHHBB') # voltage, current, power, energy, power factor, frequency
 
+@rfxdecode.register(0x50, (9,), ('message', 'subtype', 'seqnbr', 'id1', 'id2'), id_bytes=2)
 def decode_0x50(message, subtype, seqnbr, id1, id2):
     """
     0x50 - Temperature sensors
@@ -38,34 +47,29 @@ def decode_0x50(message, subtype, seqnbr, id1, id2):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_50[subtype]
+        display_subtype = RFX.rfx_subtype_50[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
     sensor_id = id1 + id2
-    result.append({'key': 'Id', 'value': sensor_id})
+    result.append(Measurement('Id', sensor_id, None, 'id'))
 
     temperature = rfxdecode.decode_temperature(message[6], message[7])
-    result.append({'key': 'Temperature', 'value': temperature, 'unit': 'C'})
+    result.append(Measurement('Temperature', temperature, 'C', 'temperature'))
 
     signal = rfxdecode.decode_signal(message[8])
-    result.append({'key': 'Signal level', 'value': signal})
+    result.append(Measurement('Signal level', signal, None, 'signal_level'))
 
     battery = rfxdecode.decode_battery(message[8])
-    result.append({'key': 'Battery', 'value': battery})
-
-    output_extra = [
-        ('id', sensor_id),
-        ('battery', battery),
-        ('signal_level', signal),
-        ('temperature', temperature)]
+    result.append(Measurement('Battery', battery, None, 'battery'))
 
-    return result, output_extra
+    return result
 
 
+@rfxdecode.register(0x51, (9,), ('message', 'subtype', 'seqnbr', 'id1', 'id2'), id_bytes=2)
 def decode_0x51(message, subtype, seqnbr, id1, id2):
     """
     0x51 Humidity sensors
@@ -74,41 +78,35 @@ def decode_0x51(message, subtype, seqnbr, id1, id2):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_51[subtype]
+        display_subtype = RFX.rfx_subtype_51[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
     sensor_id = id1 + id2
-    result.append({'key': 'Id', 'value': sensor_id})
+    result.append(Measurement('Id', sensor_id, None, 'id'))
 
-    humidity = int(ByteToHex(message[6]), 16)
-    result.append({'key': 'Humidity', 'value': humidity, 'unit': '%'})
+    humidity = message[6]
+    result.append(Measurement('Humidity', humidity, '%', 'humidity'))
 
     try:
-        humidity_status = RFX.rfx_subtype_51_humstatus[ByteToHex(message[7])]
+        humidity_status = RFX.rfx_subtype_51_humstatus[message[7]]
     except KeyError:
         humidity_status = '0x' + ByteToHex(message[7])
-    result.append({'key': 'Humidity', 'value': humidity_status})
+    result.append(Measurement('Humidity Status', humidity_status, None, 'humidity_status'))
 
     signal = rfxdecode.decode_signal(message[8])
-    result.append({'key': 'Signal level', 'value': signal})
+    result.append(Measurement('Signal level', signal, None, 'signal_level'))
 
     battery = rfxdecode.decode_battery(message[8])
-    result.append({'key': 'Battery', 'value': battery})
+    result.append(Measurement('Battery', battery, None, 'battery'))
 
-    output_extra = [
-        ('id', sensor_id),
-        ('humidity_status', humidity_status),
-        ('humidity', humidity),
-        ('battery', battery),
-        ('signal_level', signal)]
-
-    return result, output_extra
+    return result
 
 
+@rfxdecode.register(0x52, (11,), ('message', 'subtype', 'seqnbr', 'id1', 'id2'), id_bytes=2)
 def decode_0x52(message, subtype, seqnbr, id1, id2):
     """
     0x52 Temperature and humidity sensors
@@ -117,46 +115,39 @@ def decode_0x52(message, subtype, seqnbr, id1, id2):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_52[subtype]
+        display_subtype = RFX.rfx_subtype_52[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
     sensor_id = id1 + id2
-    result.append({'key': 'Id', 'value': sensor_id})
+    result.append(Measurement('Id', sensor_id, None, 'id'))
 
     temperature = rfxdecode.decode_temperature(message[6], message[7])
-    result.append({'key': 'Temperature', 'value': temperature, 'unit': 'C'})
+    result.append(Measurement('Temperature', temperature, 'C', 'temperature'))
 
-    humidity = int(ByteToHex(message[8]), 16)
-    result.append({'key': 'Humidity', 'value': humidity, 'unit': '%'})
+    humidity = message[8]
+    result.append(Measurement('Humidity', humidity, '%', 'humidity'))
 
     try:
-        humidity_status = RFX.rfx_subtype_52_humstatus[ByteToHex(message[9])]
+        humidity_status = RFX.rfx_subtype_52_humstatus[message[9]]
     except KeyError:
         humidity_status = '0x' + ByteToHex(message[9])
-    result.append({'key': 'Humidity Status', 'value': humidity_status})
+    result.append(Measurement('Humidity Status', humidity_status, None, 'humidity_status'))
 
     signal = rfxdecode.decode_signal(message[10])
-    result.append({'key': 'Signal level', 'value': signal})
+    result.append(Measurement('Signal level', signal, None, 'signal_level'))
 
     battery = rfxdecode.decode_battery(message[10])
-    result.append({'key': 'Battery', 'value': battery})
-
-    output_extra = [
-        ('id', sensor_id),
-        ('humidity_status', humidity_status),
-        ('temperature', temperature),
-        ('humidity', humidity),
-        ('battery', battery),
-        ('signal_level', signal)]
+    result.append(Measurement('Battery', battery, None, 'battery'))
 
-    return result, output_extra
+    return result
 
 
-def decode_0x53(subtype, seqnbr):
+@rfxdecode.register(0x53, (10,), ('message', 'subtype', 'seqnbr'), id_bytes=0)
+def decode_0x53(message, subtype, seqnbr):
     """
     0x53 Barometric
     RESERVED FOR FUTURE
@@ -165,16 +156,18 @@ def decode_0x53(subtype, seqnbr):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_53[subtype]
+        display_subtype = RFX.rfx_subtype_53[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
-    return result, []
+    return result
 
 
+@rfxdecode.register(0x54, (14,), ('message', 'subtype', 'seqnbr', 'id1', 'id2', 'barometric'),
+                    id_bytes=2)
 def decode_0x54(message, subtype, seqnbr, id1, id2, config_barometric=0):
     """
     0x54 Temperature, humidity and barometric sensors
@@ -184,59 +177,46 @@ def decode_0x54(message, subtype, seqnbr, id1, id2, config_barometric=0):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_54[subtype]
+        display_subtype = RFX.rfx_subtype_54[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
     sensor_id = id1 + id2
-    result.append({'key': 'Id', 'value': sensor_id})
+    result.append(Measurement('Id', sensor_id, None, 'id'))
 
     temperature = rfxdecode.decode_temperature(message[6], message[7])
-    result.append({'key': 'Temperature', 'value': temperature, 'unit': 'C'})
+    result.append(Measurement('Temperature', temperature, 'C', 'temperature'))
 
-    humidity = int(ByteToHex(message[8]), 16)
-    result.append({'key': 'Humidity', 'value': humidity, 'unit': '%'})
+    humidity = message[8]
+    result.append(Measurement('Humidity', humidity, '%', 'humidity'))
 
     try:
-        humidity_status = RFX.rfx_subtype_54_humstatus[ByteToHex(message[9])]
+        humidity_status = RFX.rfx_subtype_54_humstatus[message[9]]
     except KeyError:
         humidity_status = '0x' + ByteToHex(message[9])
-    result.append({'key': 'Humidity Status', 'value': humidity_status})
+    result.append(Measurement('Humidity Status', humidity_status, None, 'humidity_status'))
 
-    barometric_high = ByteToHex(message[10])
-    barometric_low = ByteToHex(message[11])
-    barometric_high = clearBit(int(barometric_high, 16), 7)
-    barometric_high = barometric_high << 8
-    barometric = barometric_high + int(barometric_low, 16) + int(config_barometric)
-    result.append({'key': 'Barometric pressure', 'value': humidity_status, 'unit': 'hPa'})
+    barometric = (UINT16.unpack_from(message, 10)[0] & 0x7fff) + int(config_barometric)
+    result.append(Measurement('Barometric pressure', barometric, 'hPa', 'barometric_pressure'))
 
     try:
-        forecast = RFX.rfx_subtype_54_forecast[ByteToHex(message[12])]
+        forecast = RFX.rfx_subtype_54_forecast[message[12]]
     except KeyError:
         forecast = '0x' + ByteToHex(message[12])
-    result.append({'key': 'Forecast Status', 'value': forecast})
+    result.append(Measurement('Forecast Status', forecast, None, 'forecast_status'))
 
     signal = rfxdecode.decode_signal(message[13])
-    result.append({'key': 'Signal level', 'value': signal})
+    result.append(Measurement('Signal level', signal, None, 'signal_level'))
 
     battery = rfxdecode.decode_battery(message[13])
-    result.append({'key': 'Battery', 'value': battery})
+    result.append(Measurement('Battery', battery, None, 'battery'))
 
-    output_extra = [
-        ('battery', battery),
-        ('signal_level', signal),
-        ('id', sensor_id),
-        ('forecast_status', forecast),
-        ('humidity_status', humidity_status),
-        ('humidity', humidity),
-        ('barometric_pressure', barometric),
-        ('temperature', temperature)]
-
-    return result, output_extra
+    return result
 
+@rfxdecode.register(0x55, (12,), ('message', 'subtype', 'seqnbr', 'id1', 'id2'), id_bytes=2)
 def decode_0x55(message, subtype, seqnbr, id1, id2):
     """
     0x55 Rain sensors
@@ -245,49 +225,38 @@ def decode_0x55(message, subtype, seqnbr, id1, id2):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_55[subtype]
+        display_subtype = RFX.rfx_subtype_55[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
     sensor_id = id1 + id2
-    result.append({'key': 'Id', 'value': sensor_id})
+    result.append(Measurement('Id', sensor_id, None, 'id'))
 
-    rainrate_high = ByteToHex(message[6])
-    rainrate_low = ByteToHex(message[7])
-    rainrate = 'not implemented'
+    rainrate = None
     if subtype == '01':
-        rainrate = int(rainrate_high, 16) * 0x100 + int(rainrate_low, 16)
+        rainrate = UINT16.unpack_from(message, 6)[0]
     elif subtype == '02':
-        rainrate = float(int(rainrate_high, 16) * 0x100 + int(rainrate_low, 16)) / 100
-    result.append({'key': 'Rainrate', 'value': rainrate, 'unit': 'mm/h'})
+        rainrate = round(UINT16.unpack_from(message, 6)[0] / 100, 2)
+    if rainrate is not None:
+        result.append(Measurement('Rainrate', rainrate, 'mm/h', 'rainrate'))
 
-    raintotal = 'not implemented'
     if subtype != '06':
-        raintotal = float( \
-                    (int(ByteToHex(message[8]), 16) * 0x1000) + \
-                    (int(ByteToHex(message[9]), 16) * 0x100) + \
-                    int(ByteToHex(message[10]), 16)) / 10
-    result.append({'key': 'Rain', 'value': raintotal, 'unit': 'mm'})
+        raintotal = round((message[8] * 0x1000 + message[9] * 0x100 + message[10]) / 10, 1)
+        result.append(Measurement('Rain', raintotal, 'mm', 'raintotal'))
 
     signal = rfxdecode.decode_signal(message[11])
-    result.append({'key': 'Signal level', 'value': signal})
+    result.append(Measurement('Signal level', signal, None, 'signal_level'))
 
     battery = rfxdecode.decode_battery(message[11])
-    result.append({'key': 'Battery', 'value': battery})
-
-    output_extra = [
-        ('rainrate', rainrate),
-        ('raintotal', raintotal),
-        ('battery', battery),
-        ('id', sensor_id),
-        ('signal_level', signal)]
+    result.append(Measurement('Battery', battery, None, 'battery'))
 
-    return result, output_extra
+    return result
 
 
+@rfxdecode.register(0x56, (17,), ('message', 'subtype', 'seqnbr', 'id1', 'id2'), id_bytes=2)
 def decode_0x56(message, subtype, seqnbr, id1, id2):
     """
     0x56 Wind sensors
@@ -296,57 +265,42 @@ def decode_0x56(message, subtype, seqnbr, id1, id2):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_56[subtype]
+        display_subtype = RFX.rfx_subtype_56[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
     sensor_id = id1 + id2
-    result.append({'key': 'Id', 'value': sensor_id})
+    result.append(Measurement('Id', sensor_id, None, 'id'))
 
-    direction = ((int(ByteToHex(message[6]), 16) * 256) + \
-                int(ByteToHex(message[7]), 16))
-    result.append({'key': 'Wind direction', 'value': direction, 'unit': 'degrees'})
+    direction, av_speed, gust = FIELDS_0x56.unpack_from(message, 6)
+    result.append(Measurement('Wind direction', direction, 'degrees', 'wind_direction'))
 
-    av_speed = 'not implemented'
     if subtype != '05':
-        av_speed = ((int(ByteToHex(message[8]), 16) * 256) + \
-                   int(ByteToHex(message[9]), 16)) * 0.1
-    result.append({'key': 'Wind speed (average)', 'value': av_speed, 'unit': 'm/s'})
+        av_speed = round(av_speed * 0.1, 1)
+        result.append(Measurement('Wind speed (average)', av_speed, 'm/s', 'wind_average_speed'))
 
-    gust = ((int(ByteToHex(message[10]), 16) * 256) + \
-           int(ByteToHex(message[11]), 16)) * 0.1
-    result.append({'key': 'Wind gust', 'value': gust, 'unit': 'm/s'})
+    gust = round(gust * 0.1, 1)
+    result.append(Measurement('Wind gust', gust, 'm/s', 'wind_gust'))
 
-    temperature = 'not implemented'
-    windchill = 'not implemented'
     if subtype == "04":
         temperature = rfxdecode.decode_temperature(message[12], message[13])
         windchill = rfxdecode.decode_temperature(message[14], message[15])
-    result.append({'key': 'Temperature', 'value': temperature, 'unit': 'C'})
-    result.append({'key': 'Wind chill', 'value': windchill, 'unit': 'C'})
+        result.append(Measurement('Temperature', temperature, 'C', 'temperature'))
+        result.append(Measurement('Wind chill', windchill, 'C', 'wind_chill'))
 
     signal = rfxdecode.decode_signal(message[16])
-    result.append({'key': 'Signal level', 'value': signal})
+    result.append(Measurement('Signal level', signal, None, 'signal_level'))
 
     battery = rfxdecode.decode_battery(message[16])
-    result.append({'key': 'Battery', 'value': battery})
+    result.append(Measurement('Battery', battery, None, 'battery'))
 
-    output_extra = [
-        ('battery', battery),
-        ('signal_level', signal),
-        ('id', sensor_id),
-        ('temperature', temperature),
-        ('wind_average_speed', av_speed),
-        ('wind_gust', gust),
-        ('wind_direction', direction),
-        ('wind_chill', windchill)]
-
-    return result, output_extra
+    return result
 
 
+@rfxdecode.register(0x57, (10,), ('message', 'subtype', 'seqnbr', 'id1', 'id2'), id_bytes=2)
 def decode_0x57(message, subtype, seqnbr, id1, id2):
     """
     0x57 UV Sensor
@@ -355,40 +309,33 @@ def decode_0x57(message, subtype, seqnbr, id1, id2):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_57[subtype]
+        display_subtype = RFX.rfx_subtype_57[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
     sensor_id = id1 + id2
-    result.append({'key': 'Id', 'value': sensor_id})
+    result.append(Measurement('Id', sensor_id, None, 'id'))
 
-    ultra_violet = int(ByteToHex(message[6]), 16) * 10
-    result.append({'key': 'Ultra Violet', 'value': ultra_violet})
+    ultra_violet = message[6] * 10
+    result.append(Measurement('Ultra Violet', ultra_violet, None, 'ultra_violet'))
 
-    temperature = 'not implemented'
     if subtype == '03':
         temperature = rfxdecode.decode_temperature(message[6], message[8])
-    result.append({'key': 'Temperature', 'value': temperature, 'unit': 'C'})
+        result.append(Measurement('Temperature', temperature, 'C', 'temperature'))
 
     signal = rfxdecode.decode_signal(message[9])
-    result.append({'key': 'Signal level', 'value': signal})
+    result.append(Measurement('Signal level', signal, None, 'signal_level'))
 
     battery = rfxdecode.decode_battery(message[9])
-    result.append({'key': 'Battery', 'value': battery})
-
-    output_extra = [
-        ('id', sensor_id),
-        ('ultra_violet', ultra_violet),
-        ('temperature', temperature),
-        ('battery', battery),
-        ('signal_level', signal)]
+    result.append(Measurement('Battery', battery, None, 'battery'))
 
-    return result, output_extra
+    return result
 
 
+@rfxdecode.register(0x58, (14,), ('message', 'subtype', 'seqnbr', 'id1', 'id2'), id_bytes=2)
 def decode_0x58(message, subtype, seqnbr, id1, id2):
     """
     0x58 Date/Time sensor
@@ -397,51 +344,44 @@ def decode_0x58(message, subtype, seqnbr, id1, id2):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_58[subtype]
+        display_subtype = RFX.rfx_subtype_58[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
     sensor_id = id1 + id2
-    result.append({'key': 'Id', 'value': sensor_id})
+    result.append(Measurement('Id', sensor_id, None, 'id'))
 
-    date_yy = int(ByteToHex(message[6]), 16)
-    date_mm = int(ByteToHex(message[7]), 16)
-    date_dd = int(ByteToHex(message[8]), 16)
+    date_yy = message[6]
+    date_mm = message[7]
+    date_dd = message[8]
     date_string = "20%s-%s-%s" % (
         str(date_yy).zfill(2),
         str(date_mm).zfill(2),
         str(date_dd).zfill(2))
-    result.append({'key': 'Date (yy-mm-dd)', 'value': date_string})
+    result.append(Measurement('Date (yy-mm-dd)', date_string, None, 'date'))
 
-    date_dow = int(ByteToHex(message[9]), 16)
-    result.append({'key': 'Day of week (1-7)', 'value': date_dow})
+    date_dow = message[9]
+    result.append(Measurement('Day of week (1-7)', date_dow, None, 'day_of_week'))
 
-    time_hr = int(ByteToHex(message[10]), 16)
-    time_min = int(ByteToHex(message[11]), 16)
-    time_sec = int(ByteToHex(message[12]), 16)
+    time_hr = message[10]
+    time_min = message[11]
+    time_sec = message[12]
     time_string = "%s:%s:%s" % (str(time_hr), str(time_min), str(time_sec))
-    result.append({'key': 'Time', 'value': time_string})
+    result.append(Measurement('Time', time_string, None, 'time'))
 
     signal = rfxdecode.decode_signal(message[13])
-    result.append({'key': 'Signal level', 'value': signal})
+    result.append(Measurement('Signal level', signal, None, 'signal_level'))
 
     battery = rfxdecode.decode_battery(message[13])
-    result.append({'key': 'Battery', 'value': battery})
+    result.append(Measurement('Battery', battery, None, 'battery'))
 
-    output_extra = [
-        ('id', sensor_id),
-        ('time', time_string),
-        ('date', date_string),
-        ('day_of_week', date_dow),
-        ('battery', battery),
-        ('signal_level', signal)]
-
-    return result, output_extra
+    return result
 
 
+@rfxdecode.register(0x59, (14,), ('message', 'subtype', 'seqnbr', 'id1', 'id2'), id_bytes=2)
 def decode_0x59(message, subtype, seqnbr, id1, id2):
     """
     0x59 Current Sensor
@@ -450,46 +390,38 @@ def decode_0x59(message, subtype, seqnbr, id1, id2):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_59[subtype]
+        display_subtype = RFX.rfx_subtype_59[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
     sensor_id = id1 + id2
-    result.append({'key': 'Id', 'value': sensor_id})
+    result.append(Measurement('Id', sensor_id, None, 'id'))
 
-    count = int(ByteToHex(message[6]), 16)
-    result.append({'key': 'Counter', 'value': count})
+    count, channel1, channel2, channel3 = FIELDS_0x59.unpack_from(message, 6)
+    result.append(Measurement('Counter', count, None, 'counter'))
 
-    channel1 = (int(ByteToHex(message[7]), 16) * 0x100 + int(ByteToHex(message[8]), 16)) * 0.1
-    result.append({'key': 'Channel #1', 'value': channel1, 'unit': 'A'})
+    channel1 = round(channel1 * 0.1, 1)
+    result.append(Measurement('Channel #1', channel1, 'A', 'channel1'))
 
-    channel2 = (int(ByteToHex(message[9]), 16) * 0x100 + int(ByteToHex(message[10]), 16)) * 0.1
-    result.append({'key': 'Channel #2', 'value': channel2, 'unit': 'A'})
+    channel2 = round(channel2 * 0.1, 1)
+    result.append(Measurement('Channel #2', channel2, 'A', 'channel2'))
 
-    channel3 = (int(ByteToHex(message[11]), 16) * 0x100 + int(ByteToHex(message[12]), 16)) * 0.1
-    result.append({'key': 'Channel #3', 'value': channel3, 'unit': 'A'})
+    channel3 = round(channel3 * 0.1, 1)
+    result.append(Measurement('Channel #3', channel3, 'A', 'channel3'))
 
     signal = rfxdecode.decode_signal(message[13])
-    result.append({'key': 'Signal level', 'value': signal})
+    result.append(Measurement('Signal level', signal, None, 'signal_level'))
 
     battery = rfxdecode.decode_battery(message[13])
-    result.append({'key': 'Battery', 'value': battery})
-
-    output_extra = [
-        ('id', sensor_id),
-        ('counter', count),
-        ('channel1', channel1),
-        ('channel2', channel2),
-        ('channel3', channel3),
-        ('battery', battery),
-        ('signal_level', signal)]
+    result.append(Measurement('Battery', battery, None, 'battery'))
 
-    return result, output_extra
+    return result
 
 
+@rfxdecode.register(0x5A, (18,), ('message', 'subtype', 'seqnbr', 'id1', 'id2'), id_bytes=2)
 def decode_0x5a(message, subtype, seqnbr, id1, id2):
     """
     0x5A Energy sensor
@@ -499,50 +431,34 @@ def decode_0x5a(message, subtype, seqnbr, id1, id2):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_5A[subtype]
+        display_subtype = RFX.rfx_subtype_5A[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
     sensor_id = id1 + id2
-    result.append({'key': 'Id', 'value': sensor_id})
-
-    count = int(ByteToHex(message[6]), 16)
-    result.append({'key': 'Count', 'value': count})
-
-    instant = int(ByteToHex(message[7]), 16) * 0x1000000 + \
-              int(ByteToHex(message[8]), 16) * 0x10000 + \
-              int(ByteToHex(message[9]), 16) * 0x100  + \
-              int(ByteToHex(message[10]), 16)
-    result.append({'key': 'Instant usage', 'value': instant})
-
-    usage = int((
-        int(ByteToHex(message[11]), 16) * 0x10000000000 + \
-        int(ByteToHex(message[12]), 16) * 0x100000000 + \
-        int(ByteToHex(message[13]), 16) * 0x1000000 + \
-        int(ByteToHex(message[14]), 16) * 0x10000 + \
-        int(ByteToHex(message[15]), 16) * 0x100 + \
-        int(ByteToHex(message[16]), 16)) / 223.666)
-    result.append({'key': 'Total usage', 'value': usage})
+    result.append(Measurement('Id', sensor_id, None, 'id'))
+
+    count, instant = FIELDS_0x5A.unpack_from(message, 6)
+    result.append(Measurement('Count', count))
+
+    result.append(Measurement('Instant usage', instant, None, 'instant_usage'))
+
+    usage = int(int.from_bytes(message[11:17], 'big') / 223.666)
+    result.append(Measurement('Total usage', usage, None, 'total_usage'))
 
     signal = rfxdecode.decode_signal(message[17])
-    result.append({'key': 'Signal level', 'value': signal})
+    result.append(Measurement('Signal level', signal, None, 'signal_level'))
 
     battery = rfxdecode.decode_battery(message[17])
-    result.append({'key': 'Battery', 'value': battery})
-
-    output_extra = [
-        ('id', sensor_id),
-        ('instant_usage', instant),
-        ('total_usage', usage),
-        ('battery', battery),
-        ('signal_level', signal)]
+    result.append(Measurement('Battery', battery, None, 'battery'))
 
-    return result, output_extra
+    return result
 
 
+@rfxdecode.register(0x5B, (20,), ('message', 'subtype', 'seqnbr', 'id1', 'id2'), id_bytes=2)
 def decode_0x5b(message, subtype, seqnbr, id1, id2):
     """
     0x5B Current Sensor
@@ -551,56 +467,41 @@ def decode_0x5b(message, subtype, seqnbr, id1, id2):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_5B[subtype]
+        display_subtype = RFX.rfx_subtype_5B[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
     sensor_id = id1 + id2
-    result.append({'key': 'Id', 'value': sensor_id})
+    result.append(Measurement('Id', sensor_id, None, 'id'))
 
-    count = int(ByteToHex(message[6]), 16)
-    result.append({'key': 'Counter', 'value': count})
+    count, channel1, channel2, channel3 = FIELDS_0x59.unpack_from(message, 6)
+    result.append(Measurement('Counter', count, None, 'counter'))
 
-    channel1 = (int(ByteToHex(message[7]), 16) * 0x100 + int(ByteToHex(message[8]), 16)) * 0.1
-    result.append({'key': 'Channel #1', 'value': channel1, 'unit': 'A'})
+    channel1 = round(channel1 * 0.1, 1)
+    result.append(Measurement('Channel #1', channel1, 'A', 'channel1'))
 
-    channel2 = (int(ByteToHex(message[9]), 16) * 0x100 + int(ByteToHex(message[10]), 16)) * 0.1
-    result.append({'key': 'Channel #2', 'value': channel2, 'unit': 'A'})
+    channel2 = round(channel2 * 0.1, 1)
+    result.append(Measurement('Channel #2', channel2, 'A', 'channel2'))
 
-    channel3 = (int(ByteToHex(message[11]), 16) * 0x100 + int(ByteToHex(message[12]), 16)) * 0.1
-    result.append({'key': 'Channel #3', 'value': channel3, 'unit': 'A'})
+    channel3 = round(channel3 * 0.1, 1)
+    result.append(Measurement('Channel #3', channel3, 'A', 'channel3'))
 
-    total = float((
-        int(ByteToHex(message[13]), 16) * 0x10000000000 + \
-        int(ByteToHex(message[14]), 16) * 0x100000000 + \
-        int(ByteToHex(message[15]), 16) * 0x1000000 + \
-        int(ByteToHex(message[16]), 16) * 0x10000 + \
-        int(ByteToHex(message[17]), 16) * 0x100 + \
-        int(ByteToHex(message[18]), 16)) / 223.666)
-    result.append({'key': 'Total', 'value': total, 'unit': 'Wh'})
+    total = round(int.from_bytes(message[13:19], 'big') / 223.666, 1)
+    result.append(Measurement('Total', total, 'Wh', 'total'))
 
     signal = rfxdecode.decode_signal(message[19])
-    result.append({'key': 'Signal level', 'value': signal})
+    result.append(Measurement('Signal level', signal, None, 'signal_level'))
 
     battery = rfxdecode.decode_battery(message[19])
-    result.append({'key': 'Battery', 'value': battery})
+    result.append(Measurement('Battery', battery, None, 'battery'))
 
-    output_extra = [
-        ('id', sensor_id),
-        ('counter', count),
-        ('channel1', channel1),
-        ('channel2', channel2),
-        ('channel3', channel3),
-        ('total', total),
-        ('battery', battery),
-        ('signal_level', signal)]
-
-    return result, output_extra
+    return result
 
 
+@rfxdecode.register(0x5C, (16,), ('message', 'subtype', 'seqnbr', 'id1', 'id2'), id_bytes=2)
 def decode_0x5c(message, subtype, seqnbr, id1, id2):
     """
     0x5C Power Sensors
@@ -609,51 +510,41 @@ def decode_0x5c(message, subtype, seqnbr, id1, id2):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_5C[subtype]
+        display_subtype = RFX.rfx_subtype_5C[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
     sensor_id = id1 + id2
-    result.append({'key': 'Id', 'value': sensor_id})
+    result.append(Measurement('Id', sensor_id, None, 'id'))
 
-    voltage = int(ByteToHex(message[6]), 16)
-    result.append({'key': 'Voltage', 'value': voltage, 'unit': 'V'})
+    voltage, current, power, energy, powerfactor, freq = FIELDS_0x5C.unpack_from(message, 6)
+    result.append(Measurement('Voltage', voltage, 'V', 'voltage'))
 
-    current = (int(ByteToHex(message[7]), 16) * 0x100 + int(ByteToHex(message[8]), 16)) * 0.01
-    result.append({'key': 'Current', 'value': current, 'unit': 'A'})
+    current = round(current * 0.01, 2)
+    result.append(Measurement('Current', current, 'A', 'current'))
 
-    power = (int(ByteToHex(message[9]), 16) * 0x100 + int(ByteToHex(message[10]), 16)) * 0.1
-    result.append({'key': 'Instant power', 'value': power, 'unit': 'W'})
+    power = round(power * 0.1, 1)
+    result.append(Measurement('Instant power', power, 'W', 'instant_power'))
 
-    energy = (int(ByteToHex(message[11]), 16) * 0x100 + int(ByteToHex(message[12]), 16)) * 0.01
-    result.append({'key': 'Total usage', 'value': energy, 'unit': 'kWh'})
+    energy = round(energy * 0.01, 2)
+    result.append(Measurement('Total usage', energy, 'kWh', 'total_usage'))
 
-    powerfactor = (int(ByteToHex(message[13]), 16)) * 0.01
-    result.append({'key': 'Power factor', 'value': powerfactor})
+    powerfactor = round(powerfactor * 0.01, 2)
+    result.append(Measurement('Power factor', powerfactor, None, 'powerfactor'))
 
-    freq = int(ByteToHex(message[14]), 16)
-    result.append({'key': 'Frequency', 'value': freq, 'unit': 'Hz'})
+    result.append(Measurement('Frequency', freq, 'Hz', 'freq'))
 
     signal = rfxdecode.decode_signal(message[15])
-    result.append({'key': 'Signal level', 'value': signal})
-
-    output_extra = [
-        ('id', sensor_id),
-        ('voltage', voltage),
-        ('current', current),
-        ('instant_power', power),
-        ('total_usage', energy),
-        ('powerfactor', powerfactor),
-        ('freq', freq),
-        ('signal_level', signal)]
+    result.append(Measurement('Signal level', signal, None, 'signal_level'))
 
-    return result, output_extra
+    return result
 
 
-def decode_0x5d(subtype, seqnbr):
+@rfxdecode.register(0x5D, (9,), ('message', 'subtype', 'seqnbr'), id_bytes=0)
+def decode_0x5d(message, subtype, seqnbr):
     """
     0x5D
     """
@@ -661,17 +552,18 @@ def decode_0x5d(subtype, seqnbr):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_5D[subtype]
+        display_subtype = RFX.rfx_subtype_5D[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
-    return result, []
+    return result
 
 
-def decode_0x5e(subtype, seqnbr):
+@rfxdecode.register(0x5E, None, ('message', 'subtype', 'seqnbr'), id_bytes=0)
+def decode_0x5e(message, subtype, seqnbr):
     """
     0x5E Gas Usage Sensor
     """
@@ -679,17 +571,18 @@ def decode_0x5e(subtype, seqnbr):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_5E[subtype]
+        display_subtype = RFX.rfx_subtype_5E[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
-    return result, []
+    return result
 
 
-def decode_0x5f(subtype, seqnbr):
+@rfxdecode.register(0x5F, None, ('message', 'subtype', 'seqnbr'), id_bytes=0)
+def decode_0x5f(message, subtype, seqnbr):
     """
     0x5F Water Usage Sensor
     """
@@ -697,11 +590,11 @@ def decode_0x5f(subtype, seqnbr):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_5F[subtype]
+        display_subtype = RFX.rfx_subtype_5F[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
-    return result, []
+    return result
@@ -24,12 +24,12 @@ with this program; if not, write to the Free Software Foundation, Inc.,
 """
 
 # DomoTricks libraries
-import lib.rfx_sensors
 from lib.rfx_utils import ByteToHex
 import lib.rfx_decode as rfxdecode
+from lib.rfx_decode import Measurement, UINT16
+from lib.rfx_sensors import RFX
 
-RFX = lib.rfx_sensors.rfx_data()
-
+@rfxdecode.register(0x70, (8,), ('message', 'subtype', 'seqnbr', 'id1'), id_bytes=1)
 def decode_0x70(message, subtype, seqnbr, id1):
     """
     0x70 RFXsensor
@@ -38,49 +38,35 @@ def decode_0x70(message, subtype, seqnbr, id1):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_70[subtype]
+        display_subtype = RFX.rfx_subtype_70[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
-    result.append({'key': 'Id', 'value': id1})
+    result.append(Measurement('Id', id1, None, 'id'))
 
-    temperature = 0
     if subtype == '00':
-        temperature = float(rfxdecode.decode_temperature(message[5], message[6]))
-        temperature = temperature * 0.1
-    result.append({'key': 'Temperature', 'value': temperature, 'unit': 'C'})
+        temperature = round(rfxdecode.decode_temperature(message[5], message[6]) * 0.1, 2)
+        result.append(Measurement('Temperature', temperature, 'C', 'temperature'))
 
-    voltage = 0
     if subtype == '01' or subtype == '02':
-        voltage_hi = int(ByteToHex(message[5]), 16) * 256
-        voltage_lo = int(ByteToHex(message[6]), 16)
-        voltage = voltage_hi + voltage_lo
-    result.append({'key': 'Voltage', 'value': voltage, 'unit': 'mV'})
+        voltage = UINT16.unpack_from(message, 5)[0]
+        result.append(Measurement('Voltage', voltage, 'mV', 'voltage'))
 
-    sensor_message = '0x' + message[6]
+    sensor_message = '0x' + ByteToHex(message[6])
     if subtype == '03':
-        try:
-            sensor_message = RFX.rfx_subtype_70_msg03[message[6]]
-        except KeyError:
-            sensor_message = '0x' + message[6]
-    result.append({'key': 'Message', 'value': sensor_message})
+        sensor_message = RFX.rfx_subtype_70_msg03.get(message[6], sensor_message)
+    result.append(Measurement('Message', sensor_message, None, 'message'))
 
     signal = rfxdecode.decode_signal(message[7])
-    result.append({'key': 'Signal level', 'value': signal})
-
-    output_extra = [
-        ('signal_level', signal),
-        ('id', id1),
-        ('message', message),
-        ('temperature', temperature),
-        ('voltage', voltage)]
+    result.append(Measurement('Signal level', signal, None, 'signal_level'))
 
-    return result, output_extra
+    return result
 
 
+@rfxdecode.register(0x71, (11,), ('message', 'subtype', 'seqnbr', 'id1', 'id2'), id_bytes=2)
 def decode_0x71(message, subtype, seqnbr, id1, id2):
     """
     0x71 RFXmeter
@@ -89,27 +75,24 @@ def decode_0x71(message, subtype, seqnbr, id1, id2):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_71[subtype]
+        display_subtype = RFX.rfx_subtype_71[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
     sensor_id = id1 + id2
-    result.append({'key': 'Id', 'value': sensor_id})
+    result.append(Measurement('Id', sensor_id, None, 'id'))
 
     sensor_power = rfxdecode.decode_power(message[7], message[8], message[9])
-    result.append({'key': 'Power', 'value': sensor_power})
-
-    output_extra = [
-        ('id', sensor_id),
-        ('power', sensor_power)]
+    result.append(Measurement('Power', sensor_power, None, 'power'))
 
-    return result, output_extra
+    return result
 
 
-def decode_0x72(subtype, seqnbr):
+@rfxdecode.register(0x72, (10,), ('message', 'subtype', 'seqnbr'), id_bytes=0)
+def decode_0x72(message, subtype, seqnbr):
     """
     0x72 FS20
     """
@@ -117,11 +100,11 @@ def decode_0x72(subtype, seqnbr):
     result = list()
 
     try:
-        display_subtype = RFX.rfx_subtype_72[subtype]
+        display_subtype = RFX.rfx_subtype_72[message[2]]
     except KeyError:
         display_subtype = '0x' + subtype
-    result.append({'key': 'Subtype', 'value': display_subtype})
+    result.append(Measurement('Subtype', display_subtype))
 
-    result.append({'key': 'Sequence number', 'value': seqnbr})
+    result.append(Measurement('Sequence number', seqnbr))
 
-    return result, []
+    return result
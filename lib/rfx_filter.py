@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# coding=UTF-8
+"""
+DomoTricks: RFX asset filter
+
+Based on Sebastian Sjoholm work https://github.com/ssjoholm/rfxcmd_gc
+Copyright 2012-2014 Sebastian Sjoholm, sebastian.sjoholm@gmail.com
+Based on Nicolas Béguier work https://github.com/nbeguier/rfxcmd
+Copyright 2018-2023 by Nicolas BEGUIER, nicolas_beguier@hotmail.com
+
+Copyright 2021-2023 Nicolas Béguier
+
+This program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along
+with this program; if not, write to the Free Software Foundation, Inc.,
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+# Standard library
+from collections import Counter
+from logging import getLogger
+
+# DomoTricks libraries
+from lib.rfx_decode import id_bytes
+from lib.rfx_utils import HEX_BYTES
+
+LOGGER = getLogger('domotricks-rfxcmd')
+
+# Interface packets (0x00 control, 0x01 status, 0x02 transmitter response)
+# are never filtered out
+INTERFACE_TYPES = (0x00, 0x01, 0x02)
+
+# ----------------------------------------------------------------------------
+
+def read_keys(filename):
+    """
+    Read a list of asset keys, one per line, '#' starts a comment
+    """
+    keys = set()
+    with open(filename, 'r') as key_file:
+        for line in key_file:
+            key = line.split('#', 1)[0].strip()
+            if key:
+                keys.add(short_key(key))
+    return keys
+
+def short_key(asset_key):
+    """
+    Reduce an asset key to what raw_key can compute: packettype_subtype,
+    followed by the Id if the asset key of this packet type has one
+    """
+    parts = asset_key.lower().split('_')
+    try:
+        has_id = id_bytes(int(parts[0], 16))
+    except ValueError:
+        has_id = None
+    if has_id and len(parts) > 2:
+        return '_'.join(parts[:3])
+    return '_'.join(parts[:2])
+
+def raw_key(message, size):
+    """
+    Return packettype_subtype[_id] of a raw message, size being the number of
+    Id bytes, the prefix of the asset key built once decoded
+    """
+    key = HEX_BYTES[message[1]] + '_' + HEX_BYTES[message[2]]
+    if size and len(message) >= 4 + size:
+        key += '_' + ''.join([HEX_BYTES[byte] for byte in message[4:4 + size]])
+    return key
+
+# ----------------------------------------------------------------------------
+
+class RfxFilter:
+    """
+    Drop unwanted packets before they are decoded.
+
+    The asset key is not known before decoding, so packets are matched on
+    its prefix read from the raw bytes: packet type, subtype and the Id
+    bytes, whose number is registered with the decoder of each packet type.
+    A key file entry matches every unit of an Id, and an entry of only
+    packettype_subtype matches the whole subtype. Packet types whose Id
+    layout is unknown are never filtered out.
+
+    allowed: set of keys to keep, None to keep everything not ignored
+    ignored: set of keys to drop
+    """
+    def __init__(self, allowed=None, ignored=()):
+        self.allowed = None if allowed is None else frozenset(allowed)
+        self.ignored = frozenset(ignored)
+        # Packet type -> number of Id bytes, None when unknown. Filled on first sight.
+        self.id_bytes = dict()
+        # Counters
+        self.accepted = 0
+        self.dropped = Counter()
+
+    def accept(self, message):
+        """
+        Return True if the message has to be decoded, count it otherwise
+        """
+        packettype = message[1] if len(message) > 2 else None
+        if packettype is None or packettype in INTERFACE_TYPES:
+            self.accepted += 1
+            return True
+        try:
+            size = self.id_bytes[packettype]
+        except KeyError:
+            size = self.id_bytes[packettype] = id_bytes(packettype)
+        if size is None:
+            self.accepted += 1
+            return True
+        prefix = HEX_BYTES[packettype] + '_' + HEX_BYTES[message[2]]
+        key = raw_key(message, size)
+        if prefix in self.ignored or key in self.ignored:
+            pass
+        elif self.allowed is None or prefix in self.allowed or key in self.allowed:
+            self.accepted += 1
+            return True
+        self.dropped[key] += 1
+        return False
+
+    def stats(self):
+        """
+        Return the filter counters, dropped packets by key, most frequent first
+        """
+        return {
+            'accepted': self.accepted,
+            'dropped': sum(self.dropped.values()),
+            'dropped_keys': dict(self.dropped.most_common()),
+        }
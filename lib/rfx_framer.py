@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# coding=UTF-8
+"""
+DomoTricks: RFX framer
+
+Based on Sebastian Sjoholm work https://github.com/ssjoholm/rfxcmd_gc
+Copyright 2012-2014 Sebastian Sjoholm, sebastian.sjoholm@gmail.com
+Based on Nicolas Béguier work https://github.com/nbeguier/rfxcmd
+Copyright 2018-2023 by Nicolas BEGUIER, nicolas_beguier@hotmail.com
+
+Copyright 2021-2023 Nicolas Béguier
+
+This program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along
+with this program; if not, write to the Free Software Foundation, Inc.,
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+# Standard library
+from logging import getLogger
+
+LOGGER = getLogger('domotricks-rfxcmd')
+
+# Largest RFXtrx frame: one length byte + 255 bytes
+MAX_FRAME = 256
+
+class RfxFramer:
+    """
+    Cut RFXtrx frames out of a raw byte stream.
+
+    Bytes are appended to a fixed buffer, which is compacted when its tail is
+    full, so that frames are always contiguous and can be handed out as
+    memoryview slices without copying. A frame slice is only valid until the
+    next feed().
+
+    A frame starts on a length byte followed by a packet type byte; it is
+    accepted only if the packet type is known and its length is one of the
+    lengths registered for it. Otherwise bytes are discarded one by one
+    until such a pair is found.
+
+    lookup(packettype) returns the (lengths, decoder, args) registry entry of
+    a packet type, or None if it is unknown.
+    """
+    def __init__(self, lookup, size=4096):
+        self.lookup = lookup
+        # Packet type -> valid frame lengths, None when any length is valid,
+        # False when the packet type is unknown. Filled on first sight.
+        self.packet_lengths = dict()
+        self.buffer = bytearray(max(size, 2 * MAX_FRAME))
+        self.view = memoryview(self.buffer)
+        self.start = 0
+        self.end = 0
+        self.synced = True
+        # Counters
+        self.discarded_bytes = 0
+        self.frames = 0
+        self.resyncs = 0
+
+    def free(self):
+        """
+        Number of bytes that can be fed without overflowing
+        """
+        return len(self.buffer) - (self.end - self.start)
+
+    def feed(self, data):
+        """
+        Append raw bytes to the buffer
+        """
+        size = len(data)
+        if self.end + size > len(self.buffer):
+            pending = self.end - self.start
+            if pending + size > len(self.buffer):
+                raise BufferError('RfxFramer overflow, {} bytes pending'.format(pending))
+            self.buffer[:pending] = self.view[self.start:self.end]
+            self.start = 0
+            self.end = pending
+        self.buffer[self.end:self.end + size] = data
+        self.end += size
+
+    def plausible(self, length, packettype):
+        """
+        Return True if length and packettype can start a frame
+        """
+        if length == 0:
+            return False
+        try:
+            lengths = self.packet_lengths[packettype]
+        except KeyError:
+            entry = self.lookup(packettype)
+            lengths = False if entry is None else entry[0]
+            self.packet_lengths[packettype] = lengths
+        if lengths is False:
+            return False
+        return lengths is None or (length + 1) in lengths
+
+    def discard(self, size=1):
+        """
+        Drop bytes at the head of the buffer, counting a resync per garbage run
+        """
+        if self.synced:
+            self.synced = False
+            self.resyncs += 1
+            LOGGER.warning('RfxFramer lost sync at %s', self.buffer[self.start:self.start + 2].hex())
+        self.start += size
+        self.discarded_bytes += size
+
+    def frames_available(self):
+        """
+        Yield every complete frame in the buffer as a memoryview
+        """
+        while self.end - self.start >= 2:
+            length = self.buffer[self.start]
+            if not self.plausible(length, self.buffer[self.start + 1]):
+                self.discard()
+                continue
+            stop = self.start + length + 1
+            if stop > self.end:
+                break
+            frame = self.view[self.start:stop]
+            self.start = stop
+            self.synced = True
+            self.frames += 1
+            yield frame
+
+    def stats(self):
+        """
+        Return the framer counters
+        """
+        return {
+            'frames': self.frames,
+            'resyncs': self.resyncs,
+            'discarded_bytes': self.discarded_bytes,
+        }
@@ -25,701 +25,897 @@ with this program; if not, write to the Free Software Foundation, Inc.,
 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 """
 
-class rfx_data(dict):
-
-    rfx_cmnd = {
-                '00':'Reset the receiver/transceiver. No answer is transmitted!',
-                '01':'Not used.',
-                '02':'Get Status, return firmware versions and configuration of the interface.',
-                '03':'Set mode msg1-msg5, return firmware versions and configuration of the interface.',
-                '04':'Enable all receiving modes of the receiver/transceiver.',
-                '05':'Enable reporting of undecoded packets.',
-                '06':'Save receiving modes of the receiver/transceiver in non-volatile memory.',
-                '07':'Not used.',
-                '08':'T1 - for internal use by RFXCOM',
-                '09':'T2 - for internal use by RFXCOM'
-                }
-
-    rfx_packettype = {
-                '00':'Interface Control',
-                '01':'Interface Message',
-                '02':'Receiver/Transmitter Message',
-                '03':'Undecoded RF Message',
-                '10':'Lighting1',
-                '11':'Lighting2',
-                '12':'Lighting3',
-                '13':'Lighting4',
-                '14':'Lighting5',
-                '15':'Lighting6',
-                '16':'Chime',
-                '18':'Curtain1',
-                '19':'Blinds1',
-                '1A':'RTS',
-                '20':'Security1',
-                '28':'Camera1',
-                '30':'Remote control and IR',
-                '40':'Thermostat1',
-                '41':'Thermostat2 (Receive not implemented)',
-                '42':'Thermostat3',
-                '50':'Temperature sensors',
-                '51':'Humidity sensors',
-                '52':'Temperature and humidity sensors',
-                '53':'Barometric sensors',
-                '54':'Temperature, humidity and barometric sensors',
-                '55':'Rain sensors',
-                '56':'Wind sensors',
-                '57':'UV sensors',
-                '58':'Date/Time sensors',
-                '59':'Current sensors',
-                '5A':'Energy usage sensors',
-                '5B':'Current + Energy sensors',
-                '5C':'Power sensors',
-                '5D':'Weighting scale',
-                '5E':'Gas usage sensors',
-                '5F':'Water usage sensors',
-                '70':'RFXSensor',
-                '71':'RFXMeter',
-                '72':'FS20'
-                }
-
-    rfx_subtype_01 = {'00':'Response on a mode command'}
-
-    rfx_subtype_01_msg1 = {'50':'310MHz',
-                            '51':'315MHz',
-                            '52':'433.92MHz (Receiver only)',
-                            '53':'433.92MHz (Transceiver)',
-                            '55':'868.00MHz',
-                            '56':'868.00MHz FSK',
-                            '57':'868.30MHz',
-                            '58':'868.30MHz FSK',
-                            '59':'868.35MHz',
-                            '5A':'868.35MHz FSK',
-                            '5B':'868.95MHz'}
-
-    rfx_subtype_01_msg3 = {'128':'Undecoded',
-                            '64':'RFU',
-                            '32':'Byron SX',
-                            '16':'RSL',
-                            '8':'Lightning4',
-                            '4':'FineOffset / Viking',
-                            '2':'Rubicson',
-                            '1':'AE Blyss'}
-
-    rfx_subtype_01_msg4 = {'128':'Blinds T1/T2/T3/T4',
-                            '64':'Blinds T0',
-                            '32':'ProGuard',
-                            '16':'FS20',
-                            '8':'La Crosse',
-                            '4':'Hideki / UPM',
-                            '2':'AD Lightwave RF',
-                            '1':'Mertik'}
-
-    rfx_subtype_01_msg5 = {'128':'Visonic',
-                            '64':'ATI',
-                            '32':'Oregon Scientific',
-                            '16':'Meiantech',
-                            '8':'HomeEasy EU',
-                            '4':'AC',
-                            '2':'ARC',
-                            '1':'X10'}
-
-    rfx_subtype_02 = {'00':'Error, receiver did not lock',
-                        '01':'Transmitter response'}
-
-    rfx_subtype_02_msg1 = {'00':'ACK, transmit OK',
-                            '01':'ACK, but transmit started after 3 seconds delay anyway with RF receive data',
-                            '02':'NAK, transmitter did not lock on the requested transmit frequency',
-                            '03':'NAK, AC address zero in id1-id4 not allowed'}
-
-    rfx_subtype_03 = {'00':'AC',
-                    '01':'ARC',
-                    '02':'ATI',
-                    '03':'Hideki',
-                    '04':'LaCrosse',
-                    '05':'AD',
-                    '06':'Mertik',
-                    '07':'Oregon 1',
-                    '08':'Oregon 2',
-                    '09':'Oregon 3',
-                    '0A':'Proguard',
-                    '0B':'Visionic',
-                    '0C':'NEC',
-                    '0D':'FS20',
-                    '0E':'Reserved',
-                    '0F':'Blinds',
-                    '10':'Rubicson',
-                    '11':'AE',
-                    '12':'Fineoffset'}
-
-    rfx_subtype_10 = {'00':'X10 Lightning',
-                    '01':'ARC',
-                    '02':'ELRO AB400D (Flamingo)',
-                    '03':'Waveman',
-                    '04':'Chacon EMW200',
-                    '05':'IMPULS',
-                    '06':'RisingSun',
-                    '07':'Philips SBC',
-                    '08':'Energenie ENER010',
-                    '09':'Energenie 5-gang',
-                    '0A':'COCO GDR2-2000R'}
-
-    rfx_subtype_10_housecode = {'41':'A',
-                                '42':'B',
-                                '43':'C',
-                                '44':'D',
-                                '45':'E',
-                                '46':'F',
-                                '47':'G',
-                                '48':'H',
-                                '49':'I',
-                                '4A':'J',
-                                '4B':'K',
-                                '4C':'L',
-                                '4D':'M',
-                                '4E':'N',
-                                '4F':'O',
-                                '50':'P'}
-
-    rfx_subtype_10_cmnd = {'00':'Off',
-                            '01':'On',
-                            '02':'Dim',
-                            '03':'Bright',
-                            '05':'All/Group Off',
-                            '06':'All/Group On',
-                            '07':'Chime',
-                            'FF':'Illegal cmnd received'}
-
-    rfx_subtype_11 = {'00':'AC',
-                        '01':'HomeEasy EU',
-                        '02':'Anslut'}
-
-    rfx_subtype_11_cmnd = {'00':'Off',
-                            '01':'On',
-                            '02':'Set level',
-                            '03':'Group Off',
-                            '04':'Group On',
-                            '05':'Set Group Level'}
-
-    rfx_subtype_11_dimlevel = {'00':'0',
-                                '01':'6',
-                                '02':'12',
-                                '03':'18',
-                                '04':'24',
-                                '05':'30',
-                                '06':'36',
-                                '07':'42',
-                                '08':'48',
-                                '09':'54',
-                                '0A':'60',
-                                '0B':'66',
-                                '0C':'72',
-                                '0D':'78',
-                                '0E':'84',
-                                '0F':'100'}
-
-    rfx_subtype_12 = {'00':'Ikea Koppla'}
-
-    rfx_subtype_12_cmnd = {'00':'Bright',
-                            '08':'Dim',
-                            '10':'On',
-                            '11':'Level 1',
-                            '12':'Level 2',
-                            '13':'Level 3',
-                            '14':'Level 4',
-                            '15':'Level 5',
-                            '16':'Level 6',
-                            '17':'Level 7',
-                            '18':'Level 8',
-                            '19':'Level 9',
-                            '1A':'Off',
-                            '1C':'Program'}
-
-    rfx_subtype_13 = {'00':'PT2262'}
-
-    rfx_subtype_14 = {'00':'LightwaveRF, Siemens',
-                        '01':'EMW100 GAO/Everflourish',
-                        '02':'BBSB new types',
-                        '03':'MDREMOTE LED dimmer',
-                        '04':'Conrad RSL2',
-                        '05':'Livolo',
-                        '06':'RGB TRC02',
-                        '11':'Chacon Plug 54661'}
-
-    # 0x00 LightwaveRF, Siemens
-    rfx_subtype_14_cmnd0 = {'00':'Off',
-                            '01':'On',
-                            '02':'Group off',
-                            '03':'Mood1',
-                            '04':'Mood2',
-                            '05':'Mood3',
-                            '06':'Mood4',
-                            '07':'Mood5',
-                            '08':'Reserved',
-                            '09':'Reserved',
-                            '0A':'Unlock',
-                            '0B':'Lock',
-                            '0C':'All lock',
-                            '0D':'Close (inline relay)',
-                            '0E':'Stop (inline relay)',
-                            '0F':'Open (inline relay)',
-                            '10':'Set level'}
-
-    # 0x01 EMW100 GAO/Everflourish
-    rfx_subtype_14_cmnd1 = {'00':'Off',
-                            '01':'On',
-                            '02':'Learn'}
-
-    # 0x02 BBSB new types
-    rfx_subtype_14_cmnd2 = {'00':'Off',
-                            '01':'On',
-                            '02':'Group Off',
-                            '03':'Group On'}
-
-    # 0x03 MDREMOTE LED dimmer
-    rfx_subtype_14_cmnd3 = {'00':'Power',
-                            '01':'Light',
-                            '02':'Bright',
-                            '03':'Dim',
-                            '04':'100%',
-                            '05':'50%',
-                            '06':'25%',
-                            '07':'Mode+',
-                            '08':'Speed-',
-                            '09':'Speed+',
-                            '0A':'Mode-'}
-
-    # 0x04 Conrad RSL2
-    rfx_subtype_14_cmnd4 = {'00':'Off',
-                            '01':'On',
-                            '02':'Group Off',
-                            '03':'Group On'}
-
-    # 0x05 Livolo
-    rfx_subtype_14_cmnd5 = {'00':'Group Off',
-                            '01':'On/Off dimmer or gang1',
-                            '02':'Dim+ or gang2 on/off',
-                            '03':'Dim- or gang3 on/off'}
-
-    # 0x06 TRC02
-    rfx_subtype_14_cmnd6 = {'00':'Off',
-                            '01':'On',
-                            '02':'Bright',
-                            '03':'Dim',
-                            '04':'Color+',
-                            '05':'Color-'}
-
-    # 0x11 Chacon
-    rfx_subtype_14_cmnd11 = {'00':'Off',
-                             '01':'On'}
-
-    rfx_subtype_15 = {'00':'Blyss'}
-
-    rfx_subtype_15_groupcode = {'41':'A',
-                                '42':'B',
-                                '43':'C',
-                                '44':'D',
-                                '45':'E',
-                                '46':'F',
-                                '47':'G',
-                                '48':'H'}
-
-    rfx_subtype_15_cmnd = {'00':'On',
-                            '01':'Off',
-                            '02':'group On',
-                            '03':'group Off'}
-
-    rfx_subtype_16 = {'00':'Byron SX',
-                        '01':'Byron MP001',
-                        '02':'SelectPlus',
-                        '03':'RFU',
-                        '04':'Envivo'}
-
-    rfx_subtype_16_sound = {'01':'Tubular 3 notes',
-                            '03':'Big Ben',
-                            '05':'Tubular 2 notes',
-                            '09':'Solo',
-                            '0D':'Tubular 3 notes',
-                            '0E':'Big Ben',
-                            '06':'Tubular 2 notes',
-                            '02':'Solo'}
-
-    rfx_subtype_17 = {'00':'Siemens SF01 - LF959RA50/LF259RB50/LF959RB50'}
-
-    rfx_subtype_18 = {'00':'Harrison Curtain'}
-
-    rfx_subtype_19 = {'00':'BlindsT0 / Rollertrol, Hasta new',
-                        '01':'BlindsT1 / Hasta old',
-                        '02':'BlindsT2 / A-OK RF01',
-                        '03':'BlindsT3 / A-OK AC114',
-                        '04':'BlindsT4 / Raex YR1326',
-                        '05':'BlindsT5 / Media Mount',
-                        '06':'BlindsT6 / DC106/Rohrmotor24-RMF/Yooda',
-                        '07':'BlindsT7 / Forest'}
-
-    rfx_subtype_1A = {'00':'RTS',
-                        '01':'RTS ext (not yet fully implemented)'}
-
-    rfx_subtype_1A_cmnd = {'00':'Stop',
-                            '01':'Up',
-                            '02':'Up+Stop (Set upper limit)',
-                            '03':'Down',
-                            '04':'Down+Stop (Set lower limit)',
-                            '05':'Up+Down (Connect motor)',
-                            '07':'Program',
-                            '08':'Program > 2 seconds',
-                            '09':'Program > 7 seconds',
-                            '0A':'Stop > 2 seconds (Set position / Change direction)',
-                            '0B':'Stop > 5 seconds (Set middle position)',
-                            '0C':'Up+Down > 5 seconds (Change upper position)',
-                            '0D':'Erase this RTS remote from RFXtrx',
-                            '0E':'Erase all RTS remotes from the RFXtrx'}
-
-    rfx_subtype_20 = {'00':'X10 security door/window sensor',
-                        '01':'X10 security motion sensor',
-                        '02':'X10 security remote (no alive packets)',
-                        '03':'KD101 (no alive packets)',
-                        '04':'Visonic PowerCode door/window sensor - Primary contact (with alive packets)',
-                        '05':'Visonic PowerCode motion sensor (with alive packets)',
-                        '06':'Visonic CodeSecure (no alive packets)',
-                        '07':'Visonic PowerCode door/window sensor - auxiliary contact (no alive packets)',
-                        '08':'Meiantech/Atlantic/Aidebao',
-                        '09':'Alecto SA30 smoke detector'}
-
-    rfx_subtype_20_status = {'00':'Normal',
-                            '01':'Normal delayed',
-                            '02':'Alarm',
-                            '03':'Alarm delayed',
-                            '04':'Motion',
-                            '05':'No motion',
-                            '06':'Panic',
-                            '07':'End panic',
-                            '08':'IR',
-                            '09':'Arm away',
-                            '0A':'Arm away delayed',
-                            '0B':'Arm home',
-                            '0C':'Arm home delayed',
-                            '0D':'Disarm',
-                            '10':'Light 1 off',
-                            '11':'Light 1 on',
-                            '12':'Light 2 off',
-                            '13':'Light 2 on',
-                            '14':'Dark detected',
-                            '15':'Light detected',
-                            '16':'Batlow (SD18, CO18)',
-                            '17':'Pair (KD101)',
-                            '80':'Normal + tamper',
-                            '81':'Normal delayed + tamper',
-                            '82':'Alarm + tamper',
-                            '83':'Normal delayed + tamper',
-                            '84':'Motion + tamper',
-                            '85':'No motion + tamper'}
-
-    rfx_subtype_28 = {'00':'X10 Ninja'}
-
-    rfx_subtype_30 = {'00':'ATI Remote Wonder',
-                        '01':'ATI Remote Wonder Plus',
-                        '02':'Medion Remote',
-                        '03':'X10 PC Remote',
-                        '04':'ATI Remote Wonder II (receive only)'}
-
-    rfx_subtype_30_atiremotewonder = {'00':'A',
-                                    '01':'B',
-                                    '02':'Power',
-                                    '03':'TV',
-                                    '04':'DVD',
-                                    '05':'?',
-                                    '06':'Guide',
-                                    '07':'Drag',
-                                    '08':'VOL+',
-                                    '09':'VOL-',
-                                    '0A':'MUTE',
-                                    '0B':'CHAN+',
-                                    '0C':'CHAN-',
-                                    '0D':'1',
-                                    '0E':'2',
-                                    '0F':'3',
-                                    '10':'4',
-                                    '11':'5',
-                                    '12':'6',
-                                    '13':'7',
-                                    '14':'8',
-                                    '15':'9',
-                                    '16':'txt',
-                                    '17':'0',
-                                    '18':'Snapshot ESQ',
-                                    '19':'C',
-                                    '1A':'^',
-                                    '1B':'D',
-                                    '1C':'TV/RADIO',
-                                    '1D':'<',
-                                    '1E':'OK',
-                                    '1F':'>',
-                                    '20':'<-',
-                                    '21':'E',
-                                    '22':'v',
-                                    '23':'F',
-                                    '24':'Rewind',
-                                    '25':'Play',
-                                    '26':'Fast forward',
-                                    '27':'Record',
-                                    '28':'Stop',
-                                    '29':'Pause',
-                                    '2C':'TV',
-                                    '2D':'VCR',
-                                    '2E':'RADIO',
-                                    '2F':'TV Preview',
-                                    '30':'Channel list',
-                                    '31':'Video Desktop',
-                                    '32':'red',
-                                    '33':'green',
-                                    '34':'yellow',
-                                    '35':'blue',
-                                    '36':'rename TAB',
-                                    '37':'Acquire image',
-                                    '38':'edit image',
-                                    '39':'Full Screen',
-                                    '3A':'DVD Audio',
-                                    '70':'Cursor-left',
-                                    '71':'Cursor-right',
-                                    '72':'Cursor-up',
-                                    '73':'Cursor-down',
-                                    '74':'Cursor-up-left',
-                                    '75':'Cursor-up-right',
-                                    '76':'Cursor-down-right',
-                                    '77':'Cursor-down-left',
-                                    '78':'V',
-                                    '79':'V-End',
-                                    '7C':'X',
-                                    '7D':'X-End'}
-
-    rfx_subtype_30_medion = {'00':'Mute',
-                            '01':'B',
-                            '02':'Power',
-                            '03':'TV',
-                            '04':'DVD',
-                            '05':'Photo',
-                            '06':'Music',
-                            '07':'Drag',
-                            '08':'VOL-',
-                            '09':'VOL+',
-                            '0A':'MUTE',
-                            '0B':'CHAN+',
-                            '0C':'CHAN-',
-                            '0D':'1',
-                            '0E':'2',
-                            '0F':'3',
-                            '10':'4',
-                            '11':'5',
-                            '12':'6',
-                            '13':'7',
-                            '14':'8',
-                            '15':'9',
-                            '16':'txt',
-                            '17':'0',
-                            '18':'snapshot ESQ',
-                            '19':'DVD MENU',
-                            '1A':'^',
-                            '1B':'Setup',
-                            '1C':'TV/RADIO',
-                            '1D':'<',
-                            '1E':'OK',
-                            '1F':'>',
-                            '20':'<-',
-                            '21':'E',
-                            '22':'v',
-                            '23':'F',
-                            '24':'Rewind',
-                            '25':'Play',
-                            '26':'Fast forward',
-                            '27':'Record',
-                            '28':'Stop',
-                            '29':'Pause',
-                            '2C':'TV',
-                            '2D':'VCR',
-                            '2E':'RADIO',
-                            '2F':'TV Preview',
-                            '30':'Channel List',
-                            '31':'Video desktop',
-                            '32':'red',
-                            '33':'green',
-                            '34':'yellow',
-                            '35':'blue',
-                            '36':'rename TAB',
-                            '37':'Acquire image',
-                            '38':'edit image',
-                            '39':'Full screen',
-                            '3A':'DVD Audio',
-                            '70':'Cursor-left',
-                            '71':'Cursor-right',
-                            '72':'Cursor-up',
-                            '73':'Cursor-down',
-                            '74':'Cursor-up-left',
-                            '75':'Cursor-up-right',
-                            '76':'Cursor-down-right',
-                            '77':'Cursor-down-left',
-                            '78':'V',
-                            '79':'V-End',
-                            '7C':'X',
-                            '7D':'X-End'}
-
-    rfx_subtype_40 = {'00':'Digimax',
-                        '01':'Digimax with short format (no set point)'}
-
-    rfx_subtype_40_status = {'0':'No status available',
-                            '1':'Demand',
-                            '2':'No demand',
-                            '3':'Initializing'}
-
-    rfx_subtype_40_mode = {'0':'Heating',
-                            '1':'Cooling'}
-
-    rfx_subtype_41 = {'00':'HE105',
-                        '01':'RTS10, RFS10, TLX1206'}
-
-    rfx_subtype_42 = {'00':'Mertik G6R-H4T1',
-                        '01':'Mertik G6R-H4TB / G6-H4T / G6R-H4T21-Z22'}
-
-    rfx_subtype_42_cmd00 = {'00':'Off',
-                            '01':'On',
-                            '02':'Up',
-                            '03':'Down',
-                            '04':'Run Up',
-                            '05':'Run Down',
-                            '06':'Stop'}
-
-    rfx_subtype_42_cmd01 = {'00':'Off',
-                            '01':'On',
-                            '02':'Up',
-                            '03':'Down',
-                            '04':'2nd Off',
-                            '05':'2nd On'}
-
-    rfx_subtype_4E = {'00':'Maverick ET-732'}
-
-    rfx_subtype_50 = {'01':'THR128/138, THC138',
-                        '02':'THC238/268,THN132,THWR288,THRN122,THN122,AW129/131',
-                        '03':'THWR800',
-                        '04':'RTHN318',
-                        '05':'La Crosse TX2, TX3, TX4, TX17',
-                        '06':'TS15C',
-                        '07':'Viking 02811',
-                        '08':'La Crosse WS2300',
-                        '09':'RUBiCSON',
-                        '0A':'TFA 30.3133'}
-
-    rfx_subtype_51 = {'01':'LaCrosse TX3',
-                        '02':'LaCrosse WS2300'}
-
-    rfx_subtype_51_humstatus = {'00':'Dry',
-                                '01':'Comfort',
-                                '02':'Normal',
-                                '03':'Wet'}
-
-    rfx_subtype_52 = {'01':'THGN122/123, THGN132, THGR122/228/238/268',
-                        '02':'THGR810, THGN800',
-                        '03':'RTGR328',
-                        '04':'THGR328',
-                        '05':'WTGR800',
-                        '06':'THGR918, THGRN228, THGN50',
-                        '07':'TFA TS34C, Cresta',
-                        '08':'WT260,WT260H,WT440H,WT450,WT450H',
-                        '09':'Viking 02035, 02038',
-                        '0A':'Rubicson',
-                        '0B':'EW109',
-                        '0C':'Imagintronix Soil Sensor',
-                        '0D':'Alecto WS1700 and compatibles',
-                        '0E':'Alecto WS4500, Auriol H13726, Hama EWS1500, Meteoscan W155/W160,Ventus WS155'}
-
-    rfx_subtype_52_humstatus = {'00':'Dry',
-                                '01':'Comfort',
-                                '02':'Normal',
-                                '03':'Wet'}
-
-    rfx_subtype_53 = {'01':'Reserved for future use'}
-
-    rfx_subtype_54 = {'01':'BTHR918',
-                        '02':'BTHR918N, BTHR968'}
-
-    rfx_subtype_54_humstatus = {'00':'Normal',
-                                '01':'Comfort',
-                                '02':'Dry',
-                                '03':'Wet'}
-
-    rfx_subtype_54_forecast = {'00':'No forecast available',
-                                '01':'Sunny',
-                                '02':'Partly cloudy',
-                                '03':'Cloudy',
-                                '04':'Rainy'}
-
-    rfx_subtype_55 = {'01':'RGR126/682/918',
-                        '02':'PCR800',
-                        '03':'TFA',
-                        '04':'UPM RG700',
-                        '05':'WS2300',
-                        '06':'La Crosse TX5'}
-
-    rfx_subtype_56 = {'01':'WTGR800',
-                        '02':'WGR800',
-                        '03':'STR918, WGR918, WGR928',
-                        '04':'TFA',
-                        '05':'UPM WDS500',
-                        '06':'WS2300',
-                        '07':'Alecto WS4500, Auriol H13726, Hama EWS1500, Meteoscan W155/W160, Ventus WS155'}
-
-    rfx_subtype_57 = {'01':'UVN128, UV138',
-                        '02':'UVN800',
-                        '03':'TFA'}
-
-    rfx_subtype_58 = {'01':'RTGR328N'}
-
-    rfx_subtype_59 = {'01':'CM113, Electrisave, cent-a-meter'}
-
-    rfx_subtype_5A = {'01':'CM119/160',
-                        '02':'CM180'}
-
-    rfx_subtype_5B = {'01':'CM180i'}
-
-    rfx_subtype_5C = {'01':'Revolt'}
-
-    rfx_subtype_5D = {'01':'BWR101/102',
-                        '02':'GR101'}
-
-    rfx_subtype_5E = {'01':'Gas usage sensor'}
-
-    rfx_subtype_5F = {'01':'Water usage sensor'}
-
-    rfx_subtype_70 = {'00':'RFXSensor temperature',
-                        '01':'RFXSensor A/S',
-                        '02':'RFXSensor voltage',
-                        '03':'RFXSensor message'}
-
-    rfx_subtype_70_msg03 = {'01':'Sensor addresses incremented',
-                            '02':'Battery low detected',
-                            '81':'No 1-wire device connected',
-                            '82':'1-Wire ROM CRC error',
-                            '83':'1-Wire device connected is not a DS18B20 or DS2438',
-                            '84':'No end of read signal received from 1-Wire device',
-                            '85':'1-Wire scratchpad CRC error'}
-
-    rfx_subtype_71 = {'00':'Normal data packet',
-                        '01':'New interval time set',
-                        '02':'Calibrate value in <count> in usec',
-                        '03':'New address set',
-                        '04':'Counter value reset within 5 seconds',
-                        '0B':'Counter value reset executed',
-                        '0C':'Set interval mode within 5 seconds',
-                        '0D':'Calibration mode within 5 seconds',
-                        '0E':'Set address mode within 5 seconds',
-                        '0F':'Identification packet'}
-
-    rfx_subtype_72 = {'00':'FS20',
-                        '01':'FHT8V valve',
-                        '02':'FHT80 door/window sensor'}
-
-    rfx_subtype_7F = {'00':'Raw transmit'}
-
-    def __getitem__(self, key):
-        return self[key]
+# Standard library
+from types import MappingProxyType
+
+def _tables_common():
+    """
+    Tables shared by every packet type
+    """
+    return {
+        'rfx_cmnd': {
+            0x00: 'Reset the receiver/transceiver. No answer is transmitted!',
+            0x01: 'Not used.',
+            0x02: 'Get Status, return firmware versions and configuration of the interface.',
+            0x03: 'Set mode msg1-msg5, return firmware versions and configuration of the interface.',
+            0x04: 'Enable all receiving modes of the receiver/transceiver.',
+            0x05: 'Enable reporting of undecoded packets.',
+            0x06: 'Save receiving modes of the receiver/transceiver in non-volatile memory.',
+            0x07: 'Not used.',
+            0x08: 'T1 - for internal use by RFXCOM',
+            0x09: 'T2 - for internal use by RFXCOM',
+        },
+        'rfx_packettype': {
+            0x00: 'Interface Control',
+            0x01: 'Interface Message',
+            0x02: 'Receiver/Transmitter Message',
+            0x03: 'Undecoded RF Message',
+            0x10: 'Lighting1',
+            0x11: 'Lighting2',
+            0x12: 'Lighting3',
+            0x13: 'Lighting4',
+            0x14: 'Lighting5',
+            0x15: 'Lighting6',
+            0x16: 'Chime',
+            0x18: 'Curtain1',
+            0x19: 'Blinds1',
+            0x1A: 'RTS',
+            0x20: 'Security1',
+            0x28: 'Camera1',
+            0x30: 'Remote control and IR',
+            0x40: 'Thermostat1',
+            0x41: 'Thermostat2 (Receive not implemented)',
+            0x42: 'Thermostat3',
+            0x50: 'Temperature sensors',
+            0x51: 'Humidity sensors',
+            0x52: 'Temperature and humidity sensors',
+            0x53: 'Barometric sensors',
+            0x54: 'Temperature, humidity and barometric sensors',
+            0x55: 'Rain sensors',
+            0x56: 'Wind sensors',
+            0x57: 'UV sensors',
+            0x58: 'Date/Time sensors',
+            0x59: 'Current sensors',
+            0x5A: 'Energy usage sensors',
+            0x5B: 'Current + Energy sensors',
+            0x5C: 'Power sensors',
+            0x5D: 'Weighting scale',
+            0x5E: 'Gas usage sensors',
+            0x5F: 'Water usage sensors',
+            0x70: 'RFXSensor',
+            0x71: 'RFXMeter',
+            0x72: 'FS20',
+        },
+    }
+
+# ----------------------------------------------------------------------------
+
+def _tables_0x0():
+    """
+    0x00 - 0x0F: interface messages
+    """
+    return {
+        'rfx_subtype_01': {
+            0x00: 'Response on a mode command',
+        },
+        'rfx_subtype_01_msg1': {
+            0x50: '310MHz',
+            0x51: '315MHz',
+            0x52: '433.92MHz (Receiver only)',
+            0x53: '433.92MHz (Transceiver)',
+            0x55: '868.00MHz',
+            0x56: '868.00MHz FSK',
+            0x57: '868.30MHz',
+            0x58: '868.30MHz FSK',
+            0x59: '868.35MHz',
+            0x5A: '868.35MHz FSK',
+            0x5B: '868.95MHz',
+        },
+        'rfx_subtype_01_msg3': {
+            128: 'Undecoded',
+            64: 'RFU',
+            32: 'Byron SX',
+            16: 'RSL',
+            8: 'Lightning4',
+            4: 'FineOffset / Viking',
+            2: 'Rubicson',
+            1: 'AE Blyss',
+        },
+        'rfx_subtype_01_msg4': {
+            128: 'Blinds T1/T2/T3/T4',
+            64: 'Blinds T0',
+            32: 'ProGuard',
+            16: 'FS20',
+            8: 'La Crosse',
+            4: 'Hideki / UPM',
+            2: 'AD Lightwave RF',
+            1: 'Mertik',
+        },
+        'rfx_subtype_01_msg5': {
+            128: 'Visonic',
+            64: 'ATI',
+            32: 'Oregon Scientific',
+            16: 'Meiantech',
+            8: 'HomeEasy EU',
+            4: 'AC',
+            2: 'ARC',
+            1: 'X10',
+        },
+        'rfx_subtype_02': {
+            0x00: 'Error, receiver did not lock',
+            0x01: 'Transmitter response',
+        },
+        'rfx_subtype_02_msg1': {
+            0x00: 'ACK, transmit OK',
+            0x01: 'ACK, but transmit started after 3 seconds delay anyway with RF receive data',
+            0x02: 'NAK, transmitter did not lock on the requested transmit frequency',
+            0x03: 'NAK, AC address zero in id1-id4 not allowed',
+        },
+        'rfx_subtype_03': {
+            0x00: 'AC',
+            0x01: 'ARC',
+            0x02: 'ATI',
+            0x03: 'Hideki',
+            0x04: 'LaCrosse',
+            0x05: 'AD',
+            0x06: 'Mertik',
+            0x07: 'Oregon 1',
+            0x08: 'Oregon 2',
+            0x09: 'Oregon 3',
+            0x0A: 'Proguard',
+            0x0B: 'Visionic',
+            0x0C: 'NEC',
+            0x0D: 'FS20',
+            0x0E: 'Reserved',
+            0x0F: 'Blinds',
+            0x10: 'Rubicson',
+            0x11: 'AE',
+            0x12: 'Fineoffset',
+        },
+    }
+
+# ----------------------------------------------------------------------------
+
+def _tables_0x1():
+    """
+    0x10 - 0x1F: lighting, chime, curtain and blinds
+    """
+    return {
+        'rfx_subtype_10': {
+            0x00: 'X10 Lightning',
+            0x01: 'ARC',
+            0x02: 'ELRO AB400D (Flamingo)',
+            0x03: 'Waveman',
+            0x04: 'Chacon EMW200',
+            0x05: 'IMPULS',
+            0x06: 'RisingSun',
+            0x07: 'Philips SBC',
+            0x08: 'Energenie ENER010',
+            0x09: 'Energenie 5-gang',
+            0x0A: 'COCO GDR2-2000R',
+        },
+        'rfx_subtype_10_housecode': {
+            0x41: 'A',
+            0x42: 'B',
+            0x43: 'C',
+            0x44: 'D',
+            0x45: 'E',
+            0x46: 'F',
+            0x47: 'G',
+            0x48: 'H',
+            0x49: 'I',
+            0x4A: 'J',
+            0x4B: 'K',
+            0x4C: 'L',
+            0x4D: 'M',
+            0x4E: 'N',
+            0x4F: 'O',
+            0x50: 'P',
+        },
+        'rfx_subtype_10_cmnd': {
+            0x00: 'Off',
+            0x01: 'On',
+            0x02: 'Dim',
+            0x03: 'Bright',
+            0x05: 'All/Group Off',
+            0x06: 'All/Group On',
+            0x07: 'Chime',
+            0xFF: 'Illegal cmnd received',
+        },
+        'rfx_subtype_11': {
+            0x00: 'AC',
+            0x01: 'HomeEasy EU',
+            0x02: 'Anslut',
+        },
+        'rfx_subtype_11_cmnd': {
+            0x00: 'Off',
+            0x01: 'On',
+            0x02: 'Set level',
+            0x03: 'Group Off',
+            0x04: 'Group On',
+            0x05: 'Set Group Level',
+        },
+        'rfx_subtype_11_dimlevel': {
+            0x00: '0',
+            0x01: '6',
+            0x02: '12',
+            0x03: '18',
+            0x04: '24',
+            0x05: '30',
+            0x06: '36',
+            0x07: '42',
+            0x08: '48',
+            0x09: '54',
+            0x0A: '60',
+            0x0B: '66',
+            0x0C: '72',
+            0x0D: '78',
+            0x0E: '84',
+            0x0F: '100',
+        },
+        'rfx_subtype_12': {
+            0x00: 'Ikea Koppla',
+        },
+        'rfx_subtype_12_cmnd': {
+            0x00: 'Bright',
+            0x08: 'Dim',
+            0x10: 'On',
+            0x11: 'Level 1',
+            0x12: 'Level 2',
+            0x13: 'Level 3',
+            0x14: 'Level 4',
+            0x15: 'Level 5',
+            0x16: 'Level 6',
+            0x17: 'Level 7',
+            0x18: 'Level 8',
+            0x19: 'Level 9',
+            0x1A: 'Off',
+            0x1C: 'Program',
+        },
+        'rfx_subtype_13': {
+            0x00: 'PT2262',
+        },
+        'rfx_subtype_14': {
+            0x00: 'LightwaveRF, Siemens',
+            0x01: 'EMW100 GAO/Everflourish',
+            0x02: 'BBSB new types',
+            0x03: 'MDREMOTE LED dimmer',
+            0x04: 'Conrad RSL2',
+            0x05: 'Livolo',
+            0x06: 'RGB TRC02',
+            0x11: 'Chacon Plug 54661',
+        },
+        'rfx_subtype_14_cmnd0': {
+            0x00: 'Off',
+            0x01: 'On',
+            0x02: 'Group off',
+            0x03: 'Mood1',
+            0x04: 'Mood2',
+            0x05: 'Mood3',
+            0x06: 'Mood4',
+            0x07: 'Mood5',
+            0x08: 'Reserved',
+            0x09: 'Reserved',
+            0x0A: 'Unlock',
+            0x0B: 'Lock',
+            0x0C: 'All lock',
+            0x0D: 'Close (inline relay)',
+            0x0E: 'Stop (inline relay)',
+            0x0F: 'Open (inline relay)',
+            0x10: 'Set level',
+        },
+        'rfx_subtype_14_cmnd1': {
+            0x00: 'Off',
+            0x01: 'On',
+            0x02: 'Learn',
+        },
+        'rfx_subtype_14_cmnd2': {
+            0x00: 'Off',
+            0x01: 'On',
+            0x02: 'Group Off',
+            0x03: 'Group On',
+        },
+        'rfx_subtype_14_cmnd3': {
+            0x00: 'Power',
+            0x01: 'Light',
+            0x02: 'Bright',
+            0x03: 'Dim',
+            0x04: '100%',
+            0x05: '50%',
+            0x06: '25%',
+            0x07: 'Mode+',
+            0x08: 'Speed-',
+            0x09: 'Speed+',
+            0x0A: 'Mode-',
+        },
+        'rfx_subtype_14_cmnd4': {
+            0x00: 'Off',
+            0x01: 'On',
+            0x02: 'Group Off',
+            0x03: 'Group On',
+        },
+        'rfx_subtype_14_cmnd5': {
+            0x00: 'Group Off',
+            0x01: 'On/Off dimmer or gang1',
+            0x02: 'Dim+ or gang2 on/off',
+            0x03: 'Dim- or gang3 on/off',
+        },
+        'rfx_subtype_14_cmnd6': {
+            0x00: 'Off',
+            0x01: 'On',
+            0x02: 'Bright',
+            0x03: 'Dim',
+            0x04: 'Color+',
+            0x05: 'Color-',
+        },
+        'rfx_subtype_14_cmnd11': {
+            0x00: 'Off',
+            0x01: 'On',
+        },
+        'rfx_subtype_15': {
+            0x00: 'Blyss',
+        },
+        'rfx_subtype_15_groupcode': {
+            0x41: 'A',
+            0x42: 'B',
+            0x43: 'C',
+            0x44: 'D',
+            0x45: 'E',
+            0x46: 'F',
+            0x47: 'G',
+            0x48: 'H',
+        },
+        'rfx_subtype_15_cmnd': {
+            0x00: 'On',
+            0x01: 'Off',
+            0x02: 'group On',
+            0x03: 'group Off',
+        },
+        'rfx_subtype_16': {
+            0x00: 'Byron SX',
+            0x01: 'Byron MP001',
+            0x02: 'SelectPlus',
+            0x03: 'RFU',
+            0x04: 'Envivo',
+        },
+        'rfx_subtype_16_sound': {
+            0x01: 'Tubular 3 notes',
+            0x03: 'Big Ben',
+            0x05: 'Tubular 2 notes',
+            0x09: 'Solo',
+            0x0D: 'Tubular 3 notes',
+            0x0E: 'Big Ben',
+            0x06: 'Tubular 2 notes',
+            0x02: 'Solo',
+        },
+        'rfx_subtype_17': {
+            0x00: 'Siemens SF01 - LF959RA50/LF259RB50/LF959RB50',
+        },
+        'rfx_subtype_18': {
+            0x00: 'Harrison Curtain',
+        },
+        'rfx_subtype_19': {
+            0x00: 'BlindsT0 / Rollertrol, Hasta new',
+            0x01: 'BlindsT1 / Hasta old',
+            0x02: 'BlindsT2 / A-OK RF01',
+            0x03: 'BlindsT3 / A-OK AC114',
+            0x04: 'BlindsT4 / Raex YR1326',
+            0x05: 'BlindsT5 / Media Mount',
+            0x06: 'BlindsT6 / DC106/Rohrmotor24-RMF/Yooda',
+            0x07: 'BlindsT7 / Forest',
+        },
+        'rfx_subtype_1A': {
+            0x00: 'RTS',
+            0x01: 'RTS ext (not yet fully implemented)',
+        },
+        'rfx_subtype_1A_cmnd': {
+            0x00: 'Stop',
+            0x01: 'Up',
+            0x02: 'Up+Stop (Set upper limit)',
+            0x03: 'Down',
+            0x04: 'Down+Stop (Set lower limit)',
+            0x05: 'Up+Down (Connect motor)',
+            0x07: 'Program',
+            0x08: 'Program > 2 seconds',
+            0x09: 'Program > 7 seconds',
+            0x0A: 'Stop > 2 seconds (Set position / Change direction)',
+            0x0B: 'Stop > 5 seconds (Set middle position)',
+            0x0C: 'Up+Down > 5 seconds (Change upper position)',
+            0x0D: 'Erase this RTS remote from RFXtrx',
+            0x0E: 'Erase all RTS remotes from the RFXtrx',
+        },
+    }
+
+# ----------------------------------------------------------------------------
+
+def _tables_0x2():
+    """
+    0x20 - 0x2F: security and camera
+    """
+    return {
+        'rfx_subtype_20': {
+            0x00: 'X10 security door/window sensor',
+            0x01: 'X10 security motion sensor',
+            0x02: 'X10 security remote (no alive packets)',
+            0x03: 'KD101 (no alive packets)',
+            0x04: 'Visonic PowerCode door/window sensor - Primary contact (with alive packets)',
+            0x05: 'Visonic PowerCode motion sensor (with alive packets)',
+            0x06: 'Visonic CodeSecure (no alive packets)',
+            0x07: 'Visonic PowerCode door/window sensor - auxiliary contact (no alive packets)',
+            0x08: 'Meiantech/Atlantic/Aidebao',
+            0x09: 'Alecto SA30 smoke detector',
+        },
+        'rfx_subtype_20_status': {
+            0x00: 'Normal',
+            0x01: 'Normal delayed',
+            0x02: 'Alarm',
+            0x03: 'Alarm delayed',
+            0x04: 'Motion',
+            0x05: 'No motion',
+            0x06: 'Panic',
+            0x07: 'End panic',
+            0x08: 'IR',
+            0x09: 'Arm away',
+            0x0A: 'Arm away delayed',
+            0x0B: 'Arm home',
+            0x0C: 'Arm home delayed',
+            0x0D: 'Disarm',
+            0x10: 'Light 1 off',
+            0x11: 'Light 1 on',
+            0x12: 'Light 2 off',
+            0x13: 'Light 2 on',
+            0x14: 'Dark detected',
+            0x15: 'Light detected',
+            0x16: 'Batlow (SD18, CO18)',
+            0x17: 'Pair (KD101)',
+            0x80: 'Normal + tamper',
+            0x81: 'Normal delayed + tamper',
+            0x82: 'Alarm + tamper',
+            0x83: 'Normal delayed + tamper',
+            0x84: 'Motion + tamper',
+            0x85: 'No motion + tamper',
+        },
+        'rfx_subtype_28': {
+            0x00: 'X10 Ninja',
+        },
+    }
+
+# ----------------------------------------------------------------------------
+
+def _tables_0x3():
+    """
+    0x30 - 0x3F: remote control and IR
+    """
+    return {
+        'rfx_subtype_30': {
+            0x00: 'ATI Remote Wonder',
+            0x01: 'ATI Remote Wonder Plus',
+            0x02: 'Medion Remote',
+            0x03: 'X10 PC Remote',
+            0x04: 'ATI Remote Wonder II (receive only)',
+        },
+        'rfx_subtype_30_atiremotewonder': {
+            0x00: 'A',
+            0x01: 'B',
+            0x02: 'Power',
+            0x03: 'TV',
+            0x04: 'DVD',
+            0x05: '?',
+            0x06: 'Guide',
+            0x07: 'Drag',
+            0x08: 'VOL+',
+            0x09: 'VOL-',
+            0x0A: 'MUTE',
+            0x0B: 'CHAN+',
+            0x0C: 'CHAN-',
+            0x0D: '1',
+            0x0E: '2',
+            0x0F: '3',
+            0x10: '4',
+            0x11: '5',
+            0x12: '6',
+            0x13: '7',
+            0x14: '8',
+            0x15: '9',
+            0x16: 'txt',
+            0x17: '0',
+            0x18: 'Snapshot ESQ',
+            0x19: 'C',
+            0x1A: '^',
+            0x1B: 'D',
+            0x1C: 'TV/RADIO',
+            0x1D: '<',
+            0x1E: 'OK',
+            0x1F: '>',
+            0x20: '<-',
+            0x21: 'E',
+            0x22: 'v',
+            0x23: 'F',
+            0x24: 'Rewind',
+            0x25: 'Play',
+            0x26: 'Fast forward',
+            0x27: 'Record',
+            0x28: 'Stop',
+            0x29: 'Pause',
+            0x2C: 'TV',
+            0x2D: 'VCR',
+            0x2E: 'RADIO',
+            0x2F: 'TV Preview',
+            0x30: 'Channel list',
+            0x31: 'Video Desktop',
+            0x32: 'red',
+            0x33: 'green',
+            0x34: 'yellow',
+            0x35: 'blue',
+            0x36: 'rename TAB',
+            0x37: 'Acquire image',
+            0x38: 'edit image',
+            0x39: 'Full Screen',
+            0x3A: 'DVD Audio',
+            0x70: 'Cursor-left',
+            0x71: 'Cursor-right',
+            0x72: 'Cursor-up',
+            0x73: 'Cursor-down',
+            0x74: 'Cursor-up-left',
+            0x75: 'Cursor-up-right',
+            0x76: 'Cursor-down-right',
+            0x77: 'Cursor-down-left',
+            0x78: 'V',
+            0x79: 'V-End',
+            0x7C: 'X',
+            0x7D: 'X-End',
+        },
+        'rfx_subtype_30_medion': {
+            0x00: 'Mute',
+            0x01: 'B',
+            0x02: 'Power',
+            0x03: 'TV',
+            0x04: 'DVD',
+            0x05: 'Photo',
+            0x06: 'Music',
+            0x07: 'Drag',
+            0x08: 'VOL-',
+            0x09: 'VOL+',
+            0x0A: 'MUTE',
+            0x0B: 'CHAN+',
+            0x0C: 'CHAN-',
+            0x0D: '1',
+            0x0E: '2',
+            0x0F: '3',
+            0x10: '4',
+            0x11: '5',
+            0x12: '6',
+            0x13: '7',
+            0x14: '8',
+            0x15: '9',
+            0x16: 'txt',
+            0x17: '0',
+            0x18: 'snapshot ESQ',
+            0x19: 'DVD MENU',
+            0x1A: '^',
+            0x1B: 'Setup',
+            0x1C: 'TV/RADIO',
+            0x1D: '<',
+            0x1E: 'OK',
+            0x1F: '>',
+            0x20: '<-',
+            0x21: 'E',
+            0x22: 'v',
+            0x23: 'F',
+            0x24: 'Rewind',
+            0x25: 'Play',
+            0x26: 'Fast forward',
+            0x27: 'Record',
+            0x28: 'Stop',
+            0x29: 'Pause',
+            0x2C: 'TV',
+            0x2D: 'VCR',
+            0x2E: 'RADIO',
+            0x2F: 'TV Preview',
+            0x30: 'Channel List',
+            0x31: 'Video desktop',
+            0x32: 'red',
+            0x33: 'green',
+            0x34: 'yellow',
+            0x35: 'blue',
+            0x36: 'rename TAB',
+            0x37: 'Acquire image',
+            0x38: 'edit image',
+            0x39: 'Full screen',
+            0x3A: 'DVD Audio',
+            0x70: 'Cursor-left',
+            0x71: 'Cursor-right',
+            0x72: 'Cursor-up',
+            0x73: 'Cursor-down',
+            0x74: 'Cursor-up-left',
+            0x75: 'Cursor-up-right',
+            0x76: 'Cursor-down-right',
+            0x77: 'Cursor-down-left',
+            0x78: 'V',
+            0x79: 'V-End',
+            0x7C: 'X',
+            0x7D: 'X-End',
+        },
+    }
+
+# ----------------------------------------------------------------------------
+
+def _tables_0x4():
+    """
+    0x40 - 0x4F: thermostats
+    """
+    return {
+        'rfx_subtype_40': {
+            0x00: 'Digimax',
+            0x01: 'Digimax with short format (no set point)',
+        },
+        'rfx_subtype_40_status': {
+            0: 'No status available',
+            1: 'Demand',
+            2: 'No demand',
+            3: 'Initializing',
+        },
+        'rfx_subtype_40_mode': {
+            0: 'Heating',
+            1: 'Cooling',
+        },
+        'rfx_subtype_41': {
+            0x00: 'HE105',
+            0x01: 'RTS10, RFS10, TLX1206',
+        },
+        'rfx_subtype_42': {
+            0x00: 'Mertik G6R-H4T1',
+            0x01: 'Mertik G6R-H4TB / G6-H4T / G6R-H4T21-Z22',
+        },
+        'rfx_subtype_42_cmd00': {
+            0x00: 'Off',
+            0x01: 'On',
+            0x02: 'Up',
+            0x03: 'Down',
+            0x04: 'Run Up',
+            0x05: 'Run Down',
+            0x06: 'Stop',
+        },
+        'rfx_subtype_42_cmd01': {
+            0x00: 'Off',
+            0x01: 'On',
+            0x02: 'Up',
+            0x03: 'Down',
+            0x04: '2nd Off',
+            0x05: '2nd On',
+        },
+        'rfx_subtype_4E': {
+            0x00: 'Maverick ET-732',
+        },
+    }
+
+# ----------------------------------------------------------------------------
+
+def _tables_0x5():
+    """
+    0x50 - 0x5F: sensors
+    """
+    return {
+        'rfx_subtype_50': {
+            0x01: 'THR128/138, THC138',
+            0x02: 'THC238/268,THN132,THWR288,THRN122,THN122,AW129/131',
+            0x03: 'THWR800',
+            0x04: 'RTHN318',
+            0x05: 'La Crosse TX2, TX3, TX4, TX17',
+            0x06: 'TS15C',
+            0x07: 'Viking 02811',
+            0x08: 'La Crosse WS2300',
+            0x09: 'RUBiCSON',
+            0x0A: 'TFA 30.3133',
+        },
+        'rfx_subtype_51': {
+            0x01: 'LaCrosse TX3',
+            0x02: 'LaCrosse WS2300',
+        },
+        'rfx_subtype_51_humstatus': {
+            0x00: 'Dry',
+            0x01: 'Comfort',
+            0x02: 'Normal',
+            0x03: 'Wet',
+        },
+        'rfx_subtype_52': {
+            0x01: 'THGN122/123, THGN132, THGR122/228/238/268',
+            0x02: 'THGR810, THGN800',
+            0x03: 'RTGR328',
+            0x04: 'THGR328',
+            0x05: 'WTGR800',
+            0x06: 'THGR918, THGRN228, THGN50',
+            0x07: 'TFA TS34C, Cresta',
+            0x08: 'WT260,WT260H,WT440H,WT450,WT450H',
+            0x09: 'Viking 02035, 02038',
+            0x0A: 'Rubicson',
+            0x0B: 'EW109',
+            0x0C: 'Imagintronix Soil Sensor',
+            0x0D: 'Alecto WS1700 and compatibles',
+            0x0E: 'Alecto WS4500, Auriol H13726, Hama EWS1500, Meteoscan W155/W160,Ventus WS155',
+        },
+        'rfx_subtype_52_humstatus': {
+            0x00: 'Dry',
+            0x01: 'Comfort',
+            0x02: 'Normal',
+            0x03: 'Wet',
+        },
+        'rfx_subtype_53': {
+            0x01: 'Reserved for future use',
+        },
+        'rfx_subtype_54': {
+            0x01: 'BTHR918',
+            0x02: 'BTHR918N, BTHR968',
+        },
+        'rfx_subtype_54_humstatus': {
+            0x00: 'Normal',
+            0x01: 'Comfort',
+            0x02: 'Dry',
+            0x03: 'Wet',
+        },
+        'rfx_subtype_54_forecast': {
+            0x00: 'No forecast available',
+            0x01: 'Sunny',
+            0x02: 'Partly cloudy',
+            0x03: 'Cloudy',
+            0x04: 'Rainy',
+        },
+        'rfx_subtype_55': {
+            0x01: 'RGR126/682/918',
+            0x02: 'PCR800',
+            0x03: 'TFA',
+            0x04: 'UPM RG700',
+            0x05: 'WS2300',
+            0x06: 'La Crosse TX5',
+        },
+        'rfx_subtype_56': {
+            0x01: 'WTGR800',
+            0x02: 'WGR800',
+            0x03: 'STR918, WGR918, WGR928',
+            0x04: 'TFA',
+            0x05: 'UPM WDS500',
+            0x06: 'WS2300',
+            0x07: 'Alecto WS4500, Auriol H13726, Hama EWS1500, Meteoscan W155/W160, Ventus WS155',
+        },
+        'rfx_subtype_57': {
+            0x01: 'UVN128, UV138',
+            0x02: 'UVN800',
+            0x03: 'TFA',
+        },
+        'rfx_subtype_58': {
+            0x01: 'RTGR328N',
+        },
+        'rfx_subtype_59': {
+            0x01: 'CM113, Electrisave, cent-a-meter',
+        },
+        'rfx_subtype_5A': {
+            0x01: 'CM119/160',
+            0x02: 'CM180',
+        },
+        'rfx_subtype_5B': {
+            0x01: 'CM180i',
+        },
+        'rfx_subtype_5C': {
+            0x01: 'Revolt',
+        },
+        'rfx_subtype_5D': {
+            0x01: 'BWR101/102',
+            0x02: 'GR101',
+        },
+        'rfx_subtype_5E': {
+            0x01: 'Gas usage sensor',
+        },
+        'rfx_subtype_5F': {
+            0x01: 'Water usage sensor',
+        },
+    }
+
+# ----------------------------------------------------------------------------
+
+def _tables_0x7():
+    """
+    0x70 - 0x7F: RFXSensor, RFXMeter and FS20
+    """
+    return {
+        'rfx_subtype_70': {
+            0x00: 'RFXSensor temperature',
+            0x01: 'RFXSensor A/S',
+            0x02: 'RFXSensor voltage',
+            0x03: 'RFXSensor message',
+        },
+        'rfx_subtype_70_msg03': {
+            0x01: 'Sensor addresses incremented',
+            0x02: 'Battery low detected',
+            0x81: 'No 1-wire device connected',
+            0x82: '1-Wire ROM CRC error',
+            0x83: '1-Wire device connected is not a DS18B20 or DS2438',
+            0x84: 'No end of read signal received from 1-Wire device',
+            0x85: '1-Wire scratchpad CRC error',
+        },
+        'rfx_subtype_71': {
+            0x00: 'Normal data packet',
+            0x01: 'New interval time set',
+            0x02: 'Calibrate value in <count> in usec',
+            0x03: 'New address set',
+            0x04: 'Counter value reset within 5 seconds',
+            0x0B: 'Counter value reset executed',
+            0x0C: 'Set interval mode within 5 seconds',
+            0x0D: 'Calibration mode within 5 seconds',
+            0x0E: 'Set address mode within 5 seconds',
+            0x0F: 'Identification packet',
+        },
+        'rfx_subtype_72': {
+            0x00: 'FS20',
+            0x01: 'FHT8V valve',
+            0x02: 'FHT80 door/window sensor',
+        },
+        'rfx_subtype_7F': {
+            0x00: 'Raw transmit',
+        },
+    }
+
+# ----------------------------------------------------------------------------
+
+def _family(name):
+    """
+    Return the packet family of a table name, the high nibble of its packet type
+    """
+    if name.startswith('rfx_subtype_'):
+        return name[12]
+    return ''
+
+# Packet family -> tables builder
+FAMILIES = {
+    '': _tables_common,
+    '0': _tables_0x0,
+    '1': _tables_0x1,
+    '2': _tables_0x2,
+    '3': _tables_0x3,
+    '4': _tables_0x4,
+    '5': _tables_0x5,
+    '7': _tables_0x7,
+}
+
+class rfx_data:
+    """
+    Read-only RFX lookup tables, keyed by the integer value of the packet bytes.
+    The tables of a packet family are built on first access.
+    """
+
+    def __getattr__(self, name):
+        # Only called for the tables of a family which is not built yet
+        builder = FAMILIES.get(_family(name))
+        if builder is None or name.startswith('_'):
+            raise AttributeError(name)
+        self._build(builder)
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{name} is read-only')
+
+    def __getitem__(self, name):
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def _build(self, builder):
+        """
+        Build the tables of a family
+        """
+        for table_name, table in builder().items():
+            self.__dict__.setdefault(table_name, MappingProxyType(table))
 
     def keys(self):
-        return self.keys()
+        """
+        Return the table names, building every family
+        """
+        for builder in FAMILIES.values():
+            self._build(builder)
+        return self.__dict__.keys()
+
+# Shared by the reader and the decoders
+RFX = rfx_data()
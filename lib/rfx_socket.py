@@ -27,6 +27,7 @@ with this program; if not, write to the Free Software Foundation, Inc.,
 
 # Standard library
 from logging import getLogger
+from os import pipe, write
 from queue import Queue
 from socketserver import TCPServer, StreamRequestHandler
 from threading import Thread
@@ -34,6 +35,8 @@ from threading import Thread
 LOGGER = getLogger('domotricks-rfxcmd')
 TCPServer.allow_reuse_address = True
 MESSAGEQUEUE = Queue()
+# One byte is written per queued message, so the listener can select() on it
+WAKEUP_READ, WAKEUP_WRITE = pipe()
 
 class NetRequestHandler(StreamRequestHandler):
 
@@ -41,6 +44,7 @@ class NetRequestHandler(StreamRequestHandler):
         LOGGER.debug('Client connected to [%s:%d]' % self.client_address)
         lg = self.rfile.readline()
         MESSAGEQUEUE.put(lg)
+        write(WAKEUP_WRITE, b'\0')
         LOGGER.debug('Message read from socket: %s', lg.strip())
 
         self.net_adapter_client_connected = False
@@ -35,18 +35,19 @@ def stripped(string):
     """
     return ''.join([i for i in string if ord(i) in range(32, 127)])
 
+# Hex representation of every byte value
+HEX_BYTES = tuple('{:02x}'.format(value) for value in range(256))
+
 def ByteToHex(byteStr):
     """
     Convert a byte string to it's hex string representation e.g. for output.
     http://code.activestate.com/recipes/510399-byte-to-hex-and-hex-to-byte-string-conversion/
 
-    Added str() to byteStr in case input data is in integer
+    A single byte, as an integer, is looked up in HEX_BYTES
     """
-    try:
-        return hexlify(byteStr).decode('utf-8')
-    except:
-        return '{0:#0{1}x}'.format(byteStr, 4).split('0x')[1]
-    return '00'
+    if isinstance(byteStr, int):
+        return HEX_BYTES[byteStr]
+    return hexlify(byteStr).decode('utf-8')
 
 def dec2bin(dec, width=8):
     """
@@ -21,37 +21,216 @@ with this program; if not, write to the Free Software Foundation, Inc.,
 """
 
 # Standard library
+from ast import literal_eval
+from datetime import datetime
+from json import dumps, loads
+from logging import getLogger
+from queue import Queue, Empty, Full
 import sqlite3
+from threading import Thread
+from time import monotonic, time_ns
+from urllib.parse import quote
 
 # Debug
 # from pdb import set_trace as st
 
+LOGGER = getLogger('domotricks-rfxcmd')
+
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+def now_ms():
+    """
+    Current time in epoch milliseconds, the readings timestamp
+    """
+    return time_ns() // 1000000
+
+def timestamp_to_ms(timestamp):
+    """
+    Convert a datetime or a "YYYY-MM-DD HH:MM[:SS[.ffffff]]" local time
+    string to epoch milliseconds
+    """
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp)
+    return int(timestamp.timestamp() * 1000)
+
+def ms_to_timestamp(timestamp_ms, timestamp_format=TIMESTAMP_FORMAT):
+    """
+    Convert epoch milliseconds to a local time string
+    """
+    return datetime.fromtimestamp(timestamp_ms / 1000).strftime(timestamp_format)
+
+# Numeric channels stored as typed columns of readings: metadata key -> column
+CHANNELS = {
+    'Temperature': 'temperature',
+    'Humidity': 'humidity',
+    'Barometric pressure': 'barometric',
+    'Instant power': 'power',
+    'Power': 'power',
+    'Rain': 'rain',
+    'Wind speed (average)': 'wind_speed',
+}
+CHANNEL_COLUMNS = ('temperature', 'humidity', 'barometric', 'power', 'rain', 'wind_speed')
+
+# Pragmas applied to every connection, updated from settings.DB_PRAGMAS by
+# the scripts. WAL lets the readers (web server, cron jobs) run while the
+# daemon writes, and a busy timeout makes writers wait instead of failing.
+DB_PRAGMAS = {
+    'journal_mode': 'wal',
+    'synchronous': 'normal',
+    'cache_size': -8192,
+    'mmap_size': 67108864,
+    'busy_timeout': 5000,
+}
+
+def apply_pragmas(conn, readonly=False):
+    """
+    Apply DB_PRAGMAS to a connection
+    journal_mode is persistent in the database file, and cannot be changed
+    from a read-only connection
+    """
+    for name, value in DB_PRAGMAS.items():
+        if value is None or (readonly and name == 'journal_mode'):
+            continue
+        conn.execute(f'PRAGMA {name} = {value}')
+
+def load_metadata(raw_metadata):
+    """
+    Parse stored metadata, JSON or the legacy str(list_of_dicts) format
+    """
+    try:
+        return loads(raw_metadata)
+    except ValueError:
+        pass
+    try:
+        return literal_eval(raw_metadata)
+    except (SyntaxError, ValueError):
+        return [{'key': 'raw', 'value': raw_metadata}]
+
+def dump_metadata(metadata):
+    """
+    Serialize metadata to JSON, decoded measurements are stored as plain dicts
+    """
+    return dumps(metadata, default=lambda measurement: measurement.as_dict())
+
+def metadata_channels(metadata):
+    """
+    Return the numeric channels of a metadata list, ordered as CHANNEL_COLUMNS
+    The first numeric value wins, missing channels are None
+    """
+    channels = dict()
+    for meta in metadata:
+        column = CHANNELS.get(meta.get('key'))
+        if column is None or column in channels:
+            continue
+        try:
+            channels[column] = float(meta['value'])
+        except (TypeError, ValueError):
+            continue
+    return tuple(channels.get(column) for column in CHANNEL_COLUMNS)
+
+# Lost asset insert, or update of its last seen timestamp and metadata
+LOST_UPSERT = '''
+INSERT INTO lost (
+    assetkey,
+    timestamp,
+    packettype,
+    packettypeid,
+    subtype,
+    seqnb,
+    metadata
+)
+VALUES
+    (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(assetkey) DO UPDATE SET
+    timestamp = excluded.timestamp,
+    metadata = excluded.metadata
+'''
+
 class SqliteCmd(object):
     """
     Sqlite3 DB commands
+    autocommit=False leaves the transaction open, the caller has to commit
+    readonly=True opens the database with mode=ro, for the web pages and
+    the cron jobs that only read
     """
-    def __init__(self, DBfile):
-        self.conn = sqlite3.connect(DBfile)
+    def __init__(self, DBfile, cached_statements=512, autocommit=True, readonly=False):
+        # Statements are compiled once per connection and reused as long as
+        # the SQL text is identical, keep the cache large enough to hold the
+        # per-asset statements of a long-lived session.
+        if readonly:
+            self.conn = sqlite3.connect(
+                f'file:{quote(DBfile)}?mode=ro', uri=True, cached_statements=cached_statements)
+        else:
+            self.conn = sqlite3.connect(DBfile, cached_statements=cached_statements)
+        apply_pragmas(self.conn, readonly=readonly)
         self.cur = self.conn.cursor()
+        self.autocommit = autocommit
 
     ## TABLE CREATION
 
-    def create_asset_table(self, asset_key):
+    def create_readings_table(self):
         """
-        Creating Asset table if not exist
+        Creating Readings table if not exist
+        One time-series table for all assets, clustered on (assetkey, ts)
+        ts is the epoch timestamp in milliseconds, metadata is JSON and the
+        numeric channels are duplicated in typed columns
         """
         self.cur.execute(
-        f'''
-        CREATE TABLE IF NOT EXISTS asset_{asset_key}
+        '''
+        CREATE TABLE IF NOT EXISTS readings
             (
-                timestamp    TEXT NOT NULL PRIMARY KEY,
+                assetkey     TEXT NOT NULL,
+                ts           INTEGER NOT NULL,
+                packettype   TEXT NOT NULL,
+                seqnb        TEXT NOT NULL,
+                metadata     TEXT NOT NULL,
+                temperature  REAL,
+                humidity     REAL,
+                barometric   REAL,
+                power        REAL,
+                rain         REAL,
+                wind_speed   REAL,
+                PRIMARY KEY (assetkey, ts)
+            ) WITHOUT ROWID
+        ''')
+
+    def create_aggregation_state_table(self):
+        """
+        Creating Aggregation State table if not exist
+        ts is the end (excluded) of the last aggregated bucket of an asset,
+        per resolution, in epoch milliseconds
+        """
+        self.cur.execute(
+        '''
+        CREATE TABLE IF NOT EXISTS aggregation_state
+            (
+                assetkey    TEXT NOT NULL,
+                resolution  TEXT NOT NULL,
+                ts          INTEGER NOT NULL,
+                PRIMARY KEY (assetkey, resolution)
+            ) WITHOUT ROWID
+        ''')
+        if self.autocommit:
+            self.conn.commit()
+
+    def create_asset_latest_table(self):
+        """
+        Creating Asset Latest table if not exist, the last reading of each asset
+        It is filled from readings when empty
+        """
+        self.cur.execute(
+        '''
+        CREATE TABLE IF NOT EXISTS asset_latest
+            (
+                assetkey     TEXT NOT NULL PRIMARY KEY,
+                ts           INTEGER NOT NULL,
                 packettype   TEXT NOT NULL,
-                packettypeid TEXT NOT NULL,
-                subtype      TEXT NOT NULL,
                 seqnb        TEXT NOT NULL,
                 metadata     TEXT NOT NULL
             )
         ''')
+        if self.cur.execute('SELECT count(*) FROM asset_latest').fetchone()[0] == 0:
+            self.refresh_asset_latest()
 
     def create_device_alerting_table(self):
         """
@@ -115,6 +294,33 @@ class SqliteCmd(object):
             )
         ''')
 
+    def create_registry_version_table(self):
+        """
+        Creating Registry Version table if not exist, with the triggers
+        counting every change of my_assets and device_alerting
+        my_assets and device_alerting have to be created first
+        """
+        self.cur.execute(
+        '''
+        CREATE TABLE IF NOT EXISTS registry_version
+            (
+                id       INTEGER NOT NULL PRIMARY KEY CHECK (id = 0),
+                version  INTEGER NOT NULL
+            )
+        ''')
+        self.cur.execute('INSERT OR IGNORE INTO registry_version VALUES (0, 0)')
+        for table in ('my_assets', 'device_alerting'):
+            for event in ('INSERT', 'UPDATE', 'DELETE'):
+                self.cur.execute(
+                f'''
+                CREATE TRIGGER IF NOT EXISTS {table}_{event.lower()}_version
+                AFTER {event} ON {table}
+                BEGIN
+                    UPDATE registry_version SET version = version + 1;
+                END
+                ''')
+        self.conn.commit()
+
     ## MY ASSETS
 
     def get_asset_key(self, nickname):
@@ -245,66 +451,207 @@ class SqliteCmd(object):
         fres = res.fetchone()[0]
         return fres == 1
 
+    ## REGISTRY
+
+    def get_data_version(self):
+        """
+        Return PRAGMA data_version, which changes when another connection commits
+        """
+        return self.cur.execute('PRAGMA data_version').fetchone()[0]
+
+    def get_registry_version(self):
+        """
+        Return the change counter of my_assets and device_alerting
+        """
+        try:
+            return self.cur.execute('SELECT version FROM registry_version').fetchone()[0]
+        except sqlite3.OperationalError:
+            return None
+
+    def get_registry(self):
+        """
+        Return {assetkey: (nickname, alerting functions)} of the registered assets
+        """
+        res = self.cur.execute(
+        '''
+        SELECT
+            my_assets.assetkey, my_assets.nickname, device_alerting.functions
+        FROM
+            my_assets
+        LEFT JOIN
+            device_alerting ON device_alerting.assetkey = my_assets.assetkey
+        ''')
+        return {
+            asset_key: (nickname, tuple(functions.split('|')) if functions else ())
+            for asset_key, nickname, functions in res.fetchall()}
+
     ## ASSET
 
+    def get_latest_all(self):
+        """
+        Get the last reading of all my assets
+        (assetkey, packettype, nickname, ts, packettype, seqnb, metadata)
+        """
+        res = self.cur.execute(
+        '''
+        SELECT
+            my_assets.assetkey,
+            my_assets.packettype,
+            my_assets.nickname,
+            asset_latest.ts,
+            asset_latest.packettype,
+            asset_latest.seqnb,
+            asset_latest.metadata
+        FROM
+            my_assets
+        JOIN
+            asset_latest ON asset_latest.assetkey = my_assets.assetkey
+        ORDER BY my_assets.rowid
+        ''')
+        return res.fetchall()
+
+    def refresh_asset_latest(self):
+        """
+        Rebuild asset_latest from readings
+        """
+        try:
+            self.cur.execute(
+            '''
+            INSERT
+            or REPLACE into asset_latest (
+                assetkey,
+                ts,
+                packettype,
+                seqnb,
+                metadata
+            )
+            SELECT
+                assetkey, MAX(ts), packettype, seqnb, metadata
+            FROM
+                readings
+            GROUP BY assetkey
+            ''')
+        except sqlite3.OperationalError:
+            return False
+        if self.autocommit:
+            self.conn.commit()
+        return True
+
     def get_asset(self, asset_key, last_only=False, timestamp_interval=[]):
         """
         Get asset
         last_only and timestamp_interval are not compatible
+        timestamp_interval is [ts_min, ts_max] in epoch milliseconds
         """
         try:
             if last_only:
                 res = self.cur.execute(
-                f'''
+                '''
                 SELECT
-                    timestamp, packettype, seqnb, metadata
+                    ts, packettype, seqnb, metadata
                 FROM
-                    asset_{asset_key}
-                ORDER BY timestamp DESC
+                    readings
+                WHERE
+                    assetkey = ?
+                ORDER BY ts DESC
                 LIMIT 1
-                ''')
+                ''', (asset_key,))
                 return res.fetchone()
             if timestamp_interval:
-                res = self.cur.execute(
-                f'''
-                SELECT
-                    timestamp, packettype, seqnb, metadata
-                FROM
-                    asset_{asset_key}
-                WHERE
-                    timestamp > ? AND timestamp < ?
-                ORDER BY timestamp DESC
-                ''', (timestamp_interval[0], timestamp_interval[1]))
-                return res.fetchall()
+                return self.get_asset_range(asset_key, *timestamp_interval)
             res = self.cur.execute(
-            f'''
+            '''
             SELECT
-                timestamp, packettype, seqnb, metadata
+                ts, packettype, seqnb, metadata
             FROM
-                asset_{asset_key}
-            ORDER BY timestamp DESC
-            ''')
+                readings
+            WHERE
+                assetkey = ?
+            ORDER BY ts DESC
+            ''', (asset_key,))
             return res.fetchall()
         except sqlite3.OperationalError:
             return None
 
-    def insert_asset(self, table_name, Timestamp, PacketType, PacketTypeId, Subtype, SeqNb, Metadata):
+    def get_asset_range(self, asset_key, ts_min, ts_max=None):
         """
-        Insert new entry in an existing asset
+        Get asset entries with ts_min <= ts < ts_max, most recent first
+        Timestamps are epoch milliseconds, no ts_max means up to now
         """
-        self.cur.execute(
+        if ts_max is None:
+            ts_max = now_ms() + 1
+        try:
+            res = self.cur.execute(
+            '''
+            SELECT
+                ts, packettype, seqnb, metadata
+            FROM
+                readings
+            WHERE
+                assetkey = ? AND ts >= ? AND ts < ?
+            ORDER BY ts DESC
+            ''', (asset_key, ts_min, ts_max))
+            return res.fetchall()
+        except sqlite3.OperationalError:
+            return None
+
+    def get_asset_channel(self, asset_key, channel, ts_min, ts_max=None):
+        """
+        Get (ts, value) of a numeric channel with ts_min <= ts < ts_max,
+        oldest first. channel is one of CHANNEL_COLUMNS
+        """
+        if channel not in CHANNEL_COLUMNS:
+            raise ValueError(f'Unknown channel {channel}')
+        if ts_max is None:
+            ts_max = now_ms() + 1
+        res = self.cur.execute(
         f'''
+        SELECT
+            ts, {channel}
+        FROM
+            readings
+        WHERE
+            assetkey = ? AND ts >= ? AND ts < ? AND {channel} IS NOT NULL
+        ORDER BY ts
+        ''', (asset_key, ts_min, ts_max))
+        return res.fetchall()
+
+    def insert_asset(self, asset_key, Timestamp, PacketType, SeqNb, Metadata, channels=None):
+        """
+        Insert new entry of an asset and update its asset_latest entry
+        Metadata is a list of measurements or dict, or its JSON serialization
+        channels are its metadata_channels, computed here if None
+        """
+        if isinstance(Metadata, str):
+            if channels is None:
+                channels = metadata_channels(loads(Metadata))
+        else:
+            if channels is None:
+                channels = metadata_channels(Metadata)
+            Metadata = dump_metadata(Metadata)
+        self.cur.execute(
+        '''
         INSERT
-        or IGNORE into {table_name} (
-            timestamp,
+        or IGNORE into readings (
+            assetkey,
+            ts,
             packettype,
-            packettypeid,
-            subtype,
             seqnb,
-            metadata
+            metadata,
+            temperature,
+            humidity,
+            barometric,
+            power,
+            rain,
+            wind_speed
         )
         VALUES
             (
+                ?,
+                ?,
+                ?,
+                ?,
+                ?,
                 ?,
                 ?,
                 ?,
@@ -312,25 +659,187 @@ class SqliteCmd(object):
                 ?,
                 ?
             )
-        ''', (Timestamp, PacketType, PacketTypeId, Subtype, SeqNb, Metadata))
-        self.conn.commit()
+        ''', (asset_key, Timestamp, PacketType, SeqNb, Metadata) + channels)
+        self.cur.execute(
+        '''
+        INSERT INTO asset_latest (
+            assetkey,
+            ts,
+            packettype,
+            seqnb,
+            metadata
+        )
+        VALUES
+            (
+                ?,
+                ?,
+                ?,
+                ?,
+                ?
+            )
+        ON CONFLICT(assetkey) DO UPDATE SET
+            ts = excluded.ts,
+            packettype = excluded.packettype,
+            seqnb = excluded.seqnb,
+            metadata = excluded.metadata
+        WHERE
+            excluded.ts >= asset_latest.ts
+        ''', (asset_key, Timestamp, PacketType, SeqNb, Metadata))
+        if self.autocommit:
+            self.conn.commit()
 
     def delete_asset_log(self, assetkey, timestamp_interval=[]):
         """
-        Delete a timestamped interval of log
+        Delete a timestamped interval of log, [ts_min, ts_max[ in epoch milliseconds
         """
         try:
             self.cur.execute(
-            f'''
+            '''
             DELETE FROM
-                asset_{assetkey}
+                readings
             WHERE
-                timestamp > ? AND timestamp < ?
-            ''', (timestamp_interval[0], timestamp_interval[1]))
+                assetkey = ? AND ts >= ? AND ts < ?
+            ''', (assetkey, timestamp_interval[0], timestamp_interval[1]))
             return True
         except sqlite3.OperationalError:
             return False
 
+    def get_hourly_rollup(self, asset_key, ts_min, ts_max):
+        """
+        Get the hours of an asset, ts_min <= ts < ts_max, holding more than one
+        entry with a temperature or a humidity, in one grouped query, oldest first
+        Hours are aligned on ts_min, not on UTC hours, so that no bucket
+        crosses the window bounds
+        Rows are (hour ts, packettype, seqnb, metadata, oldest ts, entries,
+        temperature average, humidity average), packettype, seqnb and metadata
+        being those of the oldest entry of the hour
+        """
+        res = self.cur.execute(
+        '''
+        SELECT
+            (ts - ?) / 3600000 * 3600000 + ? AS hour,
+            packettype,
+            seqnb,
+            metadata,
+            min(ts),
+            count(*),
+            avg(temperature),
+            avg(humidity)
+        FROM
+            readings
+        WHERE
+            assetkey = ? AND ts >= ? AND ts < ?
+        GROUP BY
+            hour
+        HAVING
+            count(*) > 1 AND count(temperature) + count(humidity) > 0
+        ORDER BY
+            hour
+        ''', (ts_min, ts_min, asset_key, ts_min, ts_max))
+        return res.fetchall()
+
+    def get_aggregation_watermark(self, asset_key, resolution):
+        """
+        Get the end of the last aggregated bucket of an asset, None if never aggregated
+        """
+        res = self.cur.execute(
+        '''
+        SELECT
+            ts
+        FROM
+            aggregation_state
+        WHERE
+            assetkey = ? AND resolution = ?
+        ''', (asset_key, resolution)).fetchone()
+        if res is None:
+            return None
+        return res[0]
+
+    def set_aggregation_watermark(self, asset_key, resolution, timestamp):
+        """
+        Record the end of the last aggregated bucket of an asset
+        """
+        self.cur.execute(
+        '''
+        INSERT INTO aggregation_state (
+            assetkey,
+            resolution,
+            ts
+        )
+        VALUES
+            (?, ?, ?)
+        ON CONFLICT(assetkey, resolution) DO UPDATE SET
+            ts = excluded.ts
+        ''', (asset_key, resolution, timestamp))
+        if self.autocommit:
+            self.conn.commit()
+
+    ## MIGRATION
+
+    def get_legacy_asset_keys(self):
+        """
+        Get asset keys still stored in a per-asset "asset_<key>" table
+        """
+        res = self.cur.execute(
+        r'''
+        SELECT
+            name
+        FROM
+            sqlite_master
+        WHERE
+            type = 'table' AND name LIKE 'asset\_%' ESCAPE '\' AND name != 'asset_latest'
+        ''')
+        return [name[len('asset_'):] for (name,) in res.fetchall()]
+
+    def migrate_asset_table(self, asset_key, batch_size=1000):
+        """
+        Copy a per-asset "asset_<key>" table into readings, batch_size rows
+        per transaction. Return the number of copied rows
+        Text timestamps are converted to epoch milliseconds and metadata to JSON
+        """
+        autocommit = self.autocommit
+        self.autocommit = False
+        copied = 0
+        last_rowid = 0
+        try:
+            while True:
+                rows = self.cur.execute(
+                f'''
+                SELECT
+                    rowid, timestamp, packettype, seqnb, metadata
+                FROM
+                    asset_{asset_key}
+                WHERE
+                    rowid > ?
+                ORDER BY rowid
+                LIMIT ?
+                ''', (last_rowid, batch_size)).fetchall()
+                if not rows:
+                    return copied
+                for _, timestamp, packettype, seqnb, metadata in rows:
+                    self.insert_asset(
+                        asset_key,
+                        timestamp_to_ms(timestamp),
+                        packettype,
+                        seqnb,
+                        load_metadata(metadata))
+                self.conn.commit()
+                copied += len(rows)
+                last_rowid = rows[-1][0]
+        except Exception:
+            # The batches already committed are kept
+            self.conn.rollback()
+            raise
+        finally:
+            self.autocommit = autocommit
+
+    def drop_asset_table(self, asset_key):
+        """
+        Drop a per-asset "asset_<key>" table
+        """
+        self.cur.execute(f'DROP TABLE IF EXISTS asset_{asset_key}')
+        self.conn.commit()
+
     ## LOST ASSETS
 
     def get_lost_assets(self):
@@ -347,51 +856,19 @@ class SqliteCmd(object):
         ''')
         return res.fetchall()
 
-    def insert_lost_asset(self, asset_key, Timestamp, PacketType, PacketTypeId, Subtype, SeqNb, Metadata):
+    def insert_lost_assets(self, rows):
         """
-        Insert new entry infos
+        Insert or update many lost assets at once
+        rows are (assetkey, timestamp in ms, packettype, packettypeid, subtype, seqnb,
+        metadata)
         """
-        is_exists = self.cur.execute(
-        '''
-        SELECT count(*)
-        FROM lost
-        WHERE assetkey = ?
-        ''', (asset_key,)).fetchone()
-        if is_exists[0] == 1:
-            self.cur.execute(
-            '''
-            UPDATE lost
-            SET
-                timestamp = ?,
-                metadata = ?
-            WHERE
-                assetkey = ?
-            ''', (Timestamp, Metadata, asset_key))
-        else:
-            self.cur.execute(
-            '''
-            INSERT
-            or IGNORE into lost (
-                assetkey,
-                timestamp,
-                packettype,
-                packettypeid,
-                subtype,
-                seqnb,
-                metadata
-            )
-            VALUES
-                (
-                    ?,
-                    ?,
-                    ?,
-                    ?,
-                    ?,
-                    ?,
-                    ?
-                )
-            ''', (asset_key, Timestamp, PacketType, PacketTypeId, Subtype, SeqNb, Metadata))
-        self.conn.commit()
+        self.cur.executemany(LOST_UPSERT, [
+            (asset_key, ms_to_timestamp(timestamp_ms), packettype, packettype_id, subtype,
+             seqnb, metadata if isinstance(metadata, str) else dump_metadata(metadata))
+            for asset_key, timestamp_ms, packettype, packettype_id, subtype, seqnb, metadata
+            in rows])
+        if self.autocommit:
+            self.conn.commit()
 
     def delete_lost_asset(self, timestamp=None, asset_key=None):
         """
@@ -497,3 +974,170 @@ class SqliteCmd(object):
 
     def SQLiteClose(self):
         self.__del__()
+
+
+class AssetRegistry:
+    """
+    In-memory copy of the registered assets, with their nickname and
+    alerting functions.
+    PRAGMA data_version is polled on each lookup: only when another
+    connection has committed is the registry_version counter read, and the
+    registry reloaded only if that counter changed.
+    """
+    def __init__(self, db):
+        self.db = db
+        self.assets = dict()
+        self.data_version = None
+        self.version = None
+        self.reloads = 0
+
+    def refresh(self):
+        """
+        Reload the registry if my_assets or device_alerting changed
+        """
+        data_version = self.db.get_data_version()
+        if data_version == self.data_version:
+            return
+        self.data_version = data_version
+        version = self.db.get_registry_version()
+        if version is not None and version == self.version:
+            return
+        self.version = version
+        self.assets = self.db.get_registry()
+        self.reloads += 1
+        LOGGER.debug('Asset registry reloaded, %d assets', len(self.assets))
+
+    def get(self, asset_key):
+        """
+        Return (nickname, alerting functions) of a registered asset, None otherwise
+        """
+        self.refresh()
+        return self.assets.get(asset_key)
+
+
+class LostAssets:
+    """
+    Last reading of each unregistered asset, kept in memory and handed over
+    to the writer thread every flush_interval milliseconds, as one
+    insert_lost_assets call
+    """
+    def __init__(self, writer, flush_interval=5000):
+        self.writer = writer
+        self.flush_interval = flush_interval / 1000
+        self.pending = dict()
+        self.flushed_at = monotonic()
+
+    def put(self, asset_key, timestamp_ms, packettype, packettype_id, subtype, seqnb, metadata):
+        """
+        Keep the last reading of an asset
+        """
+        self.pending[asset_key] = (
+            asset_key, timestamp_ms, packettype, packettype_id, subtype, seqnb, metadata)
+
+    def flush_if_due(self):
+        """
+        Flush the pending assets if flush_interval is elapsed
+        Return False if they are dropped
+        """
+        now = monotonic()
+        if now - self.flushed_at < self.flush_interval:
+            return True
+        self.flushed_at = now
+        return self.flush()
+
+    def flush(self):
+        """
+        Queue the pending assets to the writer
+        Return False if the writer queue is full and they are dropped
+        """
+        if not self.pending:
+            return True
+        rows = list(self.pending.values())
+        self.pending.clear()
+        return self.writer.put('insert_lost_assets', rows)
+
+
+class SqliteWriter(Thread):
+    """
+    Background writer thread fed by a bounded queue
+    Queued SqliteCmd calls are grouped in one transaction, committed every
+    batch_size calls or batch_interval milliseconds, whichever comes first
+    """
+    _STOP = object()
+
+    def __init__(self, DBfile, batch_size=100, batch_interval=500, queue_size=10000):
+        Thread.__init__(self, name='SqliteWriter', daemon=True)
+        self.DBfile = DBfile
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval / 1000
+        self.queue = Queue(maxsize=queue_size)
+        self.committed = 0
+        self.dropped = 0
+
+    def put(self, method, *args):
+        """
+        Queue a SqliteCmd call, never blocks
+        Return False if the queue is full and the call is dropped
+        """
+        try:
+            self.queue.put_nowait((method, args))
+        except Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def run(self):
+        conn = SqliteCmd(self.DBfile, autocommit=False)
+        pending = 0
+        deadline = None
+        while True:
+            timeout = None
+            if deadline is not None:
+                timeout = max(0, deadline - monotonic())
+            try:
+                item = self.queue.get(timeout=timeout)
+            except Empty:
+                item = None
+            if item is self._STOP:
+                break
+            if item is not None:
+                method, args = item
+                # A failed call is logged and skipped, the thread has to keep
+                # draining the queue
+                try:
+                    getattr(conn, method)(*args)
+                except Exception as err:
+                    LOGGER.error('SqliteWriter %s failed: %r', method, err)
+                pending += 1
+                if deadline is None:
+                    deadline = monotonic() + self.batch_interval
+            if pending >= self.batch_size or (deadline is not None and monotonic() >= deadline):
+                self._commit(conn, pending)
+                pending = 0
+                deadline = None
+        self._commit(conn, pending)
+        conn.SQLiteClose()
+
+    def _commit(self, conn, pending):
+        if not pending:
+            return
+        try:
+            conn.conn.commit()
+            self.committed += pending
+        except Exception as err:
+            LOGGER.error('SqliteWriter commit failed: %r', err)
+
+    def stop(self, timeout=None):
+        """
+        Flush pending calls and stop the thread
+        Never blocks more than timeout seconds, if set
+        """
+        if not self.is_alive():
+            LOGGER.error('SqliteWriter is not running, %d calls lost', self.queue.qsize())
+            return
+        try:
+            self.queue.put(self._STOP, timeout=timeout)
+        except Full:
+            LOGGER.error('SqliteWriter queue is full, cannot stop it')
+            return
+        self.join(timeout)
@@ -28,61 +28,115 @@ __maintainer__ = 'Nicolas Béguier'
 __date__ = '$Date: 2021-12-20 15:00:00 +0100 (Tue, 1 Jun 2021) $'
 
 # Standard library
-import json
+from argparse import ArgumentParser
 from datetime import datetime, timedelta
+from multiprocessing import Pool
+import sqlite3
+from time import perf_counter
 
 # DomoTricks libraries
-from lib.sqlite import SqliteCmd
+from lib.sqlite import DB_PRAGMAS, SqliteCmd, load_metadata, timestamp_to_ms
 import settings
 
 # Debug
 # from pdb import set_trace as st
 
-def aggregate_log_per_hour():
+DB_PRAGMAS.update(getattr(settings, 'DB_PRAGMAS', dict()))
+
+# Connection of the aggregation worker process
+WORKER_CONN = None
+
+def init_worker():
+    """
+    Open the connection of an aggregation worker
+    """
+    global WORKER_CONN
+    WORKER_CONN = SqliteCmd(settings.DB_PATH, autocommit=False)
+
+def aggregate_asset(assetkey, window_start, ts_max, rebuild=False):
+    """
+    Aggregate per hour the readings of an asset after its watermark
+    The hours are computed before writing, so that the write transaction is short
+    Return (assetkey, seconds, hours aggregated, rows compacted), hours is None
+    if the asset is up to date
+    """
+    start = perf_counter()
+    conn = WORKER_CONN
+    ts_min = window_start
+    watermark = conn.get_aggregation_watermark(assetkey, 'hour')
+    if not rebuild and watermark is not None:
+        ts_min = max(ts_min, watermark)
+    if ts_min >= ts_max:
+        return assetkey, perf_counter() - start, None, 0
+    hours = 0
+    compacted = 0
+    # Where the next run starts, moved back to the first hour that failed
+    watermark = ts_max
+    try:
+        for hour, packettype, seqnb, raw_metadata, _, entries, temperature, humidity in \
+            conn.get_hourly_rollup(assetkey, ts_min, ts_max):
+            # The oldest entry of the hour is the metadata template
+            metadata = load_metadata(raw_metadata)
+            for meta in metadata:
+                if meta['key'] == 'Temperature' and temperature is not None:
+                    meta['value'] = round(temperature, 1)
+                elif meta['key'] == 'Humidity' and humidity is not None:
+                    meta['value'] = round(humidity, 1)
+            # Never delete readings after ts_max, which are not rolled up
+            interval = [hour, min(hour + 3600000, ts_max)]
+            if not conn.delete_asset_log(assetkey, timestamp_interval=interval):
+                print(f'Error deleting asset {assetkey} logs...')
+                watermark = hour
+                break
+            conn.insert_asset(assetkey, hour + 1000, packettype, seqnb, metadata)
+            hours += 1
+            compacted += entries - 1
+        conn.set_aggregation_watermark(assetkey, 'hour', watermark)
+        conn.conn.commit()
+    except sqlite3.Error as err:
+        # Nothing is written, the watermark stays where it was
+        conn.conn.rollback()
+        print(f'Error aggregating asset {assetkey}: {err}')
+        hours = compacted = 0
+    return assetkey, perf_counter() - start, hours, compacted
+
+def aggregate_log_per_hour(days=90, rebuild=False, jobs=1):
     """
     After one day, logs are aggregated per hour
+    Each asset is rolled up with one grouped query, and rewritten in one transaction
+    Only the days after the asset watermark are aggregated, unless rebuild is set
+    Assets are spread over jobs worker processes, each with its own connection
     """
     print('> aggregate_log_per_hour')
     conn = SqliteCmd(settings.DB_PATH)
-    assets = conn.get_my_assets()
-    now = datetime.now()
-    for asset in assets:
-        assetkey = asset[0]
-        print(f'Asset: {assetkey}')
-        # Aggregate 90 last days
-        for d in range(90):
-            for h in range(24):
-                aggregated_date = (now - timedelta(days=d+1)).strftime('%Y-%m-%d')
-                interval = [aggregated_date+f' {h:02}:00', aggregated_date+f' {h+1:02}:00']
-                datas = conn.get_asset(assetkey, timestamp_interval=interval)
-                # Skip empty or already aggregated datas
-                if len(datas) <= 1:
-                    continue
-                temp_sum = 0
-                temp_count = 0
-                humidity_sum = 0
-                humidity_count = 0
-                for entry in datas:
-                    meta = json.loads(entry[-1].replace("'", '"'))
-                    for m in meta:
-                        if m['key'] == 'Temperature':
-                            temp_sum += float(m['value'])
-                            temp_count += 1
-                        elif m['key'] == 'Humidity':
-                            humidity_sum += float(m['value'])
-                            humidity_count += 1
-                if temp_count > 0 or humidity_count > 0:
-                    duplicate_meta = meta.copy()
-                    for i, m in enumerate(meta):
-                        if m['key'] == 'Temperature' and temp_count > 0:
-                            duplicate_meta[i]['value'] = temp_sum / temp_count
-                        elif m['key'] == 'Humidity' and humidity_count > 0:
-                            duplicate_meta[i]['value'] = humidity_sum / humidity_count
-                    if not conn.delete_asset_log(assetkey, timestamp_interval=interval):
-                        print(f'Error deleting asset {assetkey} logs...')
-                        continue
-                    print(f'Aggregating {assetkey} at {aggregated_date} {h:02}:00')
-                    conn.insert_asset(f'asset_{assetkey}', aggregated_date+f' {h:02}:00:01', datas[-1][1], datas[-1][2], '', '', str(duplicate_meta))
+    conn.create_aggregation_state_table()
+    assets = [asset[0] for asset in conn.get_my_assets()]
+    conn.SQLiteClose()
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    window_start = timestamp_to_ms(today - timedelta(days=days))
+    ts_max = timestamp_to_ms(today)
+    tasks = [(assetkey, window_start, ts_max, rebuild) for assetkey in assets]
+
+    start = perf_counter()
+    if jobs > 1:
+        with Pool(jobs, initializer=init_worker) as pool:
+            results = pool.starmap(aggregate_asset, tasks, chunksize=1)
+    else:
+        init_worker()
+        results = [aggregate_asset(*task) for task in tasks]
+
+    total_hours = 0
+    total_compacted = 0
+    for assetkey, seconds, hours, compacted in results:
+        if hours is None:
+            print(f'Asset: {assetkey}, up to date')
+            continue
+        print(f'Asset: {assetkey}, {hours} hours, {compacted} rows compacted ' \
+            f'in {seconds * 1000:.1f} ms')
+        total_hours += hours
+        total_compacted += compacted
+    print(f'Total: {total_hours} hours, {total_compacted} rows compacted ' \
+        f'in {perf_counter() - start:.1f} s with {jobs} job(s)')
 
 def remove_old_lost_assets():
     """
@@ -96,5 +150,12 @@ def remove_old_lost_assets():
     conn.delete_lost_asset(timestamp=timestamp)
 
 if __name__ == '__main__':
-    aggregate_log_per_hour()
+    PARSER = ArgumentParser()
+    PARSER.add_argument('--rebuild', action='store_true', dest='rebuild', default=False, \
+        help='Aggregate the whole window again, ignoring the watermarks')
+    PARSER.add_argument('-j', '--jobs', action='store', dest='jobs', type=int, default=1, \
+        help='Number of worker processes aggregating the assets')
+    ARGS = PARSER.parse_args()
+
+    aggregate_log_per_hour(rebuild=ARGS.rebuild, jobs=ARGS.jobs)
     remove_old_lost_assets()
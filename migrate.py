@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+#-*- coding: utf-8 -*-
+"""
+DomoTricks: database migration
+
+Copyright 2021-2023 Nicolas Béguier
+
+This program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along
+with this program; if not, write to the Free Software Foundation, Inc.,
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+__author__ = 'Nicolas Béguier'
+__copyright__ = 'Copyright 2021-2023, Nicolas Béguier'
+__license__ = 'GPL'
+__version__ = '1.0.3'
+__maintainer__ = 'Nicolas Béguier'
+__date__ = '$Date: 2021-12-20 15:00:00 +0100 (Tue, 1 Jun 2021) $'
+
+# Standard library
+from argparse import ArgumentParser
+
+# DomoTricks libraries
+from lib.sqlite import DB_PRAGMAS, SqliteCmd
+import settings
+
+# Debug
+# from pdb import set_trace as st
+
+DB_PRAGMAS.update(getattr(settings, 'DB_PRAGMAS', dict()))
+
+def migrate_asset_tables(batch_size, drop=False):
+    """
+    Copy every per-asset "asset_<key>" table into the readings table
+    """
+    print('> migrate_asset_tables')
+    conn = SqliteCmd(settings.DB_PATH)
+    conn.create_readings_table()
+    conn.create_asset_latest_table()
+    for assetkey in conn.get_legacy_asset_keys():
+        copied = conn.migrate_asset_table(assetkey, batch_size=batch_size)
+        print(f'Asset: {assetkey}, {copied} rows copied')
+        if drop:
+            print(f'Drop table asset_{assetkey}')
+            conn.drop_asset_table(assetkey)
+
+if __name__ == '__main__':
+    PARSER = ArgumentParser()
+    PARSER.add_argument('-b', '--batch-size', action='store', dest='batch_size', type=int, \
+        default=1000, help='Number of rows copied per transaction')
+    PARSER.add_argument('--drop', action='store_true', dest='drop', default=False, \
+        help='Drop the per-asset tables once copied')
+    ARGS = PARSER.parse_args()
+
+    migrate_asset_tables(ARGS.batch_size, drop=ARGS.drop)
@@ -38,12 +38,14 @@ from requests import Session
 
 # DomoTricks libraries
 import alerting
-from lib.sqlite import SqliteCmd
+from lib.sqlite import DB_PRAGMAS, SqliteCmd, load_metadata, now_ms, ms_to_timestamp, timestamp_to_ms
 import settings
 
 # Debug
 # from pdb import set_trace as st
 
+DB_PRAGMAS.update(getattr(settings, 'DB_PRAGMAS', dict()))
+
 BLACKLIST = [
     'Battery',
     'Dim level',
@@ -58,6 +60,18 @@ BLACKLIST = [
 APP = Flask(__name__, template_folder='web/templates', static_folder='web/static')
 SESSION = Session()
 
+def to_number(value):
+    """
+    Return the value as an int or a float, as decoded by rfxcmd,
+    or unchanged if it is not a number
+    """
+    for cast in (int, float):
+        try:
+            return cast(value)
+        except ValueError:
+            pass
+    return value
+
 def get_weather():
     """
     Get weather via OpenWeatherMap API
@@ -82,17 +96,14 @@ def get_weather():
 @APP.route('/')
 def index():
     """ Display home page """
-    conn = SqliteCmd(settings.DB_PATH)
+    conn = SqliteCmd(settings.DB_PATH, readonly=True)
     result = list()
-    assets = conn.get_my_assets()
-    for asset in assets:
+    for asset in conn.get_latest_all():
         asset_key = asset[0]
         asset_type = asset[1]
         nickname = asset[2]
-        asset_data = conn.get_asset(asset_key, last_only=True)
-        if asset_data is None:
-            continue
-        raw_metadata = json.loads(asset_data[3].replace("'", '"'))
+        asset_data = asset[3:]
+        raw_metadata = load_metadata(asset_data[3])
         metadata = list()
         for meta in raw_metadata:
             if meta['key'] not in BLACKLIST:
@@ -101,7 +112,7 @@ def index():
             'key': asset_key,
             'nickname': nickname,
             'type': asset_type,
-            'timestamp': asset_data[0],
+            'timestamp': ms_to_timestamp(asset_data[0]),
             'metadata': metadata
             })
     return render_template('homepage.html', assets=result, weather=get_weather())
@@ -109,20 +120,17 @@ def index():
 @APP.route('/lost/')
 def lost_assets():
     """ Display lost assets """
-    conn = SqliteCmd(settings.DB_PATH)
+    conn = SqliteCmd(settings.DB_PATH, readonly=True)
     assets = conn.get_lost_assets()
     for i, _ in enumerate(assets):
         assets[i] = [x for x in assets[i]]
-        try:
-            assets[i][-1] = json.loads(assets[i][-1].replace("'", '"'))
-        except:
-            assets[i][-1] = [{'key': 'raw', 'value': assets[i][-1]}]
+        assets[i][-1] = load_metadata(assets[i][-1])
     return render_template('lost_assets.html', lost_assets=assets)
 
 @APP.route('/my_assets/')
 def my_assets():
     """ Display 'my assets' """
-    conn = SqliteCmd(settings.DB_PATH)
+    conn = SqliteCmd(settings.DB_PATH, readonly=True)
     assets = conn.get_my_assets()
     return render_template('my_assets.html', my_assets=assets)
 
@@ -165,7 +173,7 @@ def asset():
     Display one asset
     @params: assetkey, period
     """
-    conn = SqliteCmd(settings.DB_PATH)
+    conn = SqliteCmd(settings.DB_PATH, readonly=True)
     asset_key = request.args.get('assetkey')
     if not re.match('[a-f0-9_]+', asset_key):
         return render_template('404.html'), 404
@@ -173,10 +181,8 @@ def asset():
     asset_data = conn.get_asset(asset_key)
     for i, _ in enumerate(asset_data):
         asset_data[i] = [x for x in asset_data[i]]
-        try:
-            asset_data[i][-1] = json.loads(asset_data[i][-1].replace("'", '"'))
-        except:
-            asset_data[i][-1] = [{'key': 'raw', 'value': asset_data[i][-1]}]
+        asset_data[i][0] = ms_to_timestamp(asset_data[i][0])
+        asset_data[i][-1] = load_metadata(asset_data[i][-1])
         raw_metadata = asset_data[i][-1].copy()
         for meta in raw_metadata:
             if meta['key'] in BLACKLIST:
@@ -206,21 +212,20 @@ def asset_entry():
     if last_entry is None:
         return render_template('404.html'), 404
     try:
-        table_name = f'asset_{asset_key}'
-        timestamp = datetime.now()
+        timestamp = now_ms()
         packettype = last_entry[1]
-        packettypeid = asset_key.split('_')[0]
-        subtype = asset_key.split('_')[1]
         seqnb = last_entry[2]
-        metadata_dict = json.loads(last_entry[3].replace("'", '"'))
+        metadata_dict = load_metadata(last_entry[3])
     except:
         return render_template('404.html'), 404
+    value = to_number(value)
     for meta in metadata_dict:
         if meta['key'] == key:
+            if isinstance(meta['value'], (int, float)) and isinstance(value, str):
+                return render_template('404.html'), 404
             meta['value'] = value
-    metadata = json.dumps(metadata_dict)
     # Insert the entry in the database
-    conn.insert_asset(table_name, timestamp, packettype, packettypeid, subtype, seqnb, metadata)
+    conn.insert_asset(asset_key, timestamp, packettype, seqnb, metadata_dict)
     # Trigger alerts
     functions = conn.get_device_alerting(asset_key)
     if functions is not None:
@@ -235,41 +240,32 @@ def asset_entry():
 def asset_csv():
     """ return a CSV """
     result = 'date,value'
-    conn = SqliteCmd(settings.DB_PATH)
+    conn = SqliteCmd(settings.DB_PATH, readonly=True)
     asset_key = request.args.get('assetkey')
     if not re.match('[a-f0-9_]+', asset_key):
         return render_template('404.html'), 404
     period = request.args.get('period')
     now = datetime.now()
     if period == 'hour':
-        timestamp_min = (now - timedelta(hours=1)).strftime('%Y-%m-%d %H:%M')
+        timestamp_min = timestamp_to_ms(now - timedelta(hours=1))
     elif period == 'day':
-        timestamp_min = (now - timedelta(days=1)).strftime('%Y-%m-%d %H:%M')
+        timestamp_min = timestamp_to_ms(now - timedelta(days=1))
     elif period == 'week':
-        timestamp_min = (now - timedelta(weeks=1)).strftime('%Y-%m-%d %H:%M')
+        timestamp_min = timestamp_to_ms(now - timedelta(weeks=1))
     elif period == 'month':
-        timestamp_min = (now - timedelta(days=30)).strftime('%Y-%m-%d %H:%M')
+        timestamp_min = timestamp_to_ms(now - timedelta(days=30))
     elif period == 'year':
-        timestamp_min = (now - timedelta(days=365)).strftime('%Y-%m-%d %H:%M')
+        timestamp_min = timestamp_to_ms(now - timedelta(days=365))
     else:
         return render_template('404.html'), 404
-    interval = [timestamp_min, now]
-    asset_data = conn.get_asset(asset_key, timestamp_interval=interval)
-    for i, _ in enumerate(asset_data):
-        asset_data[i] = [x for x in asset_data[i]]
-        try:
-            asset_data[i][-1] = json.loads(asset_data[i][-1].replace("'", '"'))
-        except:
-            asset_data[i][-1] = [{'key': 'raw', 'value': asset_data[i][-1]}]
-        for meta in asset_data[i][-1]:
-            if meta['key'] == 'Temperature':
-                result += f'\n{asset_data[i][0]},{meta["value"]}'
+    for timestamp, value in conn.get_asset_channel(asset_key, 'temperature', timestamp_min):
+        result += f'\n{ms_to_timestamp(timestamp)},{value}'
     return result
 
 @APP.route('/config/')
 def configuration():
     """ Display configuration """
-    conn = SqliteCmd(settings.DB_PATH)
+    conn = SqliteCmd(settings.DB_PATH, readonly=True)
     # result = {'device_alerting': [], ''}
     device_alerting = conn.get_device_alerting()
     for i, k in enumerate(device_alerting):
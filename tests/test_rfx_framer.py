@@ -0,0 +1,112 @@
+#!/usr/bin/python3
+#-*- coding: utf-8 -*-
+"""
+DomoTricks: RfxFramer tests
+
+Copyright 2021-2023 Nicolas Béguier
+
+This program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along
+with this program; if not, write to the Free Software Foundation, Inc.,
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+# Standard library
+import os
+import unittest
+
+# DomoTricks libraries
+from lib.rfx_decode import lookup
+from lib.rfx_framer import RfxFramer
+
+# Debug
+# from pdb import set_trace as st
+
+# Recorded stream with injected corruption, in order:
+# 0x52 frame, garbage 00ff13, 0x11 frame, 0x50 frame with a wrong length
+# byte (0c instead of 08), 0x50 frame, garbage deadbeef00, 0x5c frame,
+# 0x5a frame, truncated 0x52 frame 0a5201
+STREAM = os.path.join(os.path.dirname(__file__), 'data', 'rfx_stream.bin')
+
+FRAMES = [
+    '0a520105d50300d72a0269',
+    '0b11000201c5a9da0a010f60',
+    '08500101aabb806469',
+    '0f5c01001234e6006400c8000a5a3269',
+    '115a0101aabb02000003e800000000123469',
+]
+
+class TestRfxFramer(unittest.TestCase):
+    """
+    Feed the recorded stream through RfxFramer
+    """
+    def setUp(self):
+        with open(STREAM, 'rb') as stream:
+            self.data = stream.read()
+
+    def read_stream(self, framer, chunk_size):
+        """
+        Feed the stream chunk by chunk, return the frames in hex
+        """
+        frames = list()
+        for index in range(0, len(self.data), chunk_size):
+            framer.feed(self.data[index:index + chunk_size])
+            frames += [bytes(frame).hex() for frame in framer.frames_available()]
+        return frames
+
+    def test_resync(self):
+        """
+        Valid frames are kept and every garbage run is discarded, whatever
+        the read size
+        """
+        for chunk_size in (1, 2, 5, 7, len(self.data)):
+            with self.subTest(chunk_size=chunk_size):
+                framer = RfxFramer(lookup)
+                with self.assertLogs('domotricks-rfxcmd', 'WARNING'):
+                    self.assertEqual(self.read_stream(framer, chunk_size), FRAMES)
+                self.assertEqual(framer.stats(), {
+                    'frames': 5,
+                    'resyncs': 3,
+                    # 00ff13, then 0c500101aabb806469, then deadbeef00
+                    'discarded_bytes': 17,
+                })
+                # The truncated frame waits for its end
+                self.assertEqual(bytes(framer.view[framer.start:framer.end]).hex(), '0a5201')
+
+    def test_memoryview(self):
+        """
+        Frames are memoryview slices of the framer buffer
+        """
+        framer = RfxFramer(lookup)
+        framer.feed(self.data)
+        with self.assertLogs('domotricks-rfxcmd', 'WARNING'):
+            for frame in framer.frames_available():
+                self.assertIsInstance(frame, memoryview)
+                self.assertIs(frame.obj, framer.buffer)
+
+    def test_compaction(self):
+        """
+        Frames stay contiguous when the buffer is compacted
+        """
+        framer = RfxFramer(lookup, size=0)
+        packet = bytes.fromhex(FRAMES[0])
+        frames = list()
+        for _ in range(100):
+            framer.feed(packet[:4])
+            frames += [bytes(frame) for frame in framer.frames_available()]
+            framer.feed(packet[4:])
+            frames += [bytes(frame) for frame in framer.frames_available()]
+        self.assertEqual(frames, [packet] * 100)
+        self.assertEqual(framer.stats()['discarded_bytes'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,22 +21,23 @@ with this program; if not, write to the Free Software Foundation, Inc.,
 
 # Standard library
 from datetime import datetime
-import json
 
 # DomoTricks libraries
 import alerting
-from lib.sqlite import SqliteCmd
+from lib.sqlite import DB_PRAGMAS, SqliteCmd, load_metadata
 import settings
 
 # Debug
 # from pdb import set_trace as st
 
+DB_PRAGMAS.update(getattr(settings, 'DB_PRAGMAS', dict()))
+
 def main():
     """
     Main function
     """
     # TODO
-    conn = SqliteCmd(settings.DB_PATH)
+    conn = SqliteCmd(settings.DB_PATH, readonly=True)
     assets = conn.get_time_alerting()
     hour_now = datetime.now().hour
     minute_now = datetime.now().minute
@@ -59,11 +60,11 @@ def main():
             nickname = conn.get_asset_nickname(assetkey)
             print( f'Trigger alerting function "{function_name}" for {nickname}')
             asset_data = conn.get_asset(assetkey)
-            if asset_data is None:
+            if not asset_data:
                 print(f'Asset "{nickname}" ({assetkey}) is empty...')
                 continue
             # Apply function on the most recent element (0) metadata (3)
-            metadata = json.loads(asset_data[0][3].replace("'", '"'))
+            metadata = load_metadata(asset_data[0][3])
             getattr(alerting, function_name)(nickname, metadata)
 
 if __name__ == '__main__':